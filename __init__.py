@@ -5,13 +5,18 @@ Contém o engine e gerenciadores de eventos
 """
 
 from .game_engine import GameEngine
-from .events import EventManager, GameEventDispatcher, game_events
+from .events import (
+    EventManager, GameEventDispatcher, game_events, FoodEaten, SnakeCollision, GameRestart
+)
 
 __all__ = [
     'GameEngine',
     'EventManager', 
     'GameEventDispatcher',
-    'game_events'
+    'game_events',
+    'FoodEaten',
+    'SnakeCollision',
+    'GameRestart'
 ]
 
 # entities/__init__.py
@@ -57,13 +62,14 @@ Módulo utils - Utilitários compartilhados
 Contém enums, types e funções auxiliares
 """
 
-from .enums import Direction, GameState, EntityType
+from .enums import Direction, GameState, EntityType, InputAction
 from .types import Position, Color, Size, SnakeBody
 
 __all__ = [
     'Direction',
     'GameState', 
     'EntityType',
+    'InputAction',
     'Position',
     'Color',
     'Size',
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escala em arena grande
+Mede o tempo por tick do engine headless à medida que a cobra cresce,
+com uma comida comida e uma fugitiva fugindo a cada tick, para verificar
+que o custo (movimento, respawn e fuga) não depende do comprimento nem
+da arena
+
+Uso:
+    python benchmarks/arena_benchmark.py [--arena 1000x1000] [--lengths 1000,10000,100000] [--ticks T]
+"""
+
+import argparse
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.game_engine import GameEngine
+from core.autopilot import hamiltonian_cycle
+from utils.enums import Direction, EntityType
+
+BAR_WIDTH = 40
+SECTIONS = ('move', 'spawn', 'escape')
+
+def cycle_directions(engine: GameEngine) -> Dict[int, Direction]:
+    """
+    Mapeia o deslocamento de índice entre células vizinhas para a direção
+    
+    Args:
+        engine: Engine da partida (define a largura da grade)
+    
+    Returns:
+        Dicionário deslocamento -> direção
+    """
+    stride = engine.grid.stride
+    return {1: Direction.RIGHT, -1: Direction.LEFT,
+            stride: Direction.DOWN, -stride: Direction.UP}
+
+def instrument(method: Callable, totals: Dict[str, float], section: str) -> Callable:
+    """
+    Envolve um método para acumular o tempo gasto dentro dele
+    
+    Args:
+        method: Método ligado a instrumentar
+        totals: Acumuladores de segundos por seção
+        section: Seção que recebe o tempo
+    
+    Returns:
+        Função com a mesma assinatura
+    """
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            totals[section] += time.perf_counter() - start
+    return timed
+
+def run_benchmark(width: int, height: int, lengths: List[int], ticks: int, seed: int) -> List[dict]:
+    """
+    Faz a cobra crescer seguindo um ciclo hamiltoniano e mede cada patamar
+    
+    A cobra cresce um segmento por tick até cada comprimento pedido
+    (sem medir) e então roda `ticks` ticks cronometrados. Antes de cada
+    tick cronometrado uma comida normal é posta na próxima célula do
+    caminho (comida por _check_collisions, com respawn de outra) e uma
+    fugitiva duas células adiante (entra em alerta e foge no mesmo tick).
+    O tempo do respawn (spawn_new_food) e o da atualização das comidas
+    com a fuga (FoodManager.update) são medidos à parte; o resto do tick
+    é movimento, colisões e consumo.
+    
+    Args:
+        width: Largura da arena
+        height: Altura da arena
+        lengths: Comprimentos a medir (crescentes)
+        ticks: Ticks cronometrados por comprimento
+        seed: Semente da partida
+    
+    Returns:
+        Lista de dicionários com comprimento, ticks, µs por tick (total e
+        por seção), comidas consumidas e fugas
+    """
+    engine = GameEngine(headless=True, seed=seed, arena=(width, height))
+    successors = hamiltonian_cycle(width, height)
+    if successors is None:
+        raise ValueError("A arena precisa de uma dimensão par para o ciclo hamiltoniano")
+    
+    grid = engine.grid
+    snake = engine.snake
+    food_manager = engine.food_manager
+    directions = cycle_directions(engine)
+    stride = grid.stride
+    
+    def head_index() -> int:
+        x, y = snake.head_position
+        return (y + 1) * stride + x + 1
+    
+    # Com um segmento a cobra não pode inverter: percorre o ciclo ao contrário
+    index = head_index()
+    if directions[successors[index] - index] == snake.direction.opposite:
+        reversed_cycle = array('i', [-1]) * len(successors)
+        for cell, successor in enumerate(successors):
+            if successor >= 0:
+                reversed_cycle[successor] = cell
+        successors = reversed_cycle
+    
+    def advance() -> bool:
+        index = head_index()
+        _, done = engine.step(directions[successors[index] - index])
+        return done
+    
+    def bait() -> None:
+        """Põe comida na próxima célula e uma fugitiva duas células adiante"""
+        target = successors[head_index()]
+        for cell, food_type in ((target, EntityType.FOOD_NORMAL),
+                                (successors[successors[target]], EntityType.FOOD_FUGITIVE)):
+            position = grid.position_of(cell)
+            if grid.is_free(position):
+                food_manager.place_food(food_type, position)
+    
+    totals = dict.fromkeys(SECTIONS, 0.0)
+    food_manager.spawn_new_food = instrument(food_manager.spawn_new_food, totals, 'spawn')
+    food_manager.update = instrument(food_manager.update, totals, 'escape')
+    
+    results = []
+    for length in lengths:
+        while snake.length < length:
+            snake.grow()
+            if advance():
+                raise RuntimeError(f"A cobra morreu com {snake.length} segmentos")
+        
+        start_length = snake.length
+        stats = food_manager.stats
+        for section in SECTIONS:
+            totals[section] = 0.0
+        
+        elapsed = 0.0
+        for _ in range(ticks):
+            bait()
+            start = time.perf_counter()
+            done = advance()
+            elapsed += time.perf_counter() - start
+            if done:
+                raise RuntimeError(f"A cobra morreu com {snake.length} segmentos")
+        
+        totals['move'] = elapsed - totals['spawn'] - totals['escape']
+        after = food_manager.stats
+        results.append({
+            'length': start_length,
+            'ticks': ticks,
+            'us_per_tick': elapsed / ticks * 1e6,
+            **{f'{section}_us': totals[section] / ticks * 1e6 for section in SECTIONS},
+            'eaten': sum(after[key] - stats[key] for key in
+                         ('normal_consumed', 'special_consumed', 'fugitive_consumed', 'mirror_consumed')),
+            'escapes': after['fugitive_escapes'] - stats['fugitive_escapes']
+        })
+    
+    return results
+
+def print_chart(results: List[dict]) -> None:
+    """
+    Imprime o tempo por tick como gráfico de barras em texto
+    
+    Args:
+        results: Resultados de run_benchmark()
+    """
+    slowest = max(result['us_per_tick'] for result in results)
+    print(f"{'comprimento':>12} {'µs/tick':>9} {'mover':>8} {'spawn':>8} {'fuga':>8} "
+          f"{'comidas':>8} {'fugas':>7}")
+    for result in results:
+        bar = '█' * max(1, round(result['us_per_tick'] / slowest * BAR_WIDTH))
+        print(f"{result['length']:>12,} {result['us_per_tick']:>9.2f} {result['move_us']:>8.2f} "
+              f"{result['spawn_us']:>8.2f} {result['escape_us']:>8.2f} "
+              f"{result['eaten']:>8,} {result['escapes']:>7,} {bar}")
+
+def main() -> int:
+    """
+    Ponto de entrada do benchmark
+    
+    Returns:
+        Código de saída (0 = sucesso, 1 = erro)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de escala em arena grande do Snake Game")
+    parser.add_argument('--arena', default='1000x1000', help="tamanho da arena LARGURAxALTURA")
+    parser.add_argument('--lengths', default='1000,3000,10000,30000,100000',
+                        help="comprimentos medidos, separados por vírgula")
+    parser.add_argument('--ticks', type=int, default=5_000, help="ticks cronometrados por comprimento")
+    parser.add_argument('--seed', type=int, default=42, help="semente aleatória")
+    args = parser.parse_args()
+    
+    width, height = (int(value) for value in args.arena.lower().split('x'))
+    lengths = sorted(int(value) for value in args.lengths.split(','))
+    
+    try:
+        results = run_benchmark(width, height, lengths, args.ticks, args.seed)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+    
+    print(f"⏱️  === BENCHMARK DE ARENA {width}x{height} ===")
+    print_chart(results)
+    
+    ratio = results[-1]['us_per_tick'] / results[0]['us_per_tick']
+    print(f"📈 Maior/menor comprimento: {ratio:.2f}x o tempo por tick")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark do modo headless do GameEngine
+Mede quantos ticks de simulação por segundo o engine executa
+sem display, sem fontes e sem limite de framerate
+
+Uso:
+    python benchmarks/headless_benchmark.py [--ticks N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.game_engine import GameEngine
+from utils.enums import Direction
+
+DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+def run_benchmark(total_ticks: int, seed: int, turn_chance: float = 0.1) -> dict:
+    """
+    Executa partidas headless até completar o número de ticks pedido
+    
+    Args:
+        total_ticks: Número total de ticks a simular
+        seed: Semente do gerador aleatório
+        turn_chance: Probabilidade de a política aleatória virar a cada tick
+    
+    Returns:
+        Dicionário com ticks, partidas, tempo decorrido e ticks/s
+    """
+    engine = GameEngine(headless=True, seed=seed)
+    policy_rng = random.Random(seed)
+    
+    games = 1
+    start = time.perf_counter()
+    
+    for _ in range(total_ticks):
+        action = None
+        if policy_rng.random() < turn_chance:
+            action = policy_rng.choice(DIRECTIONS)
+        
+        _, done = engine.step(action)
+        if done:
+            engine.reset()
+            games += 1
+    
+    elapsed = time.perf_counter() - start
+    
+    return {
+        'ticks': total_ticks,
+        'games': games,
+        'elapsed': elapsed,
+        'ticks_per_second': total_ticks / elapsed if elapsed > 0 else float('inf')
+    }
+
+def main() -> int:
+    """
+    Ponto de entrada do benchmark
+    
+    Returns:
+        Código de saída (0 = sucesso)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do modo headless do Snake Game")
+    parser.add_argument('--ticks', type=int, default=200_000, help="ticks a simular")
+    parser.add_argument('--seed', type=int, default=42, help="semente aleatória")
+    args = parser.parse_args()
+    
+    result = run_benchmark(args.ticks, args.seed)
+    
+    print("⏱️  === BENCHMARK HEADLESS ===")
+    print(f"🔁 Ticks: {result['ticks']:,}")
+    print(f"🎮 Partidas: {result['games']:,}")
+    print(f"⌛ Tempo: {result['elapsed']:.3f}s")
+    print(f"🚀 Ticks/s: {result['ticks_per_second']:,.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
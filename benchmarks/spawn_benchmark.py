@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark de spawn de comida com o tabuleiro quase cheio
+Compara o algoritmo antigo (tentativas aleatórias + força bruta sobre
+a lista do corpo) com o índice de células livres da grade de ocupação
+
+Uso:
+    python benchmarks/spawn_benchmark.py [--spawns N] [--width W] [--height H]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from entities.food import Food
+from utils.enums import EntityType
+from utils.occupancy_grid import OccupancyGrid, CELL_SNAKE
+from config.settings import GRID_WIDTH, GRID_HEIGHT
+
+FILL_RATIOS = (0.90, 0.95, 0.98, 0.99)
+
+def legacy_respawn(snake_body: list, width: int, height: int, max_attempts: int = 100) -> tuple:
+    """
+    Reproduz o spawn original: tentativas aleatórias com busca na lista
+    do corpo e, se falharem, conjunto de todas as células menos o corpo
+    
+    Args:
+        snake_body: Lista de posições ocupadas
+        width: Largura do grid
+        height: Altura do grid
+        max_attempts: Tentativas aleatórias antes da força bruta
+    
+    Returns:
+        Posição escolhida
+    """
+    for _ in range(max_attempts):
+        position = (random.randint(0, width - 1), random.randint(0, height - 1))
+        if position not in snake_body:
+            return position
+    
+    all_positions = {(x, y) for x in range(width) for y in range(height)}
+    available_positions = all_positions - set(snake_body)
+    return random.choice(list(available_positions))
+
+def build_board(width: int, height: int, fill_ratio: float, seed: int) -> tuple:
+    """
+    Monta uma grade com a fração pedida de células ocupadas pela cobra
+    
+    Args:
+        width: Largura do grid
+        height: Altura do grid
+        fill_ratio: Fração de células ocupadas (0.0-1.0)
+        seed: Semente do sorteio das células
+    
+    Returns:
+        Tupla (grade, lista do corpo, conjunto do corpo)
+    """
+    rng = random.Random(seed)
+    all_positions = [(x, y) for x in range(width) for y in range(height)]
+    body = rng.sample(all_positions, int(len(all_positions) * fill_ratio))
+    
+    grid = OccupancyGrid(width, height)
+    for position in body:
+        grid.set_flag(position, CELL_SNAKE)
+    
+    return grid, body, set(body)
+
+def time_per_spawn(spawn, spawns: int) -> float:
+    """
+    Mede o tempo médio de uma função de spawn
+    
+    Args:
+        spawn: Função sem argumentos que executa um spawn
+        spawns: Número de repetições
+    
+    Returns:
+        Microssegundos por spawn
+    """
+    start = time.perf_counter()
+    for _ in range(spawns):
+        spawn()
+    return (time.perf_counter() - start) / spawns * 1e6
+
+def main() -> int:
+    """
+    Ponto de entrada do benchmark
+    
+    Returns:
+        Código de saída (0 = sucesso)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de spawn com o tabuleiro quase cheio")
+    parser.add_argument('--spawns', type=int, default=2_000, help="spawns por cenário")
+    parser.add_argument('--width', type=int, default=GRID_WIDTH, help="largura do grid")
+    parser.add_argument('--height', type=int, default=GRID_HEIGHT, help="altura do grid")
+    parser.add_argument('--seed', type=int, default=42, help="semente aleatória")
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    
+    print(f"⏱️  === BENCHMARK DE SPAWN ({args.width}x{args.height}) ===")
+    print(f"{'ocupação':>9} | {'antigo (µs)':>12} | {'índice (µs)':>12} | {'ganho':>8}")
+    
+    for fill_ratio in FILL_RATIOS:
+        grid, body_list, body_set = build_board(args.width, args.height, fill_ratio, args.seed)
+        food = Food(EntityType.FOOD_NORMAL, grid)
+        
+        legacy_us = time_per_spawn(
+            lambda: legacy_respawn(body_list, args.width, args.height), args.spawns
+        )
+        indexed_us = time_per_spawn(lambda: food.respawn(body_set), args.spawns)
+        
+        print(f"{fill_ratio:>8.0%} | {legacy_us:>12.1f} | {indexed_us:>12.2f} | "
+              f"{legacy_us / indexed_us:>7.0f}x")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
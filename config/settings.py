@@ -25,15 +25,30 @@ GRID_SIZE: int = 20
 GRID_WIDTH: int = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT: int = (WINDOW_HEIGHT - HUD_HEIGHT) // GRID_SIZE
 
+# Arena em células (GRID_WIDTH x GRID_HEIGHT é só a área visível): uma
+# arena maior ativa a câmera que segue a cobra
+ARENA_WIDTH: int = GRID_WIDTH
+ARENA_HEIGHT: int = GRID_HEIGHT
+CAMERA_MARGIN: int = 6  # Células entre a cabeça e a borda da tela antes de a câmera rolar
+EXACT_ESCAPE_MAX_CELLS: int = 4096  # Até este tamanho de arena a fuga usa BFS exata; acima, amostragem O(1)
+ESCAPE_SAMPLES: int = 32  # Células livres sorteadas por fuga no modo amostrado
+
 # =============================================================================
 # CONFIGURAÇÕES DE GAMEPLAY
 # =============================================================================
 BASE_FPS: int = 8  # FPS inicial (mais lento)
 MAX_FPS: int = 20  # FPS máximo
+DISPLAY_FPS: int = 60  # Taxa de renderização (independente da velocidade do jogo)
+DIRTY_RECT_RENDERING: bool = True  # Atualiza só as regiões alteradas (tela inteira durante efeitos)
+MAX_FRAME_TIME: float = 0.25  # Maior intervalo entre frames aceito pelo acumulador (segundos)
+MAX_TICKS_PER_FRAME: int = 32  # Limite de ticks por frame (evita espiral de atraso)
+TURBO_MULTIPLIERS: Tuple[int, ...] = (1, 2, 4, 8)  # Ticks de simulação por período (turbo)
+DIRECTION_QUEUE_SIZE: int = 3  # Curvas guardadas para os próximos ticks (uma consumida por tick)
 FPS_INCREASE_PER_LEVEL: float = 1.2  # Multiplicador de velocidade por nível
 INITIAL_SNAKE_LENGTH: int = 1
 POINTS_PER_FOOD: int = 1  # 1 ponto por fruta normal
 POINTS_PER_LEVEL: int = 10  # A cada 10 pontos sobe de nível
+AUTOPILOT_CYCLE_RATIO: float = 0.3  # Fração da arena ocupada a partir da qual o piloto segue o ciclo hamiltoniano
 
 # Configurações das comidas especiais (balanceadas para v3.0)
 SPECIAL_FOOD_POINTS: int = 5  # 5 pontos para comida especial
@@ -44,6 +59,8 @@ FUGITIVE_FOOD_TRAIL_DURATION: float = 1.5  # Duração do rastro em segundos
 FUGITIVE_FOOD_BLINK_SPEED: float = 3.0  # Velocidade do piscar
 FUGITIVE_FOOD_POINTS: int = 3  # 3 pontos para comida fugitiva
 MIRROR_FOOD_POINTS: int = 2  # 2 pontos para comida espelho
+FUGITIVE_DANGER_RADIUS: int = 2  # Raio Manhattan em que a cobra assusta a fugitiva
+FOOD_COUNT: int = 1  # Comidas simultâneas na arena (cada uma consumida é reposta)
 
 # =============================================================================
 # PALETA DE CORES GRUVBOX v3.0 (RGB)
@@ -228,6 +245,8 @@ class Controls:
     RESTART = 'K_r'
     QUIT = 'K_q'
     PAUSE = 'K_SPACE'
+    TURBO = 'K_t'
+    AUTOPILOT = 'K_p'
 
 # =============================================================================
 # CONFIGURAÇÕES DE POSIÇÕES INICIAIS (Mantidas)
@@ -274,6 +293,8 @@ class Debug:
     SHOW_GRID_COORDINATES: bool = False # Mostrar coordenadas do grid
     ENABLE_PERFORMANCE_PROFILING: bool = False  # Profiling de performance
     LOG_LEVEL: str = "INFO"             # Level de log (DEBUG, INFO, WARNING, ERROR)
+    SHOW_LATENCY: bool = False          # Mostrar latência tecla → tela (p50/p95/p99)
+    LATENCY_SAMPLES: int = 1000         # Amostras de latência mantidas para os percentis
     
     # Cores para elementos de debug
     DEBUG_TEXT_COLOR = Colors.BRIGHT_YELLOW
@@ -325,11 +346,19 @@ def validate_settings() -> bool:
         assert WINDOW_WIDTH > 0 and WINDOW_HEIGHT > 0
         assert GRID_SIZE > 0
         assert GRID_WIDTH > 10 and GRID_HEIGHT > 10
+        assert ARENA_WIDTH >= 2 and ARENA_HEIGHT >= 2
+        assert 0 <= CAMERA_MARGIN < min(GRID_WIDTH, GRID_HEIGHT) // 2
+        assert ESCAPE_SAMPLES > 0
+        assert FOOD_COUNT >= 1 and FUGITIVE_DANGER_RADIUS >= 1
         
         # Verifica configurações de gameplay
         assert BASE_FPS > 0 and MAX_FPS > BASE_FPS
+        assert DISPLAY_FPS > 0 and MAX_TICKS_PER_FRAME > 0
+        assert TURBO_MULTIPLIERS and all(m >= 1 for m in TURBO_MULTIPLIERS)
+        assert DIRECTION_QUEUE_SIZE > 0
         assert FPS_INCREASE_PER_LEVEL > 1.0
         assert POINTS_PER_LEVEL > 0
+        assert 0 < AUTOPILOT_CYCLE_RATIO <= 1.0
         
         # Verifica probabilidades de spawn
         total_spawn_chance = (SPECIAL_FOOD_SPAWN_CHANCE + 
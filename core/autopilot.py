@@ -0,0 +1,398 @@
+"""
+Piloto automático da cobra
+Caminho A* até a comida com checagem de segurança (a cauda continua
+alcançável depois de comer), perseguição da cauda como reserva e ciclo
+hamiltoniano para cobras longas
+"""
+
+import heapq
+from array import array
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Deque, List, Optional
+from utils.enums import Direction
+from utils.types import Position
+from utils.occupancy_grid import OccupancyGrid, CELL_SNAKE, CELL_WALL
+from entities.snake import Snake
+from config.settings import AUTOPILOT_CYCLE_RATIO
+
+# Tabela de translate: flags da célula -> 1 se bloqueia a passagem
+_BLOCKED_TABLE = bytes(1 if flags & (CELL_SNAKE | CELL_WALL) else 0 for flags in range(256))
+
+def _zigzag(width: int, height: int) -> List[Position]:
+    """
+    Percorre a arena em zigue-zague (altura par) e volta pela coluna 0
+    
+    Args:
+        width: Largura da arena (>= 2)
+        height: Altura da arena (par, >= 2)
+    
+    Returns:
+        Células na ordem do ciclo
+    """
+    order = []
+    for y in range(height):
+        xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        order.extend((x, y) for x in xs)
+    order.extend((0, y) for y in range(height - 1, -1, -1))
+    return order
+
+@lru_cache(maxsize=8)
+def hamiltonian_cycle(width: int, height: int) -> Optional[array]:
+    """
+    Calcula (uma vez por tamanho de arena) um ciclo hamiltoniano
+    
+    O resultado é compartilhado entre chamadas: não o modifique.
+    
+    Args:
+        width: Largura da área jogável
+        height: Altura da área jogável
+    
+    Returns:
+        Array com o sucessor de cada célula no ciclo, indexado como a
+        OccupancyGrid (-1 na borda), ou None se a arena não tem ciclo
+        (ambas as dimensões ímpares ou menor que 2x2)
+    """
+    if width < 2 or height < 2:
+        return None
+    
+    if height % 2 == 0:
+        order = _zigzag(width, height)
+    elif width % 2 == 0:
+        order = [(x, y) for y, x in _zigzag(height, width)]
+    else:
+        return None
+    
+    stride = width + 2
+    successors = array('i', [-1]) * (stride * (height + 2))
+    indices = [(y + 1) * stride + x + 1 for x, y in order]
+    for index, successor in zip(indices, indices[1:] + indices[:1]):
+        successors[index] = successor
+    return successors
+
+class Autopilot:
+    """
+    Escolhe a direção da cobra a cada tick
+    
+    Prioridades:
+    1. Cobra longa (AUTOPILOT_CYCLE_RATIO da arena): segue o ciclo
+       hamiltoniano assim que o corpo puder se alinhar a ele
+    2. Caminho em cache, enquanto a comida não mudou e o próximo passo está livre
+    3. Novo caminho A* até a comida, aceito só se a cauda continuar
+       alcançável depois de percorrê-lo (senão a cobra se prenderia)
+    4. Caminho até a cauda (ganha tempo até a comida ficar segura)
+    5. Vizinho livre com mais saídas
+    
+    As buscas só rodam quando o caminho em cache é invalidado: as células
+    à frente estavam livres no planejamento e só a própria cobra as ocupa
+    seguindo o caminho, então basta checar o próximo passo a cada tick.
+    """
+    
+    def __init__(self, grid: OccupancyGrid):
+        """
+        Inicializa o piloto
+        
+        Args:
+            grid: Grade de ocupação da arena
+        """
+        self._grid = grid
+        stride = grid.stride
+        self._stride = stride
+        self._offsets = (1, -1, stride, -stride)
+        self._directions = {
+            1: Direction.RIGHT, -1: Direction.LEFT,
+            stride: Direction.DOWN, -stride: Direction.UP
+        }
+        self._cycle_length = int(grid.width * grid.height * AUTOPILOT_CYCLE_RATIO)
+        self._cycle: Optional[array] = None
+        self._on_cycle = False
+        
+        # Antecessores da busca (reaproveitado; só células visitadas são lidas)
+        self._parent = array('i', [-1]) * len(grid.cells)
+        
+        # Caminho em cache: células à frente, comida alvo e cabeça esperada
+        self._path: Deque[int] = deque()
+        self._food = -1
+        self._expected_head = -1
+        self._searches = 0
+    
+    @property
+    def searches(self) -> int:
+        """Retorna quantas buscas de caminho já foram feitas"""
+        return self._searches
+    
+    def invalidate(self) -> None:
+        """Descarta o caminho em cache"""
+        self._path.clear()
+        self._expected_head = -1
+        self._on_cycle = False
+    
+    def steer(self, snake: Snake, food_position: Optional[Position]) -> None:
+        """
+        Decide e aplica a direção do próximo tick via change_direction
+        
+        A decisão vale para o próximo movimento, então curvas ainda na
+        fila da cobra são descartadas antes.
+        
+        Args:
+            snake: Cobra controlada
+            food_position: Posição da comida alvo (a mais próxima da cabeça) ou None
+        """
+        snake.clear_direction_queue()
+        direction = self.decide(snake, food_position)
+        if direction is not None:
+            snake.change_direction(direction)
+    
+    def decide(self, snake: Snake, food_position: Optional[Position]) -> Optional[Direction]:
+        """
+        Escolhe a direção do próximo tick
+        
+        Args:
+            snake: Cobra controlada
+            food_position: Posição da comida alvo (a mais próxima da cabeça) ou None
+        
+        Returns:
+            Direção escolhida ou None se não há movimento seguro
+        """
+        grid = self._grid
+        cells = grid.cells
+        body = snake.body_view
+        head = grid.index(body.head)
+        # Célula atrás da cabeça: inverter o sentido é ignorado por change_direction
+        dx, dy = snake.direction.value
+        neck = head - dx - dy * self._stride
+        # A cauda libera a célula no próximo movimento, exceto se a cobra cresce
+        tail_cell = grid.index(body[-1]) if len(body) > 1 else -1
+        tail = tail_cell if not snake.growing else -1
+        food = grid.index(food_position) if food_position is not None else -1
+        
+        def passable(index: int) -> bool:
+            return index != neck and (index == tail or not cells[index] & (CELL_SNAKE | CELL_WALL))
+        
+        # 1. No ciclo hamiltoniano o corpo já está alinhado: basta segui-lo
+        if self._on_cycle and self._expected_head == head and passable(self._cycle[head]):
+            self._expected_head = self._cycle[head]
+            return self._directions[self._expected_head - head]
+        self._on_cycle = False
+        
+        # 2. Caminho em cache
+        path = self._path
+        if not (path and self._expected_head == head and self._food == food and passable(path[0])):
+            path.clear()
+            
+            # Cobra longa: entra no ciclo assim que isso for seguro
+            if snake.length >= self._cycle_length and self._can_join_cycle(snake, head):
+                self._on_cycle = True
+                self._expected_head = self._cycle[head]
+                return self._directions[self._expected_head - head]
+            
+            # 3. Caminho até a comida, se seguro; 4. senão até a cauda
+            if food >= 0:
+                route = self._search(self._closed_cells(neck, tail), head, food)
+                if route and self._tail_reachable(snake, route):
+                    path.extend(route)
+            if not path and tail_cell >= 0:
+                path.extend(self._chase_tail(head, neck, tail, tail_cell, passable))
+            self._food = food
+        
+        if path:
+            next_cell = path.popleft()
+            self._expected_head = next_cell
+            return self._directions[next_cell - head]
+        
+        # 5. Sobrevivência: vizinho livre com mais saídas
+        best_offset, best_exits = None, -1
+        for offset in self._offsets:
+            neighbor = head + offset
+            if passable(neighbor):
+                exits = sum(1 for step in self._offsets if passable(neighbor + step))
+                if exits > best_exits:
+                    best_offset, best_exits = offset, exits
+        
+        self._expected_head = -1
+        return self._directions[best_offset] if best_offset is not None else None
+    
+    def _can_join_cycle(self, snake: Snake, head: int) -> bool:
+        """
+        Verifica se seguir o ciclo a partir da cabeça nunca encontra o corpo
+        
+        Cada célula dos próximos `comprimento` passos do ciclo precisa
+        estar livre ou ser liberada pela cauda antes de a cabeça chegar
+        (com folga para crescimentos no caminho). Depois disso o corpo
+        fica alinhado ao ciclo e segui-lo é seguro para sempre.
+        
+        Args:
+            snake: Cobra controlada
+            head: Índice da cabeça
+        
+        Returns:
+            True se a cobra pode passar a seguir o ciclo
+        """
+        if self._cycle is None:
+            self._cycle = hamiltonian_cycle(self._grid.width, self._grid.height)
+            if self._cycle is None:
+                return False
+        
+        grid = self._grid
+        cycle = self._cycle
+        segments = {grid.index(segment): order for order, segment in enumerate(snake.body_view)}
+        length = snake.length
+        slack = 2 if snake.growing else 1
+        
+        cell = head
+        for step in range(1, length + 1):
+            cell = cycle[cell]
+            order = segments.get(cell)
+            if order is not None and length - order + slack > step:
+                return False
+        return True
+    
+    def _chase_tail(self, head: int, neck: int, tail: int, tail_cell: int, passable) -> List[int]:
+        """
+        Caminho até a cauda pelo vizinho que deixa a rota mais longa
+        
+        Seguir a cauda pela rota mais longa estica o corpo e abre espaço,
+        em vez de girar em um laço curto até a comida ficar segura.
+        
+        Args:
+            head: Índice da cabeça
+            neck: Índice da célula atrás da cabeça
+            tail: Índice da cauda se ela libera a célula, senão -1
+            tail_cell: Índice da cauda
+            passable: Predicado de célula livre para o próximo passo
+        
+        Returns:
+            Células do caminho (vazio se a cauda está inalcançável)
+        """
+        best: List[int] = []
+        for offset in self._offsets:
+            neighbor = head + offset
+            if not passable(neighbor):
+                continue
+            if neighbor == tail_cell:
+                route = [neighbor]
+            else:
+                closed = self._closed_cells(neck, tail)
+                closed[head] = 1
+                rest = self._search(closed, neighbor, tail_cell)
+                if rest is None:
+                    continue
+                route = [neighbor] + rest
+            if len(route) > len(best):
+                best = route
+        return best
+    
+    def _closed_cells(self, neck: int, tail: int) -> bytearray:
+        """
+        Monta o mapa de células fechadas da busca (cobra e paredes)
+        
+        Args:
+            neck: Índice da célula atrás da cabeça (nunca atravessável)
+            tail: Índice da cauda liberada no próximo movimento ou -1
+        
+        Returns:
+            Bytearray com 1 nas células bloqueadas
+        """
+        closed = self._grid.cells.translate(_BLOCKED_TABLE)
+        if tail >= 0:
+            closed[tail] = 0
+        closed[neck] = 1
+        return closed
+    
+    def _search(self, closed: bytearray, start: int, goal: int) -> Optional[List[int]]:
+        """
+        A* com distância de Manhattan entre dois índices da grade
+        
+        Args:
+            closed: Células bloqueadas (modificado: marca as visitadas)
+            start: Índice de partida
+            goal: Índice de chegada (tratado como aberto)
+        
+        Returns:
+            Células do caminho, sem a partida e terminando em goal, ou None
+        """
+        self._searches += 1
+        stride = self._stride
+        offsets = self._offsets
+        parent = self._parent
+        goal_y, goal_x = divmod(goal, stride)
+        
+        closed[goal] = 0
+        best_cost = {start: 0}
+        start_y, start_x = divmod(start, stride)
+        # Entradas (f, -g, índice): em empate, expande primeiro o mais profundo
+        heap = [(abs(start_x - goal_x) + abs(start_y - goal_y), 0, start)]
+        
+        while heap:
+            _, negative_cost, index = heapq.heappop(heap)
+            if index == goal:
+                route = [goal]
+                while parent[index] != start:
+                    index = parent[index]
+                    route.append(index)
+                route.reverse()
+                return route
+            
+            if closed[index] and index != start:
+                continue
+            closed[index] = 1
+            
+            cost = 1 - negative_cost
+            for offset in offsets:
+                neighbor = index + offset
+                if not closed[neighbor] and cost < best_cost.get(neighbor, cost + 1):
+                    best_cost[neighbor] = cost
+                    parent[neighbor] = index
+                    y, x = divmod(neighbor, stride)
+                    heapq.heappush(heap, (cost + abs(x - goal_x) + abs(y - goal_y), -cost, neighbor))
+        
+        return None
+    
+    def _tail_reachable(self, snake: Snake, route: List[int]) -> bool:
+        """
+        Verifica se, depois de seguir o caminho e comer, a cauda segue alcançável
+        
+        Simula o corpo virtual ao fim do caminho e busca um caminho da
+        nova cabeça até a nova cauda que não entre nela no primeiro passo
+        (o crescimento segura a cauda por um tick).
+        
+        Args:
+            snake: Cobra controlada
+            route: Caminho candidato (termina na comida)
+        
+        Returns:
+            True se o caminho não prende a cobra
+        """
+        grid = self._grid
+        steps = len(route)
+        length = snake.length + (1 if snake.growing else 0)
+        
+        closed = grid.cells.translate(_BLOCKED_TABLE)
+        
+        # Segmentos que saem do corpo durante o caminho: os últimos
+        kept = max(0, length - steps)
+        for x, y in islice(snake.body_view, kept, None):
+            closed[grid.index((x, y))] = 0
+        
+        virtual_body = route[::-1][:length]
+        for index in virtual_body:
+            closed[index] = 1
+        
+        if kept:
+            virtual_tail = grid.index(snake.body_view[kept - 1])
+        else:
+            virtual_tail = virtual_body[-1]
+        
+        start = route[-1]
+        if virtual_tail == start:
+            return True
+        
+        # Ao comer a cauda fica parada um tick: a rota precisa de 2+ passos
+        closed[start] = 1
+        for offset in self._offsets:
+            neighbor = start + offset
+            if (neighbor != virtual_tail and not closed[neighbor] and
+                    self._search(bytearray(closed), neighbor, virtual_tail) is not None):
+                return True
+        return False
@@ -0,0 +1,236 @@
+"""
+Ambiente no estilo Gym sobre o GameEngine headless
+Observação em grade uint8 multicanal, mantida incrementalmente
+"""
+
+import operator
+from typing import Dict, Optional, Tuple, Union
+from utils.enums import Direction, EntityType
+from utils.types import Position
+from config.settings import FOOD_COUNT
+from core.game_engine import GameEngine
+from core.vec_env import (
+    ACTION_NONE, ACTION_DIRECTIONS, FOOD_NORMAL, FOOD_SPECIAL, FOOD_FUGITIVE, FOOD_MIRROR
+)
+
+try:
+    import numpy as np
+except ImportError:  # sem numpy a observação é um memoryview (C, H, W)
+    np = None
+
+# Canais da observação (C, H, W)
+CHANNEL_BODY: int = 0       # 1 nas células da cobra
+CHANNEL_HEAD: int = 1       # 1 na cabeça
+CHANNEL_FOOD: int = 2       # código do tipo de comida + 1 na célula da comida
+CHANNEL_DIRECTION: int = 3  # código da direção + 1 na cabeça
+NUM_CHANNELS: int = 4
+
+FOOD_CODES = {
+    EntityType.FOOD_NORMAL: FOOD_NORMAL,
+    EntityType.FOOD_SPECIAL: FOOD_SPECIAL,
+    EntityType.FOOD_FUGITIVE: FOOD_FUGITIVE,
+    EntityType.FOOD_MIRROR: FOOD_MIRROR,
+}
+DIRECTION_CODES = {direction: code for code, direction in enumerate(ACTION_DIRECTIONS)}
+
+Action = Union[Direction, int, None]
+
+class SnakeEnv:
+    """
+    Ambiente de uma partida com reset(seed) e step(action)
+    
+    A observação é um buffer uint8 (canais, altura, largura) alocado uma
+    única vez. Cada step reescreve apenas as células que mudaram: a
+    cabeça antiga e a nova, a cauda liberada e as comidas que entraram
+    ou saíram do índice célula → comida. O mesmo objeto é devolvido a
+    cada step; copie-o para guardar histórico.
+    """
+    
+    def __init__(self, seed: Optional[int] = None, food_count: int = FOOD_COUNT):
+        """
+        Inicializa o ambiente
+        
+        Args:
+            seed: Semente opcional da primeira partida
+            food_count: Comidas simultâneas na arena
+        """
+        self._engine = GameEngine(headless=True, seed=seed, food_count=food_count)
+        self._width, self._height = self._engine.arena_size
+        self._plane = self._width * self._height
+        self._buffer = bytearray(NUM_CHANNELS * self._plane)
+        
+        shape = (NUM_CHANNELS, self._height, self._width)
+        if np is not None:
+            self._observation = np.frombuffer(self._buffer, dtype=np.uint8).reshape(shape)
+        else:
+            self._observation = memoryview(self._buffer).cast('B', shape)
+        
+        # Comidas escritas no canal (célula → objeto) e a revisão do
+        # índice do FoodManager que elas refletem
+        self._food_cells: Dict[Position, object] = {}
+        self._food_revision: Optional[int] = None
+        self._info = {'score': 0, 'length': 1, 'level': 1}
+        self._rasterize()
+    
+    def _offset(self, channel: int, position: Position) -> int:
+        """
+        Retorna o índice no buffer de uma célula de um canal (-1 fora da arena)
+        
+        Args:
+            channel: Canal da observação
+            position: Posição (x, y)
+        """
+        x, y = position
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return channel * self._plane + y * self._width + x
+        return -1
+    
+    def _write(self, channel: int, position: Position, value: int) -> None:
+        """
+        Escreve um valor em uma célula de um canal (ignora posições fora da arena)
+        
+        Args:
+            channel: Canal da observação
+            position: Posição (x, y)
+            value: Valor uint8
+        """
+        offset = self._offset(channel, position)
+        if offset >= 0:
+            self._buffer[offset] = value
+    
+    def _sync_food(self) -> None:
+        """
+        Atualiza o canal de comida a partir do índice célula → comida
+        
+        Nada é feito enquanto a revisão do índice não muda; quando muda,
+        apaga as células que saíram e escreve as que entraram (uma
+        comida trocada na mesma célula é outro objeto e é reescrita).
+        """
+        food_manager = self._engine.food_manager
+        if food_manager.revision == self._food_revision:
+            return
+        self._food_revision = food_manager.revision
+        
+        foods = food_manager.foods
+        drawn = self._food_cells
+        for position in [position for position, food in drawn.items()
+                         if foods.get(position) is not food]:
+            self._write(CHANNEL_FOOD, position, 0)
+            del drawn[position]
+        
+        for position, food in foods.items():
+            if drawn.get(position) is not food:
+                self._write(CHANNEL_FOOD, position, FOOD_CODES[food.entity_type] + 1)
+                drawn[position] = food
+    
+    def _rasterize(self) -> None:
+        """Reconstrói a observação inteira (apenas no reset)"""
+        self._buffer[:] = bytes(len(self._buffer))
+        
+        snake = self._engine.snake
+        for segment in snake.body_view:
+            self._write(CHANNEL_BODY, segment, 1)
+        
+        head = snake.head_position
+        self._write(CHANNEL_HEAD, head, 1)
+        self._write(CHANNEL_DIRECTION, head, DIRECTION_CODES[snake.direction] + 1)
+        
+        self._food_cells.clear()
+        self._food_revision = None
+        self._sync_food()
+        self._update_info()
+    
+    def _update_info(self) -> None:
+        """Atualiza o dicionário de informações reutilizado"""
+        self._info['score'] = self._engine.score
+        self._info['length'] = self._engine.snake_length
+        self._info['level'] = self._engine.level
+    
+    def _decode_action(self, code) -> Optional[Direction]:
+        """
+        Converte um código inteiro de ação em direção
+        
+        Args:
+            code: Inteiro (int, numpy.int64, ...) aceito por operator.index
+        
+        Returns:
+            Direção ou None para ACTION_NONE
+        """
+        code = operator.index(code)
+        if code == ACTION_NONE:
+            return None
+        if not 0 <= code < len(ACTION_DIRECTIONS):
+            raise ValueError(f"Ação inválida {code}: use 0-{len(ACTION_DIRECTIONS) - 1} "
+                             f"ou ACTION_NONE ({ACTION_NONE})")
+        return ACTION_DIRECTIONS[code]
+    
+    def reset(self, seed: Optional[int] = None):
+        """
+        Inicia uma nova partida
+        
+        Args:
+            seed: Semente opcional para reproduzir a partida
+        
+        Returns:
+            Observação inicial
+        """
+        self._engine.reset(seed)
+        self._rasterize()
+        return self._observation
+    
+    def step(self, action: Action = None) -> tuple:
+        """
+        Avança a partida em um tick
+        
+        Args:
+            action: Direction, código de ACTION_DIRECTIONS (int ou inteiro
+                    NumPy) ou None/ACTION_NONE
+        
+        Returns:
+            Tupla (observação, pontos do tick, se terminou, info)
+        
+        Raises:
+            ValueError: Código de ação fora de ACTION_DIRECTIONS e ACTION_NONE
+        """
+        if action is not None and not isinstance(action, Direction):
+            action = self._decode_action(action)
+        
+        snake = self._engine.snake
+        generation = snake.generation
+        old_head = snake.head_position
+        old_length = snake.length
+        
+        reward, done = self._engine.step(action)
+        
+        if snake.generation != generation:
+            self._write(CHANNEL_HEAD, old_head, 0)
+            self._write(CHANNEL_DIRECTION, old_head, 0)
+            
+            # Sem crescimento, a cauda saiu de previous_tail (limpa antes
+            # de marcar a cabeça, que pode ocupar a mesma célula)
+            if snake.length == old_length:
+                self._write(CHANNEL_BODY, snake.previous_tail, 0)
+            
+            head = snake.head_position
+            self._write(CHANNEL_BODY, head, 1)
+            self._write(CHANNEL_HEAD, head, 1)
+            self._write(CHANNEL_DIRECTION, head, DIRECTION_CODES[snake.direction] + 1)
+        
+        self._sync_food()
+        self._update_info()
+        return self._observation, reward, done, self._info
+    
+    @property
+    def observation(self):
+        """Retorna a observação atual (buffer compartilhado, sem cópia)"""
+        return self._observation
+    
+    @property
+    def observation_shape(self) -> Tuple[int, int, int]:
+        """Retorna o formato (canais, altura, largura) da observação"""
+        return NUM_CHANNELS, self._height, self._width
+    
+    @property
+    def engine(self) -> GameEngine:
+        """Retorna o engine headless usado pelo ambiente"""
+        return self._engine
@@ -5,11 +5,33 @@ Princípio de responsabilidade única: Apenas eventos
 """
 
 import pygame
-from typing import Dict, List, Callable, Optional
-from utils.enums import Direction, GameState
-from utils.types import Event
+from time import perf_counter
+from typing import Dict, List, Callable, NamedTuple, Optional, Tuple, Union
+from utils.enums import Direction, GameState, EntityType, InputAction
+from utils.types import Event, BodyView
+from utils.logger import get_logger
 from config.settings import Controls
 
+_logger = get_logger('events')
+
+# Direção de cada ação de movimento (calculado uma vez, não a cada tecla)
+_ACTION_DIRECTIONS: Dict[InputAction, Direction] = {
+    InputAction.MOVE_UP: Direction.UP,
+    InputAction.MOVE_DOWN: Direction.DOWN,
+    InputAction.MOVE_LEFT: Direction.LEFT,
+    InputAction.MOVE_RIGHT: Direction.RIGHT
+}
+
+# Eventos de alto volume que o jogo não usa: bloqueados na fila do SDL
+# para não encher cada poll (callbacks registrados liberam o seu tipo).
+# Os demais, inclusive os de janela (WINDOW*, VIDEORESIZE,
+# VIDEOEXPOSE, ACTIVEEVENT), continuam chegando
+_NOISY_EVENTS = (
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.CONTROLLERAXISMOTION
+)
+
 class EventManager:
     """
     Gerenciador centralizado de eventos
@@ -26,37 +48,40 @@ class EventManager:
         self._event_callbacks: Dict[int, List[Callable]] = {}
         self._key_mappings = self._setup_key_mappings()
         self._running = True
+        self._poll_time = 0.0
+        
+        # A fila de eventos só existe com o display (modo gráfico)
+        if pygame.display.get_init():
+            pygame.event.set_blocked(list(_NOISY_EVENTS))
     
-    def _setup_key_mappings(self) -> Dict[int, str]:
+    def _setup_key_mappings(self) -> Dict[int, InputAction]:
         """
         Configura o mapeamento de teclas
         
         Returns:
-            Dicionário com mapeamento tecla -> ação
+            Dicionário com mapeamento tecla -> código da ação
         """
         mappings = {}
         
         # Movimento
         for key_name in Controls.MOVE_UP:
-            key_code = getattr(pygame, key_name)
-            mappings[key_code] = 'move_up'
+            mappings[getattr(pygame, key_name)] = InputAction.MOVE_UP
         
         for key_name in Controls.MOVE_DOWN:
-            key_code = getattr(pygame, key_name)
-            mappings[key_code] = 'move_down'
+            mappings[getattr(pygame, key_name)] = InputAction.MOVE_DOWN
         
         for key_name in Controls.MOVE_LEFT:
-            key_code = getattr(pygame, key_name)
-            mappings[key_code] = 'move_left'
+            mappings[getattr(pygame, key_name)] = InputAction.MOVE_LEFT
         
         for key_name in Controls.MOVE_RIGHT:
-            key_code = getattr(pygame, key_name)
-            mappings[key_code] = 'move_right'
+            mappings[getattr(pygame, key_name)] = InputAction.MOVE_RIGHT
         
         # Ações
-        mappings[getattr(pygame, Controls.RESTART)] = 'restart'
-        mappings[getattr(pygame, Controls.QUIT)] = 'quit'
-        mappings[getattr(pygame, Controls.PAUSE)] = 'pause'
+        mappings[getattr(pygame, Controls.RESTART)] = InputAction.RESTART
+        mappings[getattr(pygame, Controls.QUIT)] = InputAction.QUIT
+        mappings[getattr(pygame, Controls.PAUSE)] = InputAction.PAUSE
+        mappings[getattr(pygame, Controls.TURBO)] = InputAction.TURBO
+        mappings[getattr(pygame, Controls.AUTOPILOT)] = InputAction.AUTOPILOT
         
         return mappings
     
@@ -70,6 +95,8 @@ class EventManager:
         """
         if event_type not in self._event_callbacks:
             self._event_callbacks[event_type] = []
+            if pygame.display.get_init():
+                pygame.event.set_allowed(event_type)
         
         self._event_callbacks[event_type].append(callback)
     
@@ -87,51 +114,61 @@ class EventManager:
             except ValueError:
                 pass  # Callback não encontrado
     
-    def process_events(self) -> List[str]:
+    def process_events(self) -> List[InputAction]:
         """
         Processa todos os eventos da fila
         
         Returns:
-            Lista de ações identificadas
+            Lista de ações identificadas, na ordem em que chegaram
         """
         actions = []
+        callbacks = self._event_callbacks
+        key_mappings = self._key_mappings
+        
+        events = pygame.event.get()
+        self._poll_time = perf_counter()
         
-        for event in pygame.event.get():
+        for event in events:
+            event_type = event.type
+            
             # Executa callbacks registrados
-            if event.type in self._event_callbacks:
-                for callback in self._event_callbacks[event.type]:
+            if event_type in callbacks:
+                for callback in callbacks[event_type]:
                     callback(event)
             
             # Processa eventos padrão
-            if event.type == pygame.QUIT:
-                self._running = False
-                actions.append('quit')
-            
-            elif event.type == pygame.KEYDOWN:
-                action = self._key_mappings.get(event.key)
-                if action:
+            if event_type == pygame.KEYDOWN:
+                action = key_mappings.get(event.key)
+                if action is not None:
                     actions.append(action)
+            
+            elif event_type == pygame.QUIT:
+                self._running = False
+                actions.append(InputAction.QUIT)
         
         return actions
     
-    def get_direction_from_action(self, action: str) -> Optional[Direction]:
+    def get_direction_from_action(self, action: InputAction) -> Optional[Direction]:
         """
         Converte ação em direção
         
         Args:
-            action: Ação identificada
+            action: Código da ação
             
         Returns:
             Direção correspondente ou None
         """
-        direction_map = {
-            'move_up': Direction.UP,
-            'move_down': Direction.DOWN,
-            'move_left': Direction.LEFT,
-            'move_right': Direction.RIGHT
-        }
+        return _ACTION_DIRECTIONS.get(action)
+    
+    @property
+    def poll_time(self) -> float:
+        """
+        Retorna o horário (perf_counter) da última leitura da fila
         
-        return direction_map.get(action)
+        É o carimbo de tempo das teclas devolvidas pelo último
+        process_events() (medição de latência).
+        """
+        return self._poll_time
     
     def is_running(self) -> bool:
         """
@@ -150,58 +187,127 @@ class EventManager:
         """Reseta o estado do gerenciador"""
         self._running = True
 
+class FoodEaten(NamedTuple):
+    """Evento: a cabeça da cobra consumiu uma comida"""
+    points: int                # Pontos obtidos
+    food_type: EntityType      # Tipo da comida consumida
+    snake_body: BodyView       # Visão somente leitura do corpo da cobra
+
+class SnakeCollision(NamedTuple):
+    """Evento: a cobra colidiu"""
+    collision_type: str        # 'wall' ou 'self'
+
+class GameRestart(NamedTuple):
+    """Evento: a partida deve reiniciar"""
+
+GameEvent = Union[FoodEaten, SnakeCollision, GameRestart]
+
 class GameEventDispatcher:
     """
     Despachador de eventos específicos do jogo
     
-    Facilita comunicação entre componentes
+    Facilita comunicação entre componentes. Eventos são tuplas tipadas
+    e cada listener recebe o próprio evento. post() enfileira o evento
+    para flush(), que o engine chama num ponto fixo do tick (depois das
+    colisões), de modo que nenhum listener roda no meio de uma
+    verificação; dispatch() entrega na hora (reinício fora do tick).
+    
+    Os listeners de cada tipo ficam numa tupla recompilada a cada
+    inscrição, e o despachador conta entregas e tempo gasto nos
+    listeners por tipo de evento.
     """
     
     def __init__(self):
         """Inicializa o despachador"""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[type, Tuple[Callable[[GameEvent], None], ...]] = {}
+        self._queue: List[GameEvent] = []
+        self._stats: Dict[type, List] = {}
     
-    def subscribe(self, event_name: str, callback: Callable) -> None:
+    def subscribe(self, event_type: type, callback: Callable[[GameEvent], None]) -> None:
         """
-        Inscreve um callback para um evento
+        Inscreve um callback para um tipo de evento
         
         Args:
-            event_name: Nome do evento
-            callback: Função callback
+            event_type: Classe do evento (FoodEaten, SnakeCollision, ...)
+            callback: Função que recebe o evento
         """
-        if event_name not in self._listeners:
-            self._listeners[event_name] = []
-        
-        self._listeners[event_name].append(callback)
+        self._listeners[event_type] = self._listeners.get(event_type, ()) + (callback,)
     
-    def unsubscribe(self, event_name: str, callback: Callable) -> None:
+    def unsubscribe(self, event_type: type, callback: Callable[[GameEvent], None]) -> None:
         """
         Remove inscrição de um callback
         
         Args:
-            event_name: Nome do evento
+            event_type: Classe do evento
             callback: Função callback
         """
-        if event_name in self._listeners:
-            try:
-                self._listeners[event_name].remove(callback)
-            except ValueError:
-                pass
+        listeners = self._listeners.get(event_type, ())
+        if callback in listeners:
+            index = listeners.index(callback)
+            self._listeners[event_type] = listeners[:index] + listeners[index + 1:]
+    
+    @property
+    def pending(self) -> int:
+        """Retorna o número de eventos enfileirados à espera do flush()"""
+        return len(self._queue)
     
-    def dispatch(self, event_name: str, **kwargs) -> None:
+    def post(self, event: GameEvent) -> None:
         """
-        Despacha um evento para todos os listeners
+        Enfileira um evento para o próximo flush()
         
         Args:
-            event_name: Nome do evento
-            **kwargs: Argumentos do evento
-        """
-        if event_name in self._listeners:
-            for callback in self._listeners[event_name]:
-                try:
-                    callback(**kwargs)
-                except Exception as e:
-                    print(f"Erro no callback do evento {event_name}: {e}")
+            event: Evento tipado
+        """
+        self._queue.append(event)
+    
+    def flush(self) -> int:
+        """
+        Entrega os eventos enfileirados em ordem, num único lote
+        
+        Eventos postados pelos próprios listeners entram no mesmo lote.
+        
+        Returns:
+            Número de eventos entregues
+        """
+        queue = self._queue
+        delivered = 0
+        while delivered < len(queue):
+            self.dispatch(queue[delivered])
+            delivered += 1
+        queue.clear()
+        return delivered
+    
+    def dispatch(self, event: GameEvent) -> None:
+        """
+        Entrega um evento imediatamente a todos os listeners do seu tipo
+        
+        Args:
+            event: Evento tipado
+        """
+        event_type = type(event)
+        start = perf_counter()
+        for callback in self._listeners.get(event_type, ()):
+            try:
+                callback(event)
+            except Exception as e:
+                _logger.exception("Erro no callback do evento %s: %s", event_type.__name__, e)
+        
+        stats = self._stats.get(event_type)
+        if stats is None:
+            stats = self._stats[event_type] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += perf_counter() - start
+    
+    @property
+    def pending(self) -> int:
+        """Retorna o número de eventos aguardando flush()"""
+        return len(self._queue)
+    
+    @property
+    def stats(self) -> Dict[str, Tuple[int, float]]:
+        """Retorna, por evento, (entregas, segundos gastos nos listeners)"""
+        return {event_type.__name__: (count, seconds)
+                for event_type, (count, seconds) in self._stats.items()}
 
 # Instância global do despachador (Singleton pattern)
 game_events = GameEventDispatcher()
@@ -4,21 +4,38 @@ Princípios: SOLID, responsabilidade única, controle centralizado
 Inclui sistema de níveis, velocidade dinâmica e efeitos visuais
 """
 
+import logging
 import pygame
+import random
+import struct
 import sys
-from typing import Optional
-from utils.enums import GameState, Direction
+from typing import Optional, Tuple
+from utils.enums import GameState, Direction, InputAction
 from utils.types import Clock
+from utils.occupancy_grid import OccupancyGrid
+from utils.logger import get_logger, flush_logging, enable_background_logging
 from entities.snake import Snake
 from entities.food_manager import FoodManager
 from graphics.renderer import Renderer
 from graphics.ui import UIManager
-from core.events import EventManager, game_events
+from graphics.camera import Camera
+from core.events import (
+    EventManager, GameEventDispatcher, FoodEaten, SnakeCollision, GameRestart
+)
+from core.snapshot import GameSnapshot
+from core.autopilot import Autopilot
+from core.latency import LatencyTracker
 from config.settings import (
     BASE_FPS, MAX_FPS, FPS_INCREASE_PER_LEVEL, INITIAL_SNAKE_X, INITIAL_SNAKE_Y, 
-    POINTS_PER_FOOD, POINTS_PER_LEVEL, Effects
+    POINTS_PER_FOOD, POINTS_PER_LEVEL, GRID_WIDTH, GRID_HEIGHT, ARENA_WIDTH, ARENA_HEIGHT, Effects,
+    DISPLAY_FPS, MAX_FRAME_TIME, MAX_TICKS_PER_FRAME, TURBO_MULTIPLIERS, FOOD_COUNT, Debug
 )
 
+# Estado escalar do engine no snapshot: score, nível, FPS, estado, pausa e causa da morte
+_GAME_STATES = tuple(GameState)
+_DEATH_CAUSES = (None, 'wall', 'self')
+_ENGINE_STATE = struct.Struct('<iidBBB')
+
 class GameEngine:
     """
     Engine principal do jogo Snake
@@ -29,78 +46,155 @@ class GameEngine:
     - Coordenação entre sistemas
     - Lógica de jogo de alto nível
     - Sistema de níveis e progressão
-    - Controle de velocidade dinâmica
+    - Controle de velocidade dinâmica (passo fixo, desacoplado do FPS de tela)
     - Efeitos visuais de level up
+    - Modo headless (sem janela, sem fontes e sem limite de FPS)
+    - Arenas maiores que a tela (câmera seguindo a cabeça)
     """
     
-    def __init__(self):
-        """Inicializa o engine do jogo"""
-        # Inicialização do pygame
-        pygame.init()
+    def __init__(self, headless: bool = False, seed: Optional[int] = None,
+                 arena: Optional[Tuple[int, int]] = None, food_count: int = FOOD_COUNT,
+                 grid: Optional[OccupancyGrid] = None):
+        """
+        Inicializa o engine do jogo
+        
+        Args:
+            headless: Se True, roda apenas as regras do jogo (sem display),
+                      avançando tick a tick via step()/reset()
+            seed: Semente opcional dos geradores aleatórios da partida
+            arena: Tamanho da arena em células (largura, altura); padrão
+                   ARENA_WIDTH x ARENA_HEIGHT
+            food_count: Comidas simultâneas na arena
+            grid: Grade a adotar (uso de fork()): geradores não são
+                  semeados nem as comidas iniciais spawnadas, o estado de
+                  jogo vem logo depois
+        """
+        self._headless = headless
+        self._verbose = not headless
+        self._logger = get_logger('engine', self._verbose)
+        
+        # Geradores próprios: gameplay (tipos e posições de comida) separado
+        # do cosmético (partículas), então a mesma semente com as mesmas
+        # entradas reproduz a mesma partida, com ou sem renderização
+        self._rng = random.Random()
+        self._effects_rng = random.Random()
+        if grid is None:
+            self._seed_rngs(seed)
+        
+        # Arena: a cobra nasce na posição inicial padrão ou, em arenas
+        # maiores que a tela, no centro
+        self._arena_width, self._arena_height = arena or (ARENA_WIDTH, ARENA_HEIGHT)
+        if (self._arena_width, self._arena_height) == (GRID_WIDTH, GRID_HEIGHT):
+            self._start_position = (INITIAL_SNAKE_X, INITIAL_SNAKE_Y)
+        else:
+            self._start_position = (self._arena_width // 2, self._arena_height // 2)
+        
+        # Sistemas principais (display e fontes apenas no modo gráfico)
+        if headless:
+            self._renderer: Optional[Renderer] = None
+            self._ui_manager: Optional[UIManager] = None
+            self._clock: Optional[Clock] = None
+            self._camera: Optional[Camera] = None
+            self._latency: Optional[LatencyTracker] = None
+        else:
+            enable_background_logging()
+            pygame.init()
+            self._renderer = Renderer(self._effects_rng)
+            self._ui_manager = UIManager()
+            self._clock = pygame.time.Clock()
+            self._camera = Camera(self._arena_width, self._arena_height)
+            self._camera.center_on(self._start_position)
+            self._latency = LatencyTracker()
+        self._last_camera_origin = None
         
-        # Sistemas principais
-        self._renderer = Renderer()
-        self._ui_manager = UIManager()
         self._event_manager = EventManager()
-        self._clock = pygame.time.Clock()
+        
+        # Despachador próprio: vários engines no mesmo processo não
+        # compartilham listeners
+        self._events = GameEventDispatcher()
         
         # Estado do jogo
         self._current_state = GameState.PLAYING
         self._score = 0
         self._level = 1
         self._current_fps = BASE_FPS
+        self._death_cause: Optional[str] = None
         
         # Sistema de nível e efeitos
         self._level_up_notification_timer = 0.0
         self._show_level_up_notification = False
         self._last_level = 1  # Para detectar mudanças de nível
         
-        # Entidades do jogo
-        self._snake = Snake((INITIAL_SNAKE_X, INITIAL_SNAKE_Y))
-        self._food_manager = FoodManager()
+        # Entidades do jogo (compartilham a grade de ocupação da arena)
+        spawn = grid is None
+        self._grid = OccupancyGrid(self._arena_width, self._arena_height) if spawn else grid
+        self._snake = Snake(self._start_position, self._grid)
+        self._food_manager = FoodManager(verbose=self._verbose, grid=self._grid,
+                                         rng=self._rng, effects_rng=self._effects_rng,
+                                         food_count=food_count, spawn=spawn)
         
         # Controle de pausa
         self._paused = False
         
-        # Controle de tempo para efeitos
+        # Piloto automático (criado sob demanda)
+        self._autopilot: Optional[Autopilot] = None
+        self._autopilot_enabled = False
+        
+        # Controle de tempo: o display roda a DISPLAY_FPS e o acumulador
+        # converte o tempo real em ticks de simulação a _current_fps
         self._delta_time = 0.0
-        self._last_time = pygame.time.get_ticks()
+        self._last_time = 0 if headless else pygame.time.get_ticks()
+        self._tick_accumulator = 0.0
+        self._turbo_index = 0
         
         # Setup de eventos
         self._setup_event_listeners()
         
-        print("🐍 Snake Game Engine Inicializado!")
-        self._print_controls()
-        self._print_game_info()
+        self._logger.info("🐍 Snake Game Engine Inicializado!")
+        if self._logger.isEnabledFor(logging.INFO):
+            self._print_controls()
+            self._print_game_info()
+    
+    def _seed_rngs(self, seed: Optional[int]) -> None:
+        """
+        Semeia os geradores de gameplay e cosmético
+        
+        Args:
+            seed: Semente (None = entropia do sistema)
+        """
+        self._rng.seed(seed)
+        self._effects_rng.seed(None if seed is None else f"effects:{seed}")
     
     def _setup_event_listeners(self) -> None:
         """Configura os listeners de eventos do jogo"""
         # Eventos de gameplay
-        game_events.subscribe('food_eaten', self._on_food_eaten)
-        game_events.subscribe('snake_collision', self._on_snake_collision)
-        game_events.subscribe('game_restart', self._on_game_restart)
+        self._events.subscribe(FoodEaten, self._on_food_eaten)
+        self._events.subscribe(SnakeCollision, self._on_snake_collision)
+        self._events.subscribe(GameRestart, self._on_game_restart)
     
     def _print_controls(self) -> None:
         """Imprime os controles do jogo"""
-        print("=== CONTROLES ===")
-        print("🎮 Movimento: Setas ou WASD")
-        print("⏸️  Pausar: SPACE")
-        print("🔄 Reiniciar: R (após game over)")
-        print("❌ Sair: Q ou fechar janela")
-        print("==================")
+        self._logger.info("=== CONTROLES ===")
+        self._logger.info("🎮 Movimento: Setas ou WASD")
+        self._logger.info("⏸️  Pausar: SPACE")
+        self._logger.info("⏩ Turbo: T (alterna 1x/2x/4x/8x)")
+        self._logger.info("🤖 Piloto automático: P")
+        self._logger.info("🔄 Reiniciar: R (após game over)")
+        self._logger.info("❌ Sair: Q ou fechar janela")
+        self._logger.info("==================")
     
     def _print_game_info(self) -> None:
         """Imprime informações sobre as novas features"""
-        print("\n=== NOVAS FEATURES ===")
-        print("🍎 Pontuação: +1 ponto por fruta normal")
-        print("⭐ Especiais: +5 pontos (contorno dourado)")
-        print("🏃‍♀️ Fugitivas: +3 pontos (pisca e foge → vira normal)")
-        print("🪞 Espelhos: +2 pontos (inverte perspectiva!)")
-        print("🚀 Níveis: A cada 10 pontos")
-        print("⚡ Velocidade: Aumenta automaticamente")
-        print("🌈 Efeitos: Grid colorido no level up")
-        print("✨ Efeitos especiais de consumo implementados!")
-        print("=======================")
+        self._logger.info("\n=== NOVAS FEATURES ===")
+        self._logger.info("🍎 Pontuação: +1 ponto por fruta normal")
+        self._logger.info("⭐ Especiais: +5 pontos (contorno dourado)")
+        self._logger.info("🏃‍♀️ Fugitivas: +3 pontos (pisca e foge → vira normal)")
+        self._logger.info("🪞 Espelhos: +2 pontos (inverte perspectiva!)")
+        self._logger.info("🚀 Níveis: A cada 10 pontos")
+        self._logger.info("⚡ Velocidade: Aumenta automaticamente")
+        self._logger.info("🌈 Efeitos: Grid colorido no level up")
+        self._logger.info("✨ Efeitos especiais de consumo implementados!")
+        self._logger.info("=======================")
     
     def _calculate_delta_time(self) -> None:
         """Calcula o tempo decorrido desde o último frame"""
@@ -113,108 +207,169 @@ class GameEngine:
         actions = self._event_manager.process_events()
         
         for action in actions:
-            if action == 'quit':
+            if action == InputAction.QUIT:
                 self._current_state = GameState.QUIT
             
-            elif action == 'pause':
+            elif action == InputAction.PAUSE:
                 if self._current_state == GameState.PLAYING:
                     self._paused = not self._paused
-                    print(f"⏸️ Jogo {'pausado' if self._paused else 'despausado'}")
+                    self._logger.info("⏸️ Jogo %s", 'pausado' if self._paused else 'despausado')
             
-            elif action == 'restart':
+            elif action == InputAction.TURBO:
+                self._turbo_index = (self._turbo_index + 1) % len(TURBO_MULTIPLIERS)
+                self._logger.info("⏩ Turbo: %sx", self.turbo_multiplier)
+            
+            elif action == InputAction.AUTOPILOT:
+                self.set_autopilot(not self._autopilot_enabled)
+                self._logger.info("🤖 Piloto automático %s", 'ligado' if self._autopilot_enabled else 'desligado')
+            
+            elif action == InputAction.RESTART:
                 if self._current_state == GameState.GAME_OVER:
-                    game_events.dispatch('game_restart')
+                    self._events.dispatch(GameRestart())
             
             elif self._current_state == GameState.PLAYING and not self._paused:
-                # Movimento da cobra
+                # Movimento da cobra (enfileirado: uma curva por tick)
                 direction = self._event_manager.get_direction_from_action(action)
-                if direction:
-                    self._snake.change_direction(direction)
+                if (direction is not None and self._snake.change_direction(direction) and
+                        not self._autopilot_enabled):
+                    self._latency.turn_queued(self._event_manager.poll_time)
     
     def _update_game_logic(self) -> None:
-        """Atualiza a lógica do jogo"""
+        """
+        Atualiza a lógica do jogo (uma vez por frame renderizado)
+        
+        Efeitos visuais avançam com o tempo real do frame; as regras do
+        jogo avançam em ticks de período fixo (1 / _current_fps) drenados
+        do acumulador, multiplicados pelo turbo.
+        """
+        # Calcula delta time (sempre, para não acumular tempo durante a pausa)
+        self._calculate_delta_time()
+        frame_time = min(self._delta_time, MAX_FRAME_TIME)
+        
+        # Animações da UI seguem também nas telas de pausa e game over
+        self._ui_manager.update_animations(frame_time)
+        
         if (self._current_state != GameState.PLAYING or 
             self._paused or 
             not self._snake.active):
+            self._tick_accumulator = 0.0
             return
         
-        # Calcula delta time
-        self._calculate_delta_time()
-        
-        # Atualiza efeitos visuais do renderer
-        self._renderer.update_effects(self._delta_time)
+        # Atualiza efeitos visuais na taxa do display
+        self._renderer.update_effects(frame_time)
+        self._food_manager.update_effects(frame_time)
         
         # Atualiza timer da notificação de level up
         if self._show_level_up_notification:
-            self._level_up_notification_timer -= self._delta_time
+            self._level_up_notification_timer -= frame_time
             if self._level_up_notification_timer <= 0:
                 self._show_level_up_notification = False
-                print("✨ Notificação de level up removida")
+                self._logger.debug("✨ Notificação de level up removida")
+        
+        # Drena o acumulador em ticks de período fixo
+        self._tick_accumulator += frame_time * self.turbo_multiplier
+        max_ticks = MAX_TICKS_PER_FRAME * self.turbo_multiplier
+        ticks = 0
+        
+        while ticks < max_ticks:
+            tick_period = 1.0 / self._current_fps
+            if self._tick_accumulator < tick_period:
+                break
+            
+            self._tick_accumulator -= tick_period
+            self._delta_time = tick_period
+            self._simulate_tick()
+            ticks += 1
+            
+            if self._current_state != GameState.PLAYING:
+                self._tick_accumulator = 0.0
+                return
+        
+        # Descarta atraso que não coube no frame (evita espiral de atraso)
+        self._tick_accumulator = min(self._tick_accumulator, 1.0 / self._current_fps)
+    
+    def _interpolation_alpha(self) -> float:
+        """
+        Calcula a fração do tick atual já decorrida
+        
+        Returns:
+            Valor entre 0.0 (último tick) e 1.0 (próximo tick)
+        """
+        if self._current_state != GameState.PLAYING:
+            return 1.0
+        return min(1.0, self._tick_accumulator * self._current_fps)
+    
+    def _simulate_tick(self) -> None:
+        """Executa um tick das regras do jogo (comum aos modos gráfico e headless)"""
+        # Piloto automático decide a direção antes do movimento
+        if self._autopilot_enabled:
+            food = self._food_manager.nearest_food(self._snake.head_position)
+            self._autopilot.steer(self._snake, food.position if food is not None else None)
         
         # Move a cobra
         self._snake.move()
         
-        # Verifica colisões
+        # Verifica colisões e entrega os eventos do tick num único lote,
+        # antes de atualizar as comidas (a maioria dos ticks não tem nenhum)
         self._check_collisions()
+        if self._events.pending:
+            self._events.flush()
         
         # Atualiza sistema de comidas
-        self._food_manager.update(self._delta_time, self._snake.body)
+        self._food_manager.update(self._delta_time, self._snake.body_view)
     
     def _check_collisions(self) -> None:
         """Verifica todas as colisões do jogo"""
         # Colisão com paredes
         if self._snake.check_wall_collision():
-            game_events.dispatch('snake_collision', collision_type='wall')
+            self._events.post(SnakeCollision('wall'))
             return
         
         # Colisão consigo mesma
         if self._snake.check_self_collision():
-            game_events.dispatch('snake_collision', collision_type='self')
+            self._events.post(SnakeCollision('self'))
             return
         
-        # Colisão com comida
-        if self._food_manager.check_collision(self._snake.get_bounds()):
-            # Consome a comida atual
-            points_gained = self._food_manager.consume_current_food()
-            food_type = self._food_manager.get_food_type()
-            
-            # Dispatcha evento com informações da comida
-            game_events.dispatch('food_eaten', 
-                               points=points_gained,
-                               food_type=food_type,
-                               snake_body=self._snake.body)
+        # Colisão com comida (consulta da célula da cabeça no índice)
+        food = self._food_manager.food_at(self._snake.cell)
+        if food is not None:
+            # Consome a comida e enfileira o evento (crescimento e nova
+            # comida acontecem no flush, depois das verificações)
+            points_gained = self._food_manager.consume(food)
+            self._events.post(FoodEaten(points_gained, food.entity_type, self._snake.body_view))
     
     def _render_game(self) -> None:
         """Renderiza todos os elementos do jogo"""
-        # Limpa a tela
-        self._renderer.clear_screen()
+        renderer = self._renderer
         
-        # Desenha o grid de fundo (transparente com efeitos)
-        self._renderer.draw_grid()
+        # Câmera antes do fundo: rolar muda a tela inteira
+        if self._snake.active:
+            self._camera.follow(self._snake.head_position)
+        camera_origin = self._camera.origin
+        camera_moved = camera_origin != self._last_camera_origin
+        self._last_camera_origin = camera_origin
+        
+        # Limpa a tela e desenha o grid (só as áreas do frame anterior no
+        # modo dirty rect; overlays centrais cobrem a tela inteira)
+        renderer.begin_frame(camera_moved or self._paused or
+                             self._show_level_up_notification or
+                             self._current_state == GameState.GAME_OVER)
         
-        # Desenha entidades do jogo
-        self._food_manager.draw(self._renderer.screen)
+        # Desenha entidades do jogo (deslocadas pela câmera)
+        renderer.mark_dirty(self._food_manager.draw(renderer.screen, self._camera.offset,
+                                                    self._camera.bounds))
         
         if self._snake.active:
-            self._snake.draw(self._renderer.screen)
+            renderer.mark_dirty(self._snake.draw(renderer.screen, self._interpolation_alpha(),
+                                                 self._camera))
         
         # Desenha UI
         self._render_ui()
         
-        # Aplica efeitos especiais pós-renderização
-        self._apply_post_effects()
-        
-        # Atualiza display
+        # Efeitos pós-renderização (espelho, flash) e display ficam com o
+        # Renderer; fecha as medições de latência deste flip
         self._renderer.present()
-    
-    def _apply_post_effects(self) -> None:
-        """Aplica efeitos visuais pós-renderização"""
-        # Efeito de espelhamento
-        if self._renderer.is_mirror_effect_active():
-            self._renderer.apply_mirror_transform(self._renderer.screen)
-        
-        # Flash da tela para comidas especiais
-        self._renderer.apply_screen_flash(self._renderer.screen)
+        self._latency.frame_presented(len(self._snake.queued_directions))
     
     def _render_ui(self) -> None:
         """Renderiza a interface do usuário"""
@@ -222,7 +377,7 @@ class GameEngine:
         speed_multiplier = self._current_fps / BASE_FPS
         
         # HUD sempre visível (com informações atualizadas)
-        self._ui_manager.draw_hud(
+        hud_rects = self._ui_manager.draw_hud(
             self._renderer.screen, 
             self._score, 
             self._snake.length,
@@ -230,6 +385,7 @@ class GameEngine:
             speed_multiplier,
             self._food_manager.stats
         )
+        self._renderer.mark_dirty(hud_rects)
         
         # Notificação de level up (centralizada na tela)
         if self._show_level_up_notification:
@@ -247,6 +403,10 @@ class GameEngine:
         
         elif self._paused:
             self._ui_manager.draw_pause_screen(self._renderer.screen)
+        
+        if Debug.SHOW_LATENCY:
+            self._renderer.mark_dirty((self._ui_manager.draw_latency_overlay(
+                self._renderer.screen, self._latency.summary()),))
     
     def _calculate_level_from_score(self) -> int:
         """
@@ -263,22 +423,22 @@ class GameEngine:
         
         Args:
             level: Nível para calcular FPS
-            
+        
         Returns:
             FPS calculado para o nível
         """
         calculated_fps = BASE_FPS * (FPS_INCREASE_PER_LEVEL ** (level - 1))
         return min(MAX_FPS, calculated_fps)
     
-    def _on_food_eaten(self, points: int, food_type, snake_body: list) -> None:
+    def _on_food_eaten(self, event: FoodEaten) -> None:
         """
         Callback quando comida é consumida
         
         Args:
-            points: Pontos obtidos
-            food_type: Tipo da comida consumida
-            snake_body: Corpo atual da cobra
+            event: Pontos, tipo da comida e visão do corpo da cobra
         """
+        points, food_type, snake_body = event
+        
         # Atualiza score baseado nos pontos da comida
         old_score = self._score
         self._score += points
@@ -299,20 +459,23 @@ class GameEngine:
         # Aplica efeitos especiais baseados no tipo de comida
         self._apply_food_consumption_effects(food_type, points)
         
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        
         # Log baseado no tipo de comida
         if food_type.name == 'FOOD_SPECIAL':
-            print(f"⭐ Comida especial consumida! {old_score} → {self._score} pontos")
+            self._logger.info("⭐ Comida especial consumida! %d → %d pontos", old_score, self._score)
         elif food_type.name == 'FOOD_FUGITIVE':
-            print(f"🏃‍♀️ Comida fugitiva capturada! {old_score} → {self._score} pontos")
+            self._logger.info("🏃‍♀️ Comida fugitiva capturada! %d → %d pontos", old_score, self._score)
         elif food_type.name == 'FOOD_MIRROR':
-            print(f"🪞 Comida espelho consumida! {old_score} → {self._score} pontos")
+            self._logger.info("🪞 Comida espelho consumida! %d → %d pontos", old_score, self._score)
         else:
-            print(f"🍎 Comida normal consumida! {old_score} → {self._score} pontos")
+            self._logger.info("🍎 Comida normal consumida! %d → %d pontos", old_score, self._score)
         
         # Mostra progresso para próximo nível
         if new_level <= self._level:
             points_to_next = POINTS_PER_LEVEL - (self._score % POINTS_PER_LEVEL)
-            print(f"🎯 Próximo nível em {points_to_next} pontos")
+            self._logger.info("🎯 Próximo nível em %d pontos", points_to_next)
     
     def _apply_food_consumption_effects(self, food_type, points: int) -> None:
         """
@@ -322,22 +485,25 @@ class GameEngine:
             food_type: Tipo da comida consumida
             points: Pontos obtidos
         """
+        if self._renderer is None:
+            return
+        
         if food_type.name == 'FOOD_SPECIAL':
             # Efeito dourado na tela
             self._renderer.start_screen_flash((255, 215, 0))  # Dourado
-            print("✨ Efeito especial: Flash dourado!")
-            
+            self._logger.debug("✨ Efeito especial: Flash dourado!")
+        
         elif food_type.name == 'FOOD_FUGITIVE':
             # Efeito violeta na tela
             self._renderer.start_screen_flash((138, 43, 226))  # Violeta
-            print("💨 Efeito especial: Flash violeta!")
-            
+            self._logger.debug("💨 Efeito especial: Flash violeta!")
+        
         elif food_type.name == 'FOOD_MIRROR':
             # Efeito de espelhamento + flash ciano
             self._renderer.start_mirror_effect()
             self._renderer.start_screen_flash((0, 255, 255))  # Ciano
-            print("🪞 Efeito especial: Espelhamento da tela!")
-            print("🔄 Perspectiva invertida por alguns instantes!")
+            self._logger.debug("🪞 Efeito especial: Espelhamento da tela!")
+            self._logger.debug("🔄 Perspectiva invertida por alguns instantes!")
     
     def _level_up(self, new_level: int) -> None:
         """
@@ -355,6 +521,9 @@ class GameEngine:
         # Calcula nova velocidade (FPS)
         self._current_fps = self._calculate_fps_for_level(self._level)
         
+        if self._headless:
+            return
+        
         # Ativa efeitos visuais
         self._renderer.start_level_up_effect()
         
@@ -366,51 +535,71 @@ class GameEngine:
         speed_multiplier = self._current_fps / BASE_FPS
         
         # Log celebratório
-        print(f"\n🎉 === LEVEL UP! === 🎉")
-        print(f"📈 Nível: {old_level} → {new_level}")
-        print(f"⚡ FPS: {old_fps:.1f} → {self._current_fps:.1f}")
-        print(f"🚀 Velocidade: {speed_multiplier:.2f}x")
-        print(f"🌈 Efeito visual ativo por {Effects.LEVEL_UP_FLASH_DURATION}s")
-        print(f"🎯 Próximo nível em {POINTS_PER_LEVEL} pontos")
-        print("=" * 25 + "\n")
+        log = self._logger.info
+        log("\n🎉 === LEVEL UP! === 🎉")
+        log("📈 Nível: %d → %d", old_level, new_level)
+        log("⚡ FPS: %.1f → %.1f", old_fps, self._current_fps)
+        log("🚀 Velocidade: %.2fx", speed_multiplier)
+        log("🌈 Efeito visual ativo por %ss", Effects.LEVEL_UP_FLASH_DURATION)
+        log("🎯 Próximo nível em %d pontos", POINTS_PER_LEVEL)
+        log("%s\n", "=" * 25)
     
-    def _on_snake_collision(self, collision_type: str) -> None:
+    def _on_snake_collision(self, event: SnakeCollision) -> None:
         """
         Callback quando cobra colide
         
         Args:
-            collision_type: Tipo de colisão ('wall' ou 'self')
+            event: Tipo de colisão ('wall' ou 'self')
         """
+        collision_type = event.collision_type
+        
+        # Muda estado para game over
+        self._current_state = GameState.GAME_OVER
+        self._death_cause = collision_type
+        self._snake.deactivate()
+        
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        
         # Calcula estatísticas finais
         final_speed = self._current_fps / BASE_FPS
         
         # Mostra estatísticas de comidas
         self._food_manager.print_statistics()
         
-        print(f"\n💀 === GAME OVER === 💀")
-        print(f"☠️ Causa: Colisão com {'parede' if collision_type == 'wall' else 'próprio corpo'}")
-        print(f"📊 Score final: {self._score} pontos")
-        print(f"🎯 Nível alcançado: {self._level}")
-        print(f"📏 Tamanho final: {self._snake.length} segmentos")
-        print(f"⚡ Velocidade final: {self._current_fps:.1f} FPS ({final_speed:.2f}x)")
-        print("=" * 25 + "\n")
-        
-        # Muda estado para game over
-        self._current_state = GameState.GAME_OVER
-        self._snake.deactivate()
+        log = self._logger.info
+        log("\n💀 === GAME OVER === 💀")
+        log("☠️ Causa: Colisão com %s", 'parede' if collision_type == 'wall' else 'próprio corpo')
+        log("📊 Score final: %d pontos", self._score)
+        log("🎯 Nível alcançado: %d", self._level)
+        log("📏 Tamanho final: %d segmentos", self._snake.length)
+        log("⚡ Velocidade final: %.1f FPS (%.2fx)", self._current_fps, final_speed)
+        log("%s\n", "=" * 25)
     
-    def _on_game_restart(self) -> None:
-        """Callback para reiniciar o jogo"""
-        print("🔄 === REINICIANDO JOGO === 🔄")
+    def _on_game_restart(self, event: GameRestart) -> None:
+        """
+        Callback para reiniciar o jogo
         
-        # Reseta entidades
-        self._snake.reset((INITIAL_SNAKE_X, INITIAL_SNAKE_Y))
+        Args:
+            event: Evento de reinício
+        """
+        self._logger.info("🔄 === REINICIANDO JOGO === 🔄")
+        
+        # Reseta entidades sobre uma grade limpa: a ordem do índice de
+        # livres decide os sorteios, então não pode herdar a partida anterior
+        self._grid.clear()
+        self._snake.reset(self._start_position)
+        if self._latency is not None:
+            self._latency.discard_pending()
         self._food_manager.reset()
+        if self._camera is not None:
+            self._camera.center_on(self._start_position)
         
         # Reseta estado do jogo
         self._score = 0
         self._level = 1
         self._current_fps = BASE_FPS
+        self._death_cause = None
         self._paused = False
         self._current_state = GameState.PLAYING
         
@@ -420,12 +609,14 @@ class GameEngine:
         self._last_level = 1
         
         # Reseta tempo
-        self._last_time = pygame.time.get_ticks()
-        
-        print("✅ Jogo reiniciado com sucesso!")
-        print(f"🎮 Estado inicial: Nível 1, {BASE_FPS} FPS")
-        print("🎯 Colete 10 frutas para o primeiro level up!")
-        print("=" * 35 + "\n")
+        self._last_time = 0 if self._headless else pygame.time.get_ticks()
+        self._tick_accumulator = 0.0
+        
+        log = self._logger.info
+        log("✅ Jogo reiniciado com sucesso!")
+        log("🎮 Estado inicial: Nível 1, %s FPS", BASE_FPS)
+        log("🎯 Colete 10 frutas para o primeiro level up!")
+        log("%s\n", "=" * 35)
     
     def _print_current_status(self) -> None:
         """Imprime status atual do jogo (debug)"""
@@ -433,22 +624,156 @@ class GameEngine:
             speed_mult = self._current_fps / BASE_FPS
             points_to_next = POINTS_PER_LEVEL - (self._score % POINTS_PER_LEVEL)
             
-            print(f"📊 Status: Score {self._score} | Nível {self._level} | " +
-                  f"Velocidade {speed_mult:.2f}x | Próximo nível em {points_to_next}")
+            self._logger.debug("📊 Status: Score %d | Nível %d | Velocidade %.2fx | Próximo nível em %d",
+                               self._score, self._level, speed_mult, points_to_next)
+    
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Reinicia a partida (API headless)
+        
+        Args:
+            seed: Semente opcional para reproduzir a partida
+        """
+        if seed is not None:
+            self._seed_rngs(seed)
+        
+        self._events.dispatch(GameRestart())
+    
+    def snapshot(self) -> GameSnapshot:
+        """
+        Captura o estado completo de jogo em bytes empacotados
+        
+        Inclui cobra, comida, estatísticas, score, nível, causa da morte e
+        o gerador de gameplay (a grade de ocupação é refeita a partir
+        deles): restaurar e repetir as mesmas ações reproduz a mesma partida.
+        
+        Returns:
+            Snapshot imutável
+        """
+        snake_state, body = self._snake.snapshot()
+        return GameSnapshot(
+            _ENGINE_STATE.pack(self._score, self._level, self._current_fps,
+                               _GAME_STATES.index(self._current_state), self._paused,
+                               _DEATH_CAUSES.index(self._death_cause)),
+            snake_state,
+            body,
+            self._food_manager.snapshot(),
+            self._rng.getstate()
+        )
+    
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Restaura um estado gerado por snapshot() (deste ou de outro engine)
+        
+        Args:
+            snapshot: Snapshot a restaurar
+        """
+        # A criação de comidas mexe na grade e no gerador: ambos por último
+        self._restore_entities(snapshot)
+        self._grid.rebuild(snapshot.body, self._food_manager.foods)
+        self._rng.setstate(snapshot.rng)
+        
+        if self._autopilot is not None:
+            self._autopilot.invalidate()
+        if self._latency is not None:
+            self._latency.discard_pending()
+    
+    def _restore_entities(self, snapshot: GameSnapshot) -> None:
+        """
+        Restaura escalares, comidas e cobra (sem a grade e o gerador)
+        
+        Args:
+            snapshot: Snapshot a restaurar
+        """
+        score, level, fps, state, paused, death_cause = _ENGINE_STATE.unpack(snapshot.engine)
+        self._score = score
+        self._level = level
+        self._last_level = level
+        self._current_fps = fps
+        self._current_state = _GAME_STATES[state]
+        self._paused = bool(paused)
+        self._death_cause = _DEATH_CAUSES[death_cause]
+        
+        self._food_manager.restore(snapshot.food)
+        self._snake.restore((snapshot.snake, snapshot.body))
+    
+    def fork(self) -> 'GameEngine':
+        """
+        Cria um engine headless independente no mesmo estado de jogo
+        
+        O clone nasce sem spawnar comidas e recebe cópias diretas dos
+        buffers da grade, sem refazê-la célula a célula.
+        
+        Returns:
+            Novo engine (alterações em um não afetam o outro)
+        """
+        clone = GameEngine(headless=True, arena=self.arena_size,
+                           food_count=self._food_manager.food_count, grid=self._grid.copy())
+        snapshot = self.snapshot()
+        clone._restore_entities(snapshot)
+        
+        # Descarta as marcações feitas pela criação das comidas do clone
+        clone._grid.copy_from(self._grid)
+        clone._rng.setstate(snapshot.rng)
+        clone._effects_rng.setstate(self._effects_rng.getstate())
+        return clone
+    
+    def set_autopilot(self, enabled: bool) -> None:
+        """
+        Liga ou desliga o piloto automático (sobrepõe a direção a cada tick)
+        
+        Args:
+            enabled: Se o piloto controla a cobra
+        """
+        self._autopilot_enabled = enabled
+        self.autopilot.invalidate()
+        
+        # Curvas do jogador na fila serão descartadas pelo piloto
+        if self._latency is not None:
+            self._latency.discard_pending()
+    
+    def step(self, action: Optional[Direction] = None) -> Tuple[int, bool]:
+        """
+        Avança a simulação em exatamente um tick (API headless)
+        
+        Não processa eventos, não renderiza e não limita o framerate:
+        o tempo simulado por tick é o período do nível atual.
+        
+        Args:
+            action: Nova direção da cobra (None mantém a atual)
+        
+        Returns:
+            Tupla (pontos obtidos no tick, se o jogo terminou)
+        """
+        if self._current_state != GameState.PLAYING or not self._snake.active:
+            return 0, True
+        
+        if action is not None:
+            self._snake.change_direction(action)
+        
+        score_before = self._score
+        self._delta_time = 1.0 / self._current_fps
+        self._simulate_tick()
+        self._food_manager.update_effects(self._delta_time)
+        
+        return self._score - score_before, self._current_state == GameState.GAME_OVER
     
     def run(self) -> None:
         """
         Loop principal do jogo
         
-        Implementa o padrão Game Loop otimizado:
-        1. Processar entrada
-        2. Atualizar lógica  
-        3. Renderizar
-        4. Controlar framerate dinâmico
+        Implementa o padrão Game Loop de passo fixo:
+        1. Processar entrada (a cada frame)
+        2. Atualizar lógica (ticks fixos drenados do acumulador)
+        3. Renderizar (com interpolação entre ticks)
+        4. Limitar o framerate à taxa do display
         """
-        print("🚀 Iniciando Snake Game com features avançadas...")
-        print("🌈 Grid transparente e efeitos visuais ativados!")
-        print("⚡ Sistema de velocidade dinâmica configurado!")
+        if self._headless:
+            raise RuntimeError("run() requer modo gráfico; use step()/reset() no modo headless")
+        
+        self._logger.info("🚀 Iniciando Snake Game com features avançadas...")
+        self._logger.info("🌈 Grid transparente e efeitos visuais ativados!")
+        self._logger.info("⚡ Sistema de velocidade dinâmica configurado!")
         
         try:
             while (self._event_manager.is_running() and 
@@ -463,16 +788,14 @@ class GameEngine:
                 # 3. Renderizar todos os elementos
                 self._render_game()
                 
-                # 4. Controlar framerate (dinâmico baseado no nível)
-                self._clock.tick(self._current_fps)
+                # 4. Controlar framerate (taxa do display, não do jogo)
+                self._clock.tick(DISPLAY_FPS)
         
         except KeyboardInterrupt:
-            print("\n⏹️ Jogo interrompido pelo usuário")
+            self._logger.info("\n⏹️ Jogo interrompido pelo usuário")
         
         except Exception as e:
-            print(f"❌ Erro durante execução: {e}")
-            import traceback
-            traceback.print_exc()
+            self._logger.exception("❌ Erro durante execução: %s", e)
             raise
         
         finally:
@@ -480,7 +803,10 @@ class GameEngine:
     
     def _cleanup(self) -> None:
         """Limpa recursos e finaliza o jogo"""
-        print("🧹 Limpando recursos do game engine...")
+        if self._headless:
+            return
+        
+        self._logger.info("🧹 Limpando recursos do game engine...")
         
         # Cleanup dos sistemas
         self._renderer.cleanup()
@@ -489,7 +815,8 @@ class GameEngine:
         # Finaliza pygame
         pygame.quit()
         
-        print("👋 Snake Game Engine finalizado com sucesso!")
+        self._logger.info("👋 Snake Game Engine finalizado com sucesso!")
+        flush_logging()
     
     # Properties para acesso ao estado do jogo
     @property
@@ -517,6 +844,73 @@ class GameEngine:
         """Retorna o multiplicador de velocidade atual"""
         return self._current_fps / BASE_FPS
     
+    @property
+    def turbo_multiplier(self) -> int:
+        """Retorna quantos ticks de simulação rodam por período do nível"""
+        return TURBO_MULTIPLIERS[self._turbo_index]
+    
+    @property
+    def rng(self) -> random.Random:
+        """Retorna o gerador de gameplay da partida"""
+        return self._rng
+    
+    @property
+    def grid(self) -> OccupancyGrid:
+        """Retorna a grade de ocupação da arena"""
+        return self._grid
+    
+    @property
+    def arena_size(self) -> Tuple[int, int]:
+        """Retorna o tamanho da arena em células (largura, altura)"""
+        return self._arena_width, self._arena_height
+    
+    @property
+    def is_headless(self) -> bool:
+        """Retorna se o engine está no modo headless"""
+        return self._headless
+    
+    @property
+    def snake_length(self) -> int:
+        """Retorna o comprimento atual da cobra"""
+        return self._snake.length
+    
+    @property
+    def snake(self) -> Snake:
+        """Retorna a cobra (para leitura por wrappers e ferramentas)"""
+        return self._snake
+    
+    @property
+    def food_manager(self) -> FoodManager:
+        """Retorna o gerenciador de comidas (para leitura por wrappers e ferramentas)"""
+        return self._food_manager
+    
+    @property
+    def autopilot(self) -> Autopilot:
+        """Retorna o piloto automático da arena (criado no primeiro acesso)"""
+        if self._autopilot is None:
+            self._autopilot = Autopilot(self._grid)
+        return self._autopilot
+    
+    @property
+    def autopilot_enabled(self) -> bool:
+        """Retorna se o piloto automático está controlando a cobra"""
+        return self._autopilot_enabled
+    
+    @property
+    def event_stats(self) -> dict:
+        """Retorna, por evento, (entregas, segundos gastos nos listeners)"""
+        return self._events.stats
+    
+    @property
+    def latency(self) -> Optional[LatencyTracker]:
+        """Retorna o medidor de latência tecla → tela (None no modo headless)"""
+        return self._latency
+    
+    @property
+    def death_cause(self) -> Optional[str]:
+        """Retorna a causa do último game over ('wall', 'self') ou None"""
+        return self._death_cause
+    
     @property
     def is_paused(self) -> bool:
         """Retorna se o jogo está pausado"""
@@ -0,0 +1,127 @@
+"""
+Medição de latência entrada → tela
+Acompanha cada curva desde a leitura da tecla até o primeiro flip que
+mostra a cobra virando e publica percentis (p50/p95/p99)
+"""
+
+import json
+import math
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import Deque, Dict, List, Optional
+from config.settings import Debug, DISPLAY_FPS
+
+PERCENTILES = (50, 95, 99)
+
+class LatencyTracker:
+    """
+    Latência de entrada até a apresentação do frame
+    
+    O caminho de uma curva tem três marcos: a leitura da tecla em
+    EventManager.process_events, o tick em que a curva sai da fila da
+    cobra (Snake.move) e o Renderer.present seguinte, cujo flip é o
+    primeiro a mostrar o resultado. As curvas aceitas entram numa fila
+    paralela à da cobra; a cada frame, as que saíram da fila da cobra
+    viram amostras com o horário do flip.
+    
+    Guarda as últimas Debug.LATENCY_SAMPLES amostras (em ms) e recalcula
+    os percentis só quando chegam amostras novas.
+    """
+    
+    def __init__(self, max_samples: int = Debug.LATENCY_SAMPLES):
+        """
+        Inicializa o medidor
+        
+        Args:
+            max_samples: Amostras mantidas (as mais antigas saem primeiro)
+        """
+        self._pending: Deque[float] = deque()
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._total_samples = 0
+        self._summary: Optional[Dict[str, float]] = None
+    
+    def turn_queued(self, pressed_at: float) -> None:
+        """
+        Registra uma curva aceita pela fila da cobra
+        
+        Args:
+            pressed_at: Horário (perf_counter) em que a tecla foi lida
+        """
+        self._pending.append(pressed_at)
+    
+    def frame_presented(self, queued_turns: int) -> None:
+        """
+        Fecha as amostras das curvas aplicadas antes deste flip
+        
+        Chamado logo depois de Renderer.present.
+        
+        Args:
+            queued_turns: Curvas ainda na fila da cobra
+        """
+        pending = self._pending
+        if len(pending) <= queued_turns:
+            return
+        
+        presented_at = perf_counter()
+        while len(pending) > queued_turns:
+            self._samples.append((presented_at - pending.popleft()) * 1000.0)
+            self._total_samples += 1
+        self._summary = None
+    
+    def discard_pending(self) -> None:
+        """Esquece curvas que nunca chegarão à tela (reinício, piloto automático)"""
+        self._pending.clear()
+    
+    def _percentile(self, ordered: List[float], percentile: int) -> float:
+        """
+        Percentil pelo método do posto mais próximo
+        
+        Args:
+            ordered: Amostras em ordem crescente (não vazia)
+            percentile: Percentil entre 0 e 100
+        
+        Returns:
+            Amostra no percentil
+        """
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+    
+    def summary(self) -> Dict[str, float]:
+        """
+        Resume as amostras recentes
+        
+        Returns:
+            Dicionário com 'samples', 'p50', 'p95', 'p99' e 'max' (ms);
+            só 'samples' quando ainda não há medições
+        """
+        if self._summary is None:
+            ordered = sorted(self._samples)
+            summary = {'samples': len(ordered)}
+            if ordered:
+                for percentile in PERCENTILES:
+                    summary[f'p{percentile}'] = self._percentile(ordered, percentile)
+                summary['max'] = ordered[-1]
+            self._summary = summary
+        return self._summary
+    
+    def dump(self, path: Path) -> None:
+        """
+        Grava resumo e amostras em JSON
+        
+        Args:
+            path: Arquivo de saída
+        """
+        report = {
+            'unit': 'ms',
+            'display_fps': DISPLAY_FPS,
+            'total_samples': self._total_samples,
+            'summary': self.summary(),
+            'samples': [round(sample, 3) for sample in self._samples]
+        }
+        Path(path).write_text(json.dumps(report, indent=2))
+    
+    @property
+    def total_samples(self) -> int:
+        """Retorna quantas curvas foram medidas desde o início"""
+        return self._total_samples
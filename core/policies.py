@@ -0,0 +1,116 @@
+"""
+Políticas de controle para partidas headless
+Uma política recebe o engine e um gerador próprio e devolve a próxima
+direção (ou None para manter a atual)
+"""
+
+import importlib
+import random
+from typing import Callable, Optional
+from utils.enums import Direction
+from utils.occupancy_grid import CELL_SNAKE, CELL_WALL
+
+Policy = Callable[['GameEngine', random.Random], Optional[Direction]]
+
+DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+def random_turns(engine: 'GameEngine', rng: random.Random, turn_chance: float = 0.1) -> Optional[Direction]:
+    """
+    Vira para uma direção aleatória com probabilidade fixa
+    
+    Args:
+        engine: Engine da partida
+        rng: Gerador da política
+        turn_chance: Probabilidade de virar no tick
+    
+    Returns:
+        Nova direção ou None
+    """
+    if rng.random() < turn_chance:
+        return rng.choice(DIRECTIONS)
+    return None
+
+def greedy(engine: 'GameEngine', rng: random.Random) -> Optional[Direction]:
+    """
+    Aproxima-se da comida mais próxima evitando paredes e o próprio corpo no próximo passo
+    
+    Args:
+        engine: Engine da partida
+        rng: Gerador da política (desempate entre direções equivalentes)
+    
+    Returns:
+        Direção escolhida ou None se nenhuma é segura
+    """
+    snake = engine.snake
+    grid = engine.grid
+    head_x, head_y = snake.head_position
+    food = engine.food_manager.nearest_food((head_x, head_y))
+    target = food.position if food is not None else (head_x, head_y)
+    
+    best_directions = []
+    best_distance = None
+    for direction in DIRECTIONS:
+        if direction == snake.direction.opposite:
+            continue
+        
+        dx, dy = direction.value
+        cell = (head_x + dx, head_y + dy)
+        if grid.get(cell) & (CELL_SNAKE | CELL_WALL):
+            continue
+        
+        distance = abs(cell[0] - target[0]) + abs(cell[1] - target[1])
+        if best_distance is None or distance < best_distance:
+            best_directions = [direction]
+            best_distance = distance
+        elif distance == best_distance:
+            best_directions.append(direction)
+    
+    if not best_directions:
+        return None
+    return rng.choice(best_directions)
+
+def autopilot(engine: 'GameEngine', rng: random.Random) -> Optional[Direction]:
+    """
+    Delega ao piloto automático do engine (A*, cauda e ciclo hamiltoniano)
+    
+    Args:
+        engine: Engine da partida
+        rng: Gerador da política (não usado: o piloto é determinístico)
+    
+    Returns:
+        Direção escolhida ou None
+    """
+    food = engine.food_manager.nearest_food(engine.snake.head_position)
+    return engine.autopilot.decide(engine.snake, food.position if food is not None else None)
+
+BUILTIN_POLICIES = {
+    'random': random_turns,
+    'greedy': greedy,
+    'autopilot': autopilot,
+}
+
+def load_policy(spec: str) -> Policy:
+    """
+    Resolve uma política pelo nome embutido ou por 'modulo:funcao'
+    
+    Args:
+        spec: Nome em BUILTIN_POLICIES ou caminho 'pacote.modulo:funcao'
+    
+    Returns:
+        Função de política
+    
+    Raises:
+        ValueError: Se a especificação não aponta para uma função
+    """
+    if spec in BUILTIN_POLICIES:
+        return BUILTIN_POLICIES[spec]
+    
+    module_name, _, function_name = spec.partition(':')
+    if not module_name or not function_name:
+        raise ValueError(f"Política inválida '{spec}': use um nome embutido "
+                         f"({', '.join(BUILTIN_POLICIES)}) ou 'modulo:funcao'")
+    
+    policy = getattr(importlib.import_module(module_name), function_name, None)
+    if not callable(policy):
+        raise ValueError(f"Política '{spec}' não é uma função")
+    return policy
@@ -0,0 +1,90 @@
+"""
+Snapshot compacto do estado de uma partida
+Usado por agentes de busca para clonar e restaurar partidas
+"""
+
+import math
+import struct
+from array import array
+from itertools import chain
+from typing import NamedTuple, Tuple
+from utils.types import Position
+
+# Serialização: tamanhos das 4 primeiras partes, depois o gerador
+# (versão, gauss_next com NaN = None e o estado interno em uint32)
+_LAYOUT = struct.Struct('<4I')
+_RNG = struct.Struct('<Id')
+
+class GameSnapshot(NamedTuple):
+    """
+    Estado completo de jogo, imutável e sem cópia profunda
+    
+    Escalares e comida vão empacotados em bytes; o corpo é uma tupla que
+    só referencia as posições (imutáveis) da cobra e o gerador guarda a
+    tupla de getstate(). A grade de ocupação não entra: ela é refeita a
+    partir do corpo e das comidas, então o tamanho acompanha a partida e
+    não a área da arena. to_bytes() gera a forma totalmente empacotada
+    (corpo em int16) para guardar ou transmitir.
+    
+    Efeitos puramente cosméticos (partículas, flashes, animações) não
+    fazem parte do estado.
+    """
+    engine: bytes                    # score, nível, FPS, estado, pausa e causa da morte
+    snake: bytes                     # direção, flags, cauda anterior e curvas
+    body: Tuple[Position, ...]       # corpo da cabeça para a cauda
+    food: bytes                      # comida atual e estatísticas
+    rng: tuple                       # estado do gerador de gameplay
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializa o snapshot em um único bloco de bytes
+        
+        Returns:
+            Bytes no formato lido por from_bytes()
+        """
+        body = array('h', chain.from_iterable(self.body)).tobytes()
+        version, internal_state, gauss_next = self.rng
+        rng = (_RNG.pack(version, math.nan if gauss_next is None else gauss_next) +
+               array('I', internal_state).tobytes())
+        
+        parts = (self.engine, self.snake, body, self.food)
+        return _LAYOUT.pack(*(len(part) for part in parts)) + b''.join(parts) + rng
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GameSnapshot':
+        """
+        Reconstrói um snapshot serializado por to_bytes()
+        
+        Args:
+            data: Bytes gerados por to_bytes()
+        
+        Returns:
+            Snapshot equivalente ao original
+        """
+        sizes = _LAYOUT.unpack_from(data)
+        view = memoryview(data)
+        offset = _LAYOUT.size
+        parts = []
+        for size in sizes:
+            parts.append(bytes(view[offset:offset + size]))
+            offset += size
+        
+        engine, snake, packed_body, food = parts
+        
+        coordinates = array('h')
+        coordinates.frombytes(packed_body)
+        values = iter(coordinates)
+        body = tuple(zip(values, values))
+        
+        version, gauss_next = _RNG.unpack_from(data, offset)
+        internal_state = array('I')
+        internal_state.frombytes(view[offset + _RNG.size:])
+        rng = (version, tuple(internal_state), None if math.isnan(gauss_next) else gauss_next)
+        
+        return cls(engine, snake, body, food, rng)
+    
+    @property
+    def nbytes(self) -> int:
+        """Retorna o tamanho da forma serializada por to_bytes()"""
+        return (_LAYOUT.size + len(self.engine) + len(self.snake) + 4 * len(self.body) +
+                len(self.food) + _RNG.size + 4 * len(self.rng[1]))
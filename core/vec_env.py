@@ -0,0 +1,356 @@
+"""
+Ambiente vetorizado: N partidas de Snake avançando juntas em NumPy
+Usado para treino em lote (RL), sem pygame e sem objetos por partida
+Requer numpy (dependência opcional)
+"""
+
+from typing import Optional, Tuple
+from utils.enums import Direction
+from utils.occupancy_grid import CELL_SNAKE, CELL_FOOD, CELL_WALL
+from config.settings import (
+    GRID_WIDTH, GRID_HEIGHT, INITIAL_SNAKE_X, INITIAL_SNAKE_Y,
+    POINTS_PER_FOOD, POINTS_PER_LEVEL, SPECIAL_FOOD_POINTS, FUGITIVE_FOOD_POINTS,
+    MIRROR_FOOD_POINTS, SPECIAL_FOOD_SPAWN_CHANCE, FUGITIVE_FOOD_SPAWN_CHANCE,
+    MIRROR_FOOD_SPAWN_CHANCE
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy só é necessário para o ambiente vetorizado
+    np = None
+
+# Códigos de ação (a oposta de cada direção é código ^ 1)
+ACTION_NONE: int = -1
+ACTION_DIRECTIONS: Tuple[Direction, ...] = (
+    Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT
+)
+
+# Códigos de tipo de comida (índices de FOOD_POINTS)
+FOOD_NORMAL: int = 0
+FOOD_SPECIAL: int = 1
+FOOD_FUGITIVE: int = 2
+FOOD_MIRROR: int = 3
+FOOD_POINTS: Tuple[int, ...] = (
+    POINTS_PER_FOOD, SPECIAL_FOOD_POINTS, FUGITIVE_FOOD_POINTS, MIRROR_FOOD_POINTS
+)
+
+# Borda de parede com 2 células: o losango de perigo da fugitiva
+# (raio 2) nunca sai do buffer nem dá a volta para a linha vizinha
+PADDING: int = 2
+FUGITIVE_DANGER_RADIUS: int = 2
+SPAWN_ATTEMPTS: int = 8
+
+class SnakeVecEnv:
+    """
+    N partidas de Snake em arrays NumPy, avançadas em lockstep
+    
+    Estado por partida:
+    - Grade de ocupação achatada (mesmas flags de OccupancyGrid)
+    - Corpo em buffer circular de índices da grade (cabeça em head_ptr)
+    - Direção, célula e tipo da comida, score e crescimento pendente
+    
+    Regras equivalentes ao GameEngine: movimento, colisão com parede e
+    com o próprio corpo, pontos por tipo de comida (_on_food_eaten),
+    crescimento no tick seguinte e sorteio do tipo com as chances de
+    config/settings.py. A fuga da comida fugitiva é aproximada: quando
+    a cobra entra no losango de raio 2, a comida salta para uma célula
+    livre sorteada (em vez da mais distante) e vira comida normal.
+    
+    Partidas terminadas são reiniciadas automaticamente no mesmo step.
+    """
+    
+    def __init__(self, num_envs: int, width: int = GRID_WIDTH, height: int = GRID_HEIGHT,
+                 seed: Optional[int] = None):
+        """
+        Inicializa o ambiente vetorizado
+        
+        Args:
+            num_envs: Número de partidas simultâneas
+            width: Largura da área jogável
+            height: Altura da área jogável
+            seed: Semente do gerador NumPy
+        """
+        if np is None:
+            raise ImportError("SnakeVecEnv requer numpy (pip install numpy)")
+        
+        self._num_envs = num_envs
+        self._width = width
+        self._height = height
+        self._stride = width + 2 * PADDING
+        self._cells = self._stride * (height + 2 * PADDING)
+        self._capacity = width * height
+        self._rng = np.random.default_rng(seed)
+        
+        self._env_ids = np.arange(num_envs)
+        self._grid_base = self._env_ids * self._cells
+        self._body_base = self._env_ids * self._capacity
+        
+        # Deltas de índice por código de ação (UP, DOWN, LEFT, RIGHT)
+        self._deltas = np.array([-self._stride, self._stride, -1, 1], dtype=np.int64)
+        self._food_points = np.array(FOOD_POINTS, dtype=np.int32)
+        self._food_thresholds = np.cumsum([
+            MIRROR_FOOD_SPAWN_CHANCE, FUGITIVE_FOOD_SPAWN_CHANCE, SPECIAL_FOOD_SPAWN_CHANCE
+        ])
+        self._food_buckets = np.array([FOOD_MIRROR, FOOD_FUGITIVE, FOOD_SPECIAL, FOOD_NORMAL])
+        self._danger_offsets = np.array([
+            dy * self._stride + dx
+            for dy in range(-FUGITIVE_DANGER_RADIUS, FUGITIVE_DANGER_RADIUS + 1)
+            for dx in range(-FUGITIVE_DANGER_RADIUS, FUGITIVE_DANGER_RADIUS + 1)
+            if abs(dx) + abs(dy) <= FUGITIVE_DANGER_RADIUS
+        ], dtype=np.int64)
+        
+        # Grade vazia com paredes (copiada a cada reset)
+        template = np.full((height + 2 * PADDING, self._stride), CELL_WALL, dtype=np.uint8)
+        template[PADDING:PADDING + height, PADDING:PADDING + width] = 0
+        self._template = template.ravel()
+        self._start_cell = self.cell_index(INITIAL_SNAKE_X, INITIAL_SNAKE_Y)
+        
+        # Estado das partidas
+        self._grid = np.empty(num_envs * self._cells, dtype=np.uint8)
+        self._body = np.zeros(num_envs * self._capacity, dtype=np.int64)
+        self._head_ptr = np.zeros(num_envs, dtype=np.int64)
+        self._length = np.ones(num_envs, dtype=np.int64)
+        self._direction = np.full(num_envs, ACTION_DIRECTIONS.index(Direction.RIGHT), dtype=np.int64)
+        self._grow = np.zeros(num_envs, dtype=bool)
+        self._food_cell = np.full(num_envs, -1, dtype=np.int64)
+        self._food_type = np.zeros(num_envs, dtype=np.int64)
+        self._score = np.zeros(num_envs, dtype=np.int64)
+        self._final_score = np.zeros(num_envs, dtype=np.int64)
+        
+        self.reset()
+    
+    def cell_index(self, x: int, y: int) -> int:
+        """
+        Converte posição do grid em índice na grade de uma partida
+        
+        Args:
+            x: Coluna na área jogável
+            y: Linha na área jogável
+        
+        Returns:
+            Índice na grade achatada da partida
+        """
+        return (y + PADDING) * self._stride + x + PADDING
+    
+    def reset(self, env_ids=None) -> None:
+        """
+        Reinicia partidas
+        
+        Args:
+            env_ids: Índices das partidas a reiniciar (None = todas)
+        """
+        if env_ids is None:
+            env_ids = self._env_ids
+        env_ids = np.asarray(env_ids, dtype=np.int64)
+        if env_ids.size == 0:
+            return
+        
+        grid = self._grid.reshape(self._num_envs, self._cells)
+        grid[env_ids] = self._template
+        
+        self._head_ptr[env_ids] = 0
+        self._length[env_ids] = 1
+        self._body[self._body_base[env_ids]] = self._start_cell
+        self._grid[self._grid_base[env_ids] + self._start_cell] = CELL_SNAKE
+        self._direction[env_ids] = ACTION_DIRECTIONS.index(Direction.RIGHT)
+        self._grow[env_ids] = False
+        self._score[env_ids] = 0
+        
+        self._food_type[env_ids] = FOOD_NORMAL
+        self._place_food(env_ids)
+    
+    def _sample_free_cells(self, env_ids):
+        """
+        Sorteia uma célula livre por partida
+        
+        Tentativas vetorizadas por rejeição; as partidas que falharem
+        (tabuleiro quase cheio) caem na busca exata pelas células livres.
+        
+        Args:
+            env_ids: Índices das partidas
+        
+        Returns:
+            Array de índices de célula (-1 se a partida não tem célula livre)
+        """
+        cells = np.full(env_ids.size, -1, dtype=np.int64)
+        pending = np.arange(env_ids.size)
+        
+        for _ in range(SPAWN_ATTEMPTS):
+            xs = self._rng.integers(0, self._width, size=pending.size)
+            ys = self._rng.integers(0, self._height, size=pending.size)
+            candidates = (ys + PADDING) * self._stride + xs + PADDING
+            free = self._grid[self._grid_base[env_ids[pending]] + candidates] == 0
+            cells[pending[free]] = candidates[free]
+            pending = pending[~free]
+            if pending.size == 0:
+                return cells
+        
+        grid = self._grid.reshape(self._num_envs, self._cells)
+        for slot in pending:
+            free_cells = np.flatnonzero(grid[env_ids[slot]] == 0)
+            if free_cells.size:
+                cells[slot] = self._rng.choice(free_cells)
+        
+        return cells
+    
+    def _place_food(self, env_ids) -> None:
+        """
+        Posiciona a comida das partidas em células livres
+        
+        Args:
+            env_ids: Índices das partidas
+        """
+        cells = self._sample_free_cells(env_ids)
+        self._food_cell[env_ids] = cells
+        placed = cells >= 0
+        self._grid[self._grid_base[env_ids[placed]] + cells[placed]] |= CELL_FOOD
+    
+    def _sample_food_types(self, count: int):
+        """
+        Sorteia tipos de comida (ordem do FoodManager: espelho > fugitiva > especial)
+        
+        Args:
+            count: Número de sorteios
+        
+        Returns:
+            Array de códigos de tipo de comida
+        """
+        rolls = self._rng.random(count)
+        return self._food_buckets[np.searchsorted(self._food_thresholds, rolls, side='right')]
+    
+    def step(self, actions) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Avança todas as partidas em um tick
+        
+        Args:
+            actions: Array[N] de códigos de ação (índices de
+                ACTION_DIRECTIONS ou ACTION_NONE para manter a direção)
+        
+        Returns:
+            Tupla (pontos obtidos no tick [N], partidas terminadas [N]);
+            as terminadas já voltam reiniciadas e o score final fica em
+            final_scores
+        
+        Raises:
+            ValueError: Código de ação fora de ACTION_DIRECTIONS e ACTION_NONE
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.size and (actions.min() < ACTION_NONE or actions.max() >= len(ACTION_DIRECTIONS)):
+            invalid = actions[(actions < ACTION_NONE) | (actions >= len(ACTION_DIRECTIONS))]
+            raise ValueError(f"Ação inválida {int(invalid[0])}: use 0-{len(ACTION_DIRECTIONS) - 1} "
+                             f"ou ACTION_NONE ({ACTION_NONE})")
+        grid = self._grid
+        grid_base = self._grid_base
+        
+        # Direção (ignora ação nula e a direção oposta)
+        turn = (actions >= 0) & (actions != (self._direction ^ 1))
+        self._direction = np.where(turn, actions, self._direction)
+        
+        head_slot = self._body_base + self._head_ptr
+        new_head = self._body[head_slot] + self._deltas[self._direction]
+        
+        # Remove a cauda antes de ocupar a nova cabeça
+        shrink = ~self._grow
+        tail_ptr = (self._head_ptr - self._length + 1) % self._capacity
+        tails = self._body[self._body_base[shrink] + tail_ptr[shrink]]
+        grid[grid_base[shrink] + tails] &= np.uint8(~CELL_SNAKE & 0xFF)
+        self._length += self._grow
+        self._grow[:] = False
+        
+        # Colisões com uma leitura da grade
+        head_index = grid_base + new_head
+        dead = (grid[head_index] & (CELL_SNAKE | CELL_WALL)) != 0
+        
+        self._head_ptr = (self._head_ptr + 1) % self._capacity
+        self._body[self._body_base + self._head_ptr] = new_head
+        grid[head_index] |= CELL_SNAKE
+        
+        # Consumo de comida (pontos por tipo, crescimento no próximo tick)
+        rewards = np.zeros(self._num_envs, dtype=np.int32)
+        eaten = np.flatnonzero(~dead & (new_head == self._food_cell))
+        if eaten.size:
+            rewards[eaten] = self._food_points[self._food_type[eaten]]
+            self._score[eaten] += rewards[eaten]
+            self._grow[eaten] = True
+            grid[grid_base[eaten] + new_head[eaten]] &= np.uint8(~CELL_FOOD & 0xFF)
+            self._food_type[eaten] = self._sample_food_types(eaten.size)
+            self._place_food(eaten)
+        
+        self._update_fugitives(dead)
+        
+        # Reinício automático
+        finished = np.flatnonzero(dead)
+        if finished.size:
+            self._final_score[finished] = self._score[finished]
+            self.reset(finished)
+        
+        return rewards, dead
+    
+    def _update_fugitives(self, dead) -> None:
+        """
+        Aplica a fuga aproximada das comidas fugitivas
+        
+        Args:
+            dead: Máscara das partidas que terminaram neste tick
+        """
+        fugitives = np.flatnonzero(~dead & (self._food_type == FOOD_FUGITIVE)
+                                   & (self._food_cell >= 0))
+        if fugitives.size == 0:
+            return
+        
+        around = (self._grid_base[fugitives, None] + self._food_cell[fugitives, None]
+                  + self._danger_offsets[None, :])
+        threatened = fugitives[((self._grid[around] & CELL_SNAKE) != 0).any(axis=1)]
+        if threatened.size == 0:
+            return
+        
+        self._grid[self._grid_base[threatened] + self._food_cell[threatened]] &= np.uint8(~CELL_FOOD & 0xFF)
+        self._food_type[threatened] = FOOD_NORMAL
+        self._place_food(threatened)
+    
+    @property
+    def num_envs(self) -> int:
+        """Retorna o número de partidas"""
+        return self._num_envs
+    
+    @property
+    def scores(self) -> 'np.ndarray':
+        """Retorna o score atual de cada partida"""
+        return self._score
+    
+    @property
+    def final_scores(self) -> 'np.ndarray':
+        """Retorna o score da última partida terminada em cada slot"""
+        return self._final_score
+    
+    @property
+    def levels(self) -> 'np.ndarray':
+        """Retorna o nível de cada partida (mesma regra do GameEngine)"""
+        return self._score // POINTS_PER_LEVEL + 1
+    
+    @property
+    def lengths(self) -> 'np.ndarray':
+        """Retorna o comprimento de cada cobra"""
+        return self._length
+    
+    @property
+    def heads(self) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Retorna as posições (x, y) das cabeças"""
+        heads = self._body[self._body_base + self._head_ptr]
+        ys, xs = np.divmod(heads, self._stride)
+        return xs - PADDING, ys - PADDING
+    
+    @property
+    def food_cells(self) -> 'np.ndarray':
+        """Retorna o índice de célula da comida de cada partida (-1 = sem comida)"""
+        return self._food_cell
+    
+    @property
+    def food_types(self) -> 'np.ndarray':
+        """Retorna o código do tipo de comida de cada partida"""
+        return self._food_type
+    
+    @property
+    def grids(self) -> 'np.ndarray':
+        """Retorna as grades como visão (N, altura + 4, largura + 4), sem cópia"""
+        return self._grid.reshape(self._num_envs, self._height + 2 * PADDING, self._stride)
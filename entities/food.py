@@ -4,19 +4,42 @@ Inclui: Comida Normal, Especial (5 pontos) e Fugitiva (com rastro)
 Princípios POO: Herança, polimorfismo, responsabilidade única
 """
 
+import logging
 import pygame
 import random
 import math
+from functools import lru_cache
 from typing import List, Tuple, Optional
-from utils.types import Position, Surface, SnakeBody
+from utils.types import Position, Surface, BodyView
 from entities.game_object import GameObject
 from utils.enums import EntityType
+from utils.occupancy_grid import OccupancyGrid, CELL_FOOD
+from utils.distance_field import DistanceField, exact_distance_field
+from utils.logger import get_logger
 from config.settings import (
     GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, HUD_HEIGHT, Colors,
     SPECIAL_FOOD_POINTS, FUGITIVE_FOOD_POINTS, POINTS_PER_FOOD, MIRROR_FOOD_POINTS,
-    FUGITIVE_FOOD_BLINK_SPEED, FUGITIVE_FOOD_TRAIL_DURATION
+    FUGITIVE_FOOD_BLINK_SPEED, FUGITIVE_FOOD_TRAIL_DURATION, ESCAPE_SAMPLES,
+    FUGITIVE_DANGER_RADIUS
 )
 
+@lru_cache(maxsize=None)
+def manhattan_offsets(radius: int) -> Tuple[Position, ...]:
+    """
+    Retorna os deslocamentos (dx, dy) dentro de um raio Manhattan
+    
+    Args:
+        radius: Raio em células
+    
+    Returns:
+        Tupla com todos os deslocamentos do losango de raio `radius`
+    """
+    return tuple(
+        (dx, dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-(radius - abs(dx)), radius - abs(dx) + 1)
+    )
+
 class Food(GameObject):
     """
     Classe base para comida do jogo
@@ -28,17 +51,28 @@ class Food(GameObject):
     - Detecção de colisão com a cobra
     """
     
-    def __init__(self, food_type: EntityType = EntityType.FOOD_NORMAL):
+    def __init__(self, food_type: EntityType = EntityType.FOOD_NORMAL,
+                 grid: Optional[OccupancyGrid] = None, rng=random):
         """
         Inicializa a comida
         
         Args:
             food_type: Tipo da comida (normal, especial, fugitiva)
-        """
-        initial_position = self._generate_random_position()
+            grid: Grade de ocupação compartilhada da arena (opcional)
+            rng: Gerador de gameplay (módulo random por padrão)
+        """
+        self._grid = grid
+        self._rng = rng
+        # Com grade a comida nasce inativa e fora da grade: a célula é
+        # escolhida por respawn()/place() e marcada por activate()
+        initial_position = self._generate_random_position() if grid is None else (0, 0)
         super().__init__(initial_position, food_type)
         self._animation_counter = 0.0
+        self._animation_clock = 0.0  # Relógio do gerenciador na última animação
         self._points_value = POINTS_PER_FOOD
+        
+        if self._grid is not None:
+            super().deactivate()
     
     @property
     def points_value(self) -> int:
@@ -52,32 +86,108 @@ class Food(GameObject):
         Returns:
             Nova posição (x, y)
         """
-        x = random.randint(0, GRID_WIDTH - 1)
-        y = random.randint(0, GRID_HEIGHT - 1)
+        if self._grid is not None:
+            width, height = self._grid.width, self._grid.height
+        else:
+            width, height = GRID_WIDTH, GRID_HEIGHT
+        
+        x = self._rng.randint(0, width - 1)
+        y = self._rng.randint(0, height - 1)
         return (x, y)
     
-    def respawn(self, snake_body: SnakeBody, max_attempts: int = 100) -> None:
+    def _is_spawnable(self, position: Position, snake_body: BodyView) -> bool:
+        """
+        Verifica se a comida pode ocupar a posição
+        
+        Args:
+            position: Posição candidata
+            snake_body: Visão do corpo da cobra
+        
+        Returns:
+            True se a célula não tem cobra (nem outra comida, com grade)
+        """
+        if position in snake_body:
+            return False
+        return self._grid is None or self._grid.is_free(position)
+    
+    def place(self, position: Position) -> None:
+        """
+        Move a comida para a posição, mantendo a grade de ocupação em dia
+        
+        Args:
+            position: Nova posição (x, y)
+        """
+        if self._grid is not None and self._active:
+            self._grid.clear_flag(self._position, CELL_FOOD)
+            self._grid.set_flag(position, CELL_FOOD)
+        self._position = position
+    
+    def activate(self) -> None:
+        """Ativa a comida e marca sua célula na grade"""
+        if not self._active and self._grid is not None:
+            self._grid.set_flag(self._position, CELL_FOOD)
+        super().activate()
+    
+    def deactivate(self) -> None:
+        """Desativa a comida e libera sua célula na grade"""
+        if self._active and self._grid is not None:
+            self._grid.clear_flag(self._position, CELL_FOOD)
+        super().deactivate()
+    
+    def restore(self, position: Position, active: bool) -> None:
+        """
+        Restaura posição e estado sem tocar na grade (restaurada à parte)
+        
+        Args:
+            position: Posição (x, y)
+            active: Se a comida está ativa
+        """
+        self._position = position
+        self._active = active
+        self._animation_counter = 0.0
+    
+    def respawn(self, snake_body: BodyView, max_attempts: int = 100) -> bool:
         """
         Reposiciona a comida evitando o corpo da cobra
         
+        Com grade de ocupação, sorteia uma única célula livre uniforme
+        sem percorrer o corpo, qualquer que seja o tamanho da cobra.
+        
         Args:
-            snake_body: Lista com posições do corpo da cobra
+            snake_body: Visão do corpo da cobra (pertinência O(1))
             max_attempts: Máximo de tentativas para encontrar posição válida
-        """
+                          (apenas sem grade)
+        
+        Returns:
+            True se a comida foi reposicionada, False se não há célula
+            livre (a comida fica onde estava)
+        """
+        if self._grid is not None:
+            new_position = self._grid.sample_free(self._rng)
+            if new_position is None or new_position in snake_body:
+                return False
+            self.place(new_position)
+            self._animation_counter = 0.0
+            return True
+        
         for _ in range(max_attempts):
             new_position = self._generate_random_position()
             if new_position not in snake_body:
-                self._position = new_position
+                self.place(new_position)
                 self._animation_counter = 0.0
-                return
+                return True
         
         # Fallback: encontra qualquer posição livre (força bruta)
-        all_positions = {(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)}
-        available_positions = all_positions - set(snake_body)
+        available_positions = [
+            (x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)
+            if (x, y) not in snake_body
+        ]
         
-        if available_positions:
-            self._position = random.choice(list(available_positions))
-            self._animation_counter = 0.0
+        if not available_positions:
+            return False
+        self.place(self._rng.choice(available_positions))
+        self._animation_counter = 0.0
+        return True
     
     def update_animation(self, delta_time: float = 1.0) -> None:
         """
@@ -88,19 +198,43 @@ class Food(GameObject):
         """
         self._animation_counter += delta_time * 0.2
     
-    def draw(self, surface: Surface) -> None:
+    def advance_animation(self, clock: float) -> None:
+        """
+        Avança a animação até o relógio do gerenciador de uma vez
+        
+        Comidas fora da tela não são animadas a cada tick: o tempo
+        acumulado é aplicado quando elas voltam a ser desenhadas.
+        
+        Args:
+            clock: Tempo de jogo acumulado pelo gerenciador
+        """
+        if clock > self._animation_clock:
+            self.update_animation(clock - self._animation_clock)
+            self._animation_clock = clock
+    
+    def sync_animation(self, clock: float) -> None:
+        """
+        Marca a animação como em dia com o relógio do gerenciador
+        
+        Args:
+            clock: Tempo de jogo acumulado pelo gerenciador
+        """
+        self._animation_clock = clock
+    
+    def draw(self, surface: Surface, offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Desenha a comida normal
         
         Args:
             surface: Superfície onde desenhar
+            offset: Deslocamento da câmera em pixels
         """
         if not self.active:
             return
         
         x, y = self.position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
+        center_x = x * GRID_SIZE + GRID_SIZE // 2 + offset[0]
+        center_y = y * GRID_SIZE + GRID_SIZE // 2 + offset[1]
         
         # Efeito pulsante sutil
         pulse_factor = 1.0 + 0.05 * math.sin(self._animation_counter)
@@ -122,7 +256,7 @@ class Food(GameObject):
     
     def get_bounds(self) -> pygame.Rect:
         """
-        Retorna os limites da comida para detecção de colisão
+        Retorna os limites da comida em pixels (renderização e depuração)
         
         Returns:
             Retângulo da comida
@@ -130,6 +264,22 @@ class Food(GameObject):
         x, y = self.position
         return pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
     
+    def get_dirty_rects(self, offset: Tuple[int, int] = (0, 0)) -> List[pygame.Rect]:
+        """
+        Retorna as áreas da tela que draw() pode alterar (modo dirty rect)
+        
+        Pulsos, contornos e brilhos não passam das células vizinhas.
+        
+        Args:
+            offset: Deslocamento da câmera em pixels
+        
+        Returns:
+            Lista de retângulos em pixels da tela
+        """
+        x, y = self.position
+        return [pygame.Rect((x - 1) * GRID_SIZE + offset[0], (y - 1) * GRID_SIZE + offset[1],
+                            3 * GRID_SIZE, 3 * GRID_SIZE)]
+    
     def consume(self) -> int:
         """
         Consome a comida (desativa e retorna pontos)
@@ -145,9 +295,15 @@ class SpecialFood(Food):
     Comida especial com 5 pontos e visual dourado com contorno
     """
     
-    def __init__(self):
-        """Inicializa comida especial"""
-        super().__init__(EntityType.FOOD_SPECIAL)
+    def __init__(self, grid: Optional[OccupancyGrid] = None, rng=random):
+        """
+        Inicializa comida especial
+        
+        Args:
+            grid: Grade de ocupação compartilhada da arena (opcional)
+            rng: Gerador de gameplay (módulo random por padrão)
+        """
+        super().__init__(EntityType.FOOD_SPECIAL, grid, rng)
         self._points_value = SPECIAL_FOOD_POINTS
         self._border_animation = 0.0
     
@@ -156,14 +312,14 @@ class SpecialFood(Food):
         super().update_animation(delta_time)
         self._border_animation += delta_time * 2.0  # Animação mais rápida para o contorno
     
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface, offset: Tuple[int, int] = (0, 0)) -> None:
         """Desenha comida especial com contorno animado"""
         if not self.active:
             return
         
         x, y = self.position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
+        center_x = x * GRID_SIZE + GRID_SIZE // 2 + offset[0]
+        center_y = y * GRID_SIZE + GRID_SIZE // 2 + offset[1]
         
         # Efeito pulsante mais intenso
         pulse_factor = 1.0 + 0.15 * math.sin(self._animation_counter * 1.5)
@@ -242,19 +398,20 @@ class TrailParticle:
         if self.remaining_time <= 0:
             self.active = False
     
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface, offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Desenha a partícula de rastro
         
         Args:
             surface: Superfície onde desenhar
+            offset: Deslocamento da câmera em pixels
         """
         if not self.active:
             return
         
         x, y = self.position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
+        center_x = x * GRID_SIZE + GRID_SIZE // 2 + offset[0]
+        center_y = y * GRID_SIZE + GRID_SIZE // 2 + offset[1]
         
         # Calcula alpha baseado no tempo restante
         alpha_factor = self.remaining_time / self.max_duration
@@ -280,13 +437,30 @@ class FugitiveFood(Food):
     Comida fugitiva que pisca e foge quando a cobra se aproxima
     """
     
-    def __init__(self):
-        """Inicializa comida fugitiva"""
-        super().__init__(EntityType.FOOD_FUGITIVE)
+    def __init__(self, grid: Optional[OccupancyGrid] = None,
+                 distance_field: Optional[DistanceField] = None, rng=random,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Inicializa comida fugitiva
+        
+        Args:
+            grid: Grade de ocupação compartilhada da arena (opcional)
+            distance_field: Campo de distâncias compartilhado (criado a
+                partir da grade se não informado e a arena for pequena)
+            rng: Gerador de gameplay (módulo random por padrão)
+            logger: Logger do gerenciador (mudo no modo headless); padrão
+                é o logger 'food' verboso
+        """
+        super().__init__(EntityType.FOOD_FUGITIVE, grid, rng)
+        self._logger = logger or get_logger('food')
+        if distance_field is None:
+            distance_field = exact_distance_field(grid)
+        self._distance_field = distance_field
         self._points_value = FUGITIVE_FOOD_POINTS
         self._blink_timer = 0.0
         self._trail_particles: List[TrailParticle] = []
         self._escape_cooldown = 0.0  # Cooldown entre fugas
+        self._nearby_cache: Optional[Tuple[int, Position, int, bool]] = None
     
     def update_animation(self, delta_time: float = 1.0) -> None:
         """Atualiza animação da comida fugitiva"""
@@ -303,52 +477,129 @@ class FugitiveFood(Food):
             if not particle.active:
                 self._trail_particles.remove(particle)
     
-    def _is_snake_nearby(self, snake_body: SnakeBody, danger_radius: int = 2) -> bool:
+    @property
+    def escape_cooldown(self) -> float:
+        """Retorna o tempo restante até a próxima fuga possível"""
+        return self._escape_cooldown
+    
+    def restore(self, position: Position, active: bool, escape_cooldown: float = 0.0) -> None:
+        """
+        Restaura posição, estado e cooldown de fuga sem tocar na grade
+        
+        Args:
+            position: Posição (x, y)
+            active: Se a comida está ativa
+            escape_cooldown: Tempo restante até a próxima fuga
+        """
+        super().restore(position, active)
+        self._escape_cooldown = escape_cooldown
+        self._nearby_cache = None
+        self._trail_particles.clear()
+    
+    def get_dirty_rects(self, offset: Tuple[int, int] = (0, 0)) -> List[pygame.Rect]:
+        """
+        Retorna as áreas da comida e das partículas de rastro
+        
+        Args:
+            offset: Deslocamento da câmera em pixels
+        
+        Returns:
+            Lista de retângulos em pixels da tela
+        """
+        rects = super().get_dirty_rects(offset)
+        for particle in self._trail_particles:
+            x, y = particle.position
+            rects.append(pygame.Rect(x * GRID_SIZE + offset[0], y * GRID_SIZE + offset[1],
+                                     GRID_SIZE, GRID_SIZE))
+        return rects
+    
+    def _is_snake_nearby(self, snake_body: BodyView, danger_radius: int = FUGITIVE_DANGER_RADIUS) -> bool:
         """
         Verifica se a cobra está próxima
         
+        Consulta apenas as células do losango de raio `danger_radius`
+        (pertinência O(1) na visão do corpo). O resultado é reaproveitado
+        enquanto a geração do corpo e a posição da comida não mudarem.
+        
         Args:
-            snake_body: Corpo da cobra
+            snake_body: Visão do corpo da cobra
             danger_radius: Raio de perigo em células
-            
+        
         Returns:
             True se cobra estiver próxima
         """
+        generation = getattr(snake_body, 'generation', None)
+        cache = self._nearby_cache
+        if (generation is not None and cache is not None and
+                cache[:3] == (generation, self._position, danger_radius)):
+            return cache[3]
+        
         food_x, food_y = self.position
+        nearby = any(
+            (food_x + dx, food_y + dy) in snake_body
+            for dx, dy in manhattan_offsets(danger_radius)
+        )
         
-        for segment_x, segment_y in snake_body:
-            distance = abs(segment_x - food_x) + abs(segment_y - food_y)  # Distância Manhattan
-            if distance <= danger_radius:
-                return True
+        if generation is not None:
+            self._nearby_cache = (generation, self._position, danger_radius, nearby)
         
-        return False
+        return nearby
     
-    def try_escape(self, snake_body: SnakeBody) -> bool:
+    def _find_farthest_position(self, snake_body: BodyView) -> Tuple[Optional[Position], int]:
         """
-        Tenta fugir da cobra se ela estiver próxima
+        Encontra a célula livre alcançável mais distante da cobra
         
         Args:
-            snake_body: Corpo da cobra
-            
+            snake_body: Visão do corpo da cobra
+        
         Returns:
-            True se fugiu, False caso contrário
+            Tupla (posição ou None, distância até o segmento mais próximo)
         """
-        # Verifica cooldown e proximidade
-        if self._escape_cooldown > 0 or not self._is_snake_nearby(snake_body):
-            return False
+        self._distance_field.refresh(snake_body)
+        farthest = self._distance_field.farthest_free_cell(self._rng)
+        if farthest is None:
+            return None, 0
+        return farthest
+    
+    def _sample_far_position(self, snake_body: BodyView) -> Tuple[Optional[Position], int]:
+        """
+        Sorteia posições e escolhe a mais longe da cobra (arenas grandes ou sem grade)
         
-        # Adiciona partícula de rastro na posição atual
-        self._trail_particles.append(TrailParticle(self.position))
+        Com grade, sorteia ESCAPE_SAMPLES células livres uniformes,
+        descarta as que têm cobra no raio de perigo e mede a distância
+        até a cabeça: o custo não depende do tamanho da cobra nem da arena.
         
-        # Encontra nova posição longe da cobra
-        old_position = self.position
+        Args:
+            snake_body: Corpo da cobra
+        
+        Returns:
+            Tupla (posição ou None, distância estimada até a cobra)
+        """
         best_position = None
         max_distance = 0
         
-        # Tenta várias posições e escolhe a mais longe da cobra
+        if self._grid is not None:
+            head_x, head_y = next(iter(snake_body))
+            for _ in range(ESCAPE_SAMPLES):
+                candidate = self._grid.sample_free(self._rng)
+                if candidate is None:
+                    break
+                
+                x, y = candidate
+                if any((x + dx, y + dy) in snake_body
+                       for dx, dy in manhattan_offsets(FUGITIVE_DANGER_RADIUS)):
+                    continue
+                
+                distance = abs(x - head_x) + abs(y - head_y)
+                if distance > max_distance:
+                    max_distance = distance
+                    best_position = candidate
+            
+            return best_position, max_distance
+        
         for _ in range(50):  # 50 tentativas
             candidate = self._generate_random_position()
-            if candidate in snake_body:
+            if not self._is_spawnable(candidate, snake_body):
                 continue
             
             # Calcula distância mínima da cobra
@@ -361,11 +612,49 @@ class FugitiveFood(Food):
                 max_distance = min_distance
                 best_position = candidate
         
+        return best_position, max_distance
+    
+    def is_settled(self, snake_body: BodyView) -> bool:
+        """
+        Verifica se a fugitiva está fora de perigo (sem cooldown nem cobra no raio)
+        
+        Args:
+            snake_body: Visão do corpo da cobra
+        
+        Returns:
+            True se a fugitiva não precisa ser verificada até a cabeça se aproximar
+        """
+        return self._escape_cooldown <= 0 and not self._is_snake_nearby(snake_body)
+    
+    def try_escape(self, snake_body: BodyView) -> bool:
+        """
+        Tenta fugir da cobra se ela estiver próxima
+        
+        Args:
+            snake_body: Visão do corpo da cobra
+        
+        Returns:
+            True se fugiu, False caso contrário
+        """
+        # Verifica cooldown e proximidade
+        if self._escape_cooldown > 0 or not self._is_snake_nearby(snake_body):
+            return False
+        
+        # Adiciona partícula de rastro na posição atual
+        self._trail_particles.append(TrailParticle(self.position))
+        
+        # Encontra nova posição longe da cobra
+        old_position = self.position
+        if self._distance_field is not None:
+            best_position, max_distance = self._find_farthest_position(snake_body)
+        else:
+            best_position, max_distance = self._sample_far_position(snake_body)
+        
         # Move para nova posição se encontrou uma boa
         if best_position and max_distance >= 3:
-            self._position = best_position
+            self.place(best_position)
             self._escape_cooldown = 1.0  # 1 segundo de cooldown
-            print(f"🏃‍♀️ Comida fugitiva escapou de {old_position} para {best_position}!")
+            self._logger.debug("🏃‍♀️ Comida fugitiva escapou de %s para %s!", old_position, best_position)
             return True
         
         return False
@@ -379,16 +668,16 @@ class FugitiveFood(Food):
         """
         normal_food = Food(EntityType.FOOD_NORMAL)
         normal_food._position = self.position
-        print("🏃‍♀️ → 🍎 Comida fugitiva virou normal após fuga!")
+        self._logger.debug("🏃‍♀️ → 🍎 Comida fugitiva virou normal após fuga!")
     
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface, offset: Tuple[int, int] = (0, 0)) -> None:
         """Desenha comida fugitiva com efeito piscante"""
         if not self.active:
             return
         
         # Desenha rastro primeiro (atrás da comida)
         for particle in self._trail_particles:
-            particle.draw(surface)
+            particle.draw(surface, offset)
         
         # Efeito piscante
         blink_factor = math.sin(self._blink_timer)
@@ -396,8 +685,8 @@ class FugitiveFood(Food):
             return
         
         x, y = self.position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
+        center_x = x * GRID_SIZE + GRID_SIZE // 2 + offset[0]
+        center_y = y * GRID_SIZE + GRID_SIZE // 2 + offset[1]
         
         # Efeito pulsante baseado no piscar
         pulse_factor = 1.0 + 0.2 * abs(blink_factor)
@@ -447,9 +736,15 @@ class MirrorFood(Food):
     Comida espelho que inverte a perspectiva do jogo
     """
     
-    def __init__(self):
-        """Inicializa comida espelho"""
-        super().__init__(EntityType.FOOD_MIRROR)
+    def __init__(self, grid: Optional[OccupancyGrid] = None, rng=random):
+        """
+        Inicializa comida espelho
+        
+        Args:
+            grid: Grade de ocupação compartilhada da arena (opcional)
+            rng: Gerador de gameplay (módulo random por padrão)
+        """
+        super().__init__(EntityType.FOOD_MIRROR, grid, rng)
         self._points_value = MIRROR_FOOD_POINTS
         self._mirror_animation = 0.0
         self._reflection_offset = 0.0
@@ -460,14 +755,14 @@ class MirrorFood(Food):
         self._mirror_animation += delta_time * 4.0  # Animação espelhada
         self._reflection_offset += delta_time * 6.0  # Efeito de reflexão
     
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface, offset: Tuple[int, int] = (0, 0)) -> None:
         """Desenha comida espelho com efeito de reflexão"""
         if not self.active:
             return
         
         x, y = self.position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
+        center_x = x * GRID_SIZE + GRID_SIZE // 2 + offset[0]
+        center_y = y * GRID_SIZE + GRID_SIZE // 2 + offset[1]
         
         # Efeito pulsante com espelhamento
         pulse_factor = 1.0 + 0.1 * math.sin(self._animation_counter)
@@ -532,7 +827,8 @@ class EffectParticle:
     Partícula de efeito para consumo de comidas especiais
     """
     
-    def __init__(self, position: Position, color: tuple, direction: tuple, speed: float = 50.0):
+    def __init__(self, position: Position, color: tuple, direction: tuple, speed: float = 50.0,
+                 rng=random):
         """
         Inicializa partícula de efeito
         
@@ -541,6 +837,7 @@ class EffectParticle:
             color: Cor da partícula
             direction: Direção (x, y) normalizada
             speed: Velocidade em pixels/segundo
+            rng: Gerador cosmético (módulo random por padrão)
         """
         self.position = list(position)  # Posição em pixels reais
         self.color = color
@@ -549,7 +846,7 @@ class EffectParticle:
         self.life_time = 0.8  # 0.8 segundos de vida
         self.remaining_time = self.life_time
         self.active = True
-        self.size = random.randint(2, 5)
+        self.size = rng.randint(2, 5)
     
     def update(self, delta_time: float) -> None:
         """
@@ -574,15 +871,19 @@ class EffectParticle:
         life_factor = self.remaining_time / self.life_time
         self.size = max(1, int(5 * life_factor))
     
-    def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface, offset: Tuple[int, int] = (0, 0)) -> Optional[pygame.Rect]:
         """
         Desenha a partícula de efeito
         
         Args:
             surface: Superfície onde desenhar
+            offset: Deslocamento da câmera em pixels
+        
+        Returns:
+            Área da tela alterada ou None se a partícula acabou
         """
         if not self.active:
-            return
+            return None
         
         # Calcula alpha baseado no tempo restante
         life_factor = self.remaining_time / self.life_time
@@ -597,5 +898,6 @@ class EffectParticle:
         pygame.draw.circle(particle_surface, self.color, 
                          (self.size, self.size), self.size)
         
-        surface.blit(particle_surface, 
-                    (int(self.position[0] - self.size), int(self.position[1] - self.size)))
+        return surface.blit(particle_surface, 
+                            (int(self.position[0] - self.size) + offset[0],
+                             int(self.position[1] - self.size) + offset[1]))
@@ -7,24 +7,60 @@ Versão 2.0: Inclui comida espelho e transformação de fugitivas
 
 import random
 import math
-from typing import Optional, Union, List
-from utils.types import SnakeBody
-from entities.food import Food, SpecialFood, FugitiveFood, MirrorFood, EffectParticle
+import struct
+import pygame
+from typing import Dict, Iterator, Optional, Union, List, Tuple
+from utils.types import BodyView, Position
+from entities.food import (
+    Food, SpecialFood, FugitiveFood, MirrorFood, EffectParticle, manhattan_offsets
+)
 from utils.enums import EntityType
+from utils.occupancy_grid import OccupancyGrid
+from utils.logger import get_logger
+from utils.distance_field import exact_distance_field
 from config.settings import (
     SPECIAL_FOOD_SPAWN_CHANCE, 
     FUGITIVE_FOOD_SPAWN_CHANCE,
     MIRROR_FOOD_SPAWN_CHANCE,
+    FUGITIVE_DANGER_RADIUS,
+    FOOD_COUNT,
     GRID_SIZE, Effects
 )
 
+AnyFood = Union[Food, SpecialFood, FugitiveFood, MirrorFood]
+
+# Estado empacotado: as estatísticas (na ordem de STATS_KEYS) seguidas
+# de tipo, posição e cooldown de fuga de cada comida ativa
+FOOD_TYPES = (
+    EntityType.FOOD_NORMAL, EntityType.FOOD_SPECIAL,
+    EntityType.FOOD_FUGITIVE, EntityType.FOOD_MIRROR
+)
+STATS_KEYS = (
+    'normal_consumed', 'special_consumed', 'fugitive_consumed',
+    'mirror_consumed', 'fugitive_escapes', 'fugitive_transformations'
+)
+_STATS = struct.Struct('<6I')
+_FOOD = struct.Struct('<Bhhf')
+
+_SPAWN_MESSAGES = {
+    EntityType.FOOD_NORMAL: "🍎 Comida normal spawnada",
+    EntityType.FOOD_SPECIAL: "⭐ Comida ESPECIAL spawnada! (+5 pontos)",
+    EntityType.FOOD_FUGITIVE: "🏃‍♀️ Comida FUGITIVA spawnada! (tente pegá-la!)",
+    EntityType.FOOD_MIRROR: "🪞 Comida ESPELHO spawnada! (inverte perspectiva!)",
+}
+
 class FoodManager:
     """
     Gerenciador centralizado das comidas do jogo
     
+    As comidas ativas ficam num índice célula → comida: consumo é uma
+    consulta pela célula da cabeça, só as fugitivas perto da cabeça
+    (em alerta) são verificadas a cada tick e só as comidas visíveis
+    são animadas e desenhadas. O custo por tick não depende do total.
+    
     Responsabilidades:
     - Controlar spawning de diferentes tipos
-    - Gerenciar comida ativa
+    - Gerenciar as comidas ativas (FOOD_COUNT simultâneas por padrão)
     - Coordenar interações especiais
     - Estatísticas de comidas consumidas
     - Sistema de transformação fugitiva → normal
@@ -32,11 +68,35 @@ class FoodManager:
     - Gerenciar partículas de efeito
     """
     
-    def __init__(self):
-        """Inicializa o gerenciador de comidas"""
-        self._current_food: Optional[Union[Food, SpecialFood, FugitiveFood, MirrorFood]] = None
+    def __init__(self, verbose: bool = True, grid: Optional[OccupancyGrid] = None,
+                 rng=random, effects_rng=random, food_count: int = FOOD_COUNT,
+                 spawn: bool = True):
+        """
+        Inicializa o gerenciador de comidas
+        
+        Args:
+            verbose: Se deve imprimir mensagens de spawn e consumo
+            grid: Grade de ocupação compartilhada da arena (opcional)
+            rng: Gerador de gameplay: tipos e posições (módulo random por padrão)
+            effects_rng: Gerador cosmético: partículas (módulo random por padrão)
+            food_count: Comidas simultâneas na arena
+            spawn: Se False, começa sem comidas (o estado vem de restore())
+        """
+        self._verbose = verbose
+        self._logger = get_logger('food', verbose)
+        self._grid = grid
+        self._rng = rng
+        self._effects_rng = effects_rng
+        self._food_count = food_count
+        self._distance_field = exact_distance_field(grid)
+        self._foods: Dict[Position, AnyFood] = {}
+        self._revision = 0  # Muda a cada alteração do índice de comidas
+        self._alert_fugitives: Dict[FugitiveFood, None] = {}  # Ordenado: fugas determinísticas
+        self._fugitive_count = 0  # Fugitivas ativas: sem nenhuma, update() não varre o raio
+        self._clock = 0.0
         self._effect_particles: List[EffectParticle] = []
-        self._spawn_normal_food()
+        if spawn:
+            self._spawn_initial_foods()
         
         # Estatísticas expandidas
         self._stats = {
@@ -48,38 +108,95 @@ class FoodManager:
             'fugitive_transformations': 0  # Fugitivas que viraram normais
         }
         
-        print("🎮 FoodManager v2.0 inicializado!")
-        print("🆕 Recursos: Espelho + Transformação de Fugitivas")
+        self._logger.info("🎮 FoodManager v2.0 inicializado!")
+        self._logger.info("🆕 Recursos: Espelho + Transformação de Fugitivas")
+    
+    @property
+    def current_food(self) -> Optional[AnyFood]:
+        """Retorna a comida ativa mais antiga (a única, com uma comida por vez)"""
+        return next(iter(self._foods.values()), None)
+    
+    @property
+    def foods(self) -> Dict[Position, AnyFood]:
+        """Retorna o índice célula → comida ativa (somente leitura)"""
+        return self._foods
     
     @property
-    def current_food(self) -> Optional[Union[Food, SpecialFood, FugitiveFood, MirrorFood]]:
-        """Retorna a comida atual"""
-        return self._current_food
+    def revision(self) -> int:
+        """Retorna um contador que muda sempre que o índice de comidas muda"""
+        return self._revision
+    
+    @property
+    def food_count(self) -> int:
+        """Retorna quantas comidas simultâneas o gerenciador mantém"""
+        return self._food_count
     
     @property
     def stats(self) -> dict:
         """Retorna estatísticas de consumo"""
         return self._stats.copy()
     
-    def _spawn_normal_food(self) -> None:
-        """Spawna comida normal"""
-        self._current_food = Food(EntityType.FOOD_NORMAL)
-        print("🍎 Comida normal spawnada")
+    def _add_food(self, food: AnyFood, snake_body: BodyView = (),
+                  position: Optional[Position] = None) -> bool:
+        """
+        Posiciona uma comida recém-criada e a insere no índice
+        
+        Args:
+            food: Comida criada por _create_food()
+            snake_body: Corpo da cobra a evitar (se a posição não for dada)
+            position: Célula exata (None = célula livre sorteada)
+        
+        Returns:
+            True se a comida entrou na arena, False se não há célula livre
+        """
+        if position is None:
+            if not food.respawn(snake_body):
+                return False
+        elif position != food.position:
+            food.place(position)
+        
+        if food.position in self._foods:
+            return False
+        
+        food.activate()
+        food.sync_animation(self._clock)
+        self._foods[food.position] = food
+        self._revision += 1
+        if isinstance(food, FugitiveFood):
+            self._fugitive_count += 1
+            self._alert_fugitives[food] = None  # Pode ter nascido ao lado da cobra
+        return True
     
-    def _spawn_special_food(self) -> None:
-        """Spawna comida especial (5 pontos)"""
-        self._current_food = SpecialFood()
-        print("⭐ Comida ESPECIAL spawnada! (+5 pontos)")
+    def _remove_food(self, food: AnyFood) -> None:
+        """
+        Retira uma comida do índice e libera sua célula na grade
+        
+        Args:
+            food: Comida ativa
+        """
+        del self._foods[food.position]
+        self._revision += 1
+        if isinstance(food, FugitiveFood):
+            self._fugitive_count -= 1
+            self._alert_fugitives.pop(food, None)
+        food.deactivate()
     
-    def _spawn_fugitive_food(self) -> None:
-        """Spawna comida fugitiva"""
-        self._current_food = FugitiveFood()
-        print("🏃‍♀️ Comida FUGITIVA spawnada! (tente pegá-la!)")
+    def _spawn_food(self, food_type: EntityType, snake_body: BodyView = ()) -> None:
+        """
+        Cria uma comida do tipo pedido numa célula livre
+        
+        Args:
+            food_type: Tipo da comida
+            snake_body: Corpo da cobra a evitar
+        """
+        if self._add_food(self._create_food(food_type), snake_body):
+            self._logger.debug(_SPAWN_MESSAGES[food_type])
     
-    def _spawn_mirror_food(self) -> None:
-        """Spawna comida espelho (inversão de perspectiva)"""
-        self._current_food = MirrorFood()
-        print("🪞 Comida ESPELHO spawnada! (inverte perspectiva!)")
+    def _spawn_initial_foods(self) -> None:
+        """Spawna a comida normal inicial e completa FOOD_COUNT com tipos sorteados"""
+        self._spawn_food(EntityType.FOOD_NORMAL)
+        for _ in range(self._food_count - len(self._foods)):
+            self._spawn_food(self._determine_food_type())
     
     def _determine_food_type(self) -> EntityType:
         """
@@ -88,7 +205,7 @@ class FoodManager:
         Returns:
             Tipo de comida a ser spawnada
         """
-        rand_value = random.random()
+        rand_value = self._rng.random()
         
         # Ordem de prioridade: Espelho > Fugitiva > Especial > Normal
         if rand_value < MIRROR_FOOD_SPAWN_CHANCE:
@@ -100,81 +217,98 @@ class FoodManager:
         else:
             return EntityType.FOOD_NORMAL
     
-    def spawn_new_food(self, snake_body: SnakeBody) -> None:
+    def spawn_new_food(self, snake_body: BodyView) -> None:
         """
-        Spawna nova comida evitando o corpo da cobra
+        Spawna uma nova comida (repondo a consumida) evitando o corpo da cobra
         
         Args:
             snake_body: Corpo da cobra para evitar
         """
-        food_type = self._determine_food_type()
-        
-        # Cria comida baseada no tipo
-        if food_type == EntityType.FOOD_SPECIAL:
-            self._spawn_special_food()
-        elif food_type == EntityType.FOOD_FUGITIVE:
-            self._spawn_fugitive_food()
-        elif food_type == EntityType.FOOD_MIRROR:
-            self._spawn_mirror_food()
-        else:
-            self._spawn_normal_food()
-        
-        # Reposiciona evitando a cobra
-        if self._current_food:
-            self._current_food.respawn(snake_body)
+        self._spawn_food(self._determine_food_type(), snake_body)
     
-    def update(self, delta_time: float, snake_body: SnakeBody) -> None:
+    def update(self, delta_time: float, snake_body: BodyView) -> None:
         """
-        Atualiza a comida atual e efeitos
+        Atualiza as comidas (um tick do jogo)
+        
+        Só as fugitivas em alerta são atualizadas: uma fugitiva entra em
+        alerta quando a cabeça chega ao raio de perigo (consulta ao índice
+        nas células ao redor da cabeça) e sai quando fica fora de perigo.
+        As demais comidas só são animadas quando desenhadas; sem nenhuma
+        fugitiva na arena o tick só avança o relógio.
         
         Args:
             delta_time: Tempo decorrido
             snake_body: Corpo da cobra
         """
-        if not self._current_food or not self._current_food.active:
+        previous_clock = self._clock
+        self._clock += delta_time
+        if not self._fugitive_count:
             return
         
-        # Atualiza animação da comida
-        self._current_food.update_animation(delta_time)
+        foods = self._foods
+        alert = self._alert_fugitives
+        head_x, head_y = snake_body[0]
+        for dx, dy in manhattan_offsets(FUGITIVE_DANGER_RADIUS):
+            food = foods.get((head_x + dx, head_y + dy))
+            if food is not None and isinstance(food, FugitiveFood) and food not in alert:
+                food.advance_animation(previous_clock)
+                alert[food] = None
         
-        # Atualiza partículas de efeito
-        for particle in self._effect_particles[:]:  # Cópia da lista para iteração segura
-            particle.update(delta_time)
-            if not particle.active:
-                self._effect_particles.remove(particle)
+        if not alert:
+            return
         
-        # Lógica especial para comida fugitiva
-        if isinstance(self._current_food, FugitiveFood):
-            # Tenta fugir se cobra estiver próxima
-            if self._current_food.try_escape(snake_body):
+        for fugitive in list(alert):
+            fugitive.update_animation(delta_time)
+            fugitive.sync_animation(self._clock)
+            
+            old_position = fugitive.position
+            if fugitive.try_escape(snake_body):
                 self._stats['fugitive_escapes'] += 1
+                del foods[old_position]
+                foods[fugitive.position] = fugitive
+                self._revision += 1
                 
                 # NOVA MECÂNICA v2.0: Transforma em comida normal após fuga
-                self._transform_fugitive_to_normal(snake_body)
+                self._transform_fugitive_to_normal(fugitive)
+            elif fugitive.is_settled(snake_body):
+                del alert[fugitive]
+    
+    def update_effects(self, delta_time: float) -> None:
+        """
+        Atualiza as partículas de efeito (independente do tick do jogo)
+        
+        Args:
+            delta_time: Tempo decorrido desde o último frame
+        """
+        if not self._effect_particles:
+            return
+        
+        for particle in self._effect_particles[:]:  # Cópia da lista para iteração segura
+            particle.update(delta_time)
+            if not particle.active:
+                self._effect_particles.remove(particle)
     
-    def _transform_fugitive_to_normal(self, snake_body: SnakeBody) -> None:
+    def _transform_fugitive_to_normal(self, fugitive: FugitiveFood) -> None:
         """
         Transforma comida fugitiva em normal após fuga
         Mecânica v2.0: Torna fugitivas capturáveis após 1 fuga
         
         Args:
-            snake_body: Corpo da cobra para evitar
+            fugitive: Fugitiva que acabou de fugir
         """
-        if isinstance(self._current_food, FugitiveFood):
-            # Pega posição atual da fugitiva
-            fugitive_position = self._current_food.position
-            
-            # Cria nova comida normal na mesma posição
-            normal_food = Food(EntityType.FOOD_NORMAL)
-            normal_food._position = fugitive_position
-            normal_food._animation_counter = 0.0
-            
-            # Substitui a comida atual
-            self._current_food = normal_food
-            self._stats['fugitive_transformations'] += 1
-            
-            print("🏃‍♀️ → 🍎 Comida fugitiva virou NORMAL após fuga!")
-            print("🎯 Agora você pode capturá-la facilmente!")
+        # Pega posição atual da fugitiva e libera sua célula
+        fugitive_position = fugitive.position
+        self._remove_food(fugitive)
+        
+        # Cria nova comida normal na mesma posição
+        normal_food = Food(EntityType.FOOD_NORMAL, self._grid, self._rng)
+        self._add_food(normal_food, position=fugitive_position)
+        normal_food._animation_counter = 0.0
+        
+        self._stats['fugitive_transformations'] += 1
+        
+        self._logger.debug("🏃‍♀️ → 🍎 Comida fugitiva virou NORMAL após fuga!")
+        self._logger.debug("🎯 Agora você pode capturá-la facilmente!")
     
     def _create_consumption_effect(self, position: tuple, food_type: EntityType) -> None:
         """
@@ -193,18 +327,18 @@ class FoodManager:
         if food_type == EntityType.FOOD_SPECIAL:
             color = (255, 215, 0)  # Dourado
             particle_count = Effects.PARTICLE_BURST_COUNT
-            print("✨ Criando efeito dourado...")
-            
+            self._logger.debug("✨ Criando efeito dourado...")
+        
         elif food_type == EntityType.FOOD_FUGITIVE:
             color = (138, 43, 226)  # Violeta
             particle_count = Effects.PARTICLE_BURST_COUNT
-            print("💨 Criando efeito violeta...")
-            
+            self._logger.debug("💨 Criando efeito violeta...")
+        
         elif food_type == EntityType.FOOD_MIRROR:
             color = (0, 255, 255)  # Ciano
             particle_count = Effects.PARTICLE_BURST_COUNT * 2  # Mais partículas para espelho
-            print("🪞 Criando efeito espelho ciano...")
-            
+            self._logger.debug("🪞 Criando efeito espelho ciano...")
+        
         else:
             # Comida normal não tem efeito especial
             return
@@ -218,28 +352,42 @@ class FoodManager:
             direction = (math.cos(angle), math.sin(angle))
             
             # Velocidade aleatória entre 30-80 px/s
-            speed = random.uniform(30, 80)
+            speed = self._effects_rng.uniform(30, 80)
             
             # Cria e adiciona partícula
-            particle = EffectParticle((pixel_x, pixel_y), color, direction, speed)
+            particle = EffectParticle((pixel_x, pixel_y), color, direction, speed,
+                                      self._effects_rng)
             self._effect_particles.append(particle)
         
-        print(f"✨ Burst de {particle_count} partículas criado para {food_type.name}!")
+        self._logger.debug("✨ Burst de %d partículas criado para %s!", particle_count, food_type.name)
     
-    def consume_current_food(self) -> int:
+    def food_at(self, cell: Position) -> Optional[AnyFood]:
         """
-        Consome a comida atual e cria efeitos especiais
+        Retorna a comida ativa na célula (consulta O(1) ao índice)
+        
+        Args:
+            cell: Célula da arena
         
         Returns:
-            Pontos obtidos pela comida
+            Comida ou None
+        """
+        return self._foods.get(cell)
+    
+    def consume(self, food: AnyFood) -> int:
         """
-        if not self._current_food or not self._current_food.active:
-            return 0
+        Consome uma comida ativa e cria efeitos especiais
         
+        Args:
+            food: Comida ativa (de food_at())
+        
+        Returns:
+            Pontos obtidos pela comida
+        """
         # Captura informações antes do consumo
-        points = self._current_food.consume()
-        food_position = self._current_food.position
-        food_type = self._current_food.entity_type
+        food_position = food.position
+        food_type = food.entity_type
+        self._remove_food(food)
+        points = food.consume()
         
         # Cria efeito visual para comidas especiais
         self._create_consumption_effect(food_position, food_type)
@@ -247,48 +395,100 @@ class FoodManager:
         # Atualiza estatísticas e logs detalhados
         if food_type == EntityType.FOOD_NORMAL:
             self._stats['normal_consumed'] += 1
-            print(f"🍎 Comida normal consumida! (+{points} pontos)")
-            
+            self._logger.debug("🍎 Comida normal consumida! (+%d pontos)", points)
+        
         elif food_type == EntityType.FOOD_SPECIAL:
             self._stats['special_consumed'] += 1
-            print(f"⭐ Comida ESPECIAL consumida! (+{points} pontos) ✨")
-            
+            self._logger.debug("⭐ Comida ESPECIAL consumida! (+%d pontos) ✨", points)
+        
         elif food_type == EntityType.FOOD_FUGITIVE:
             self._stats['fugitive_consumed'] += 1
-            print(f"🏃‍♀️ Comida FUGITIVA capturada! (+{points} pontos) 💨")
-            
+            self._logger.debug("🏃‍♀️ Comida FUGITIVA capturada! (+%d pontos) 💨", points)
+        
         elif food_type == EntityType.FOOD_MIRROR:
             self._stats['mirror_consumed'] += 1
-            print(f"🪞 Comida ESPELHO consumida! (+{points} pontos) 🔄")
-            print("🎭 Prepare-se para a inversão de perspectiva!")
+            self._logger.debug("🪞 Comida ESPELHO consumida! (+%d pontos) 🔄", points)
+            self._logger.debug("🎭 Prepare-se para a inversão de perspectiva!")
         
         return points
     
-    def draw(self, surface) -> None:
+    def consume_current_food(self) -> int:
+        """
+        Consome a comida atual (a mais antiga) e cria efeitos especiais
+        
+        Returns:
+            Pontos obtidos pela comida
+        """
+        food = self.current_food
+        return self.consume(food) if food is not None else 0
+    
+    def _visible_foods(self, bounds: Optional[Tuple[int, int, int, int]]) -> Iterator[AnyFood]:
         """
-        Desenha a comida atual e todos os efeitos visuais
+        Itera as comidas dentro das células visíveis
+        
+        Percorre o que for menor: as células visíveis (consultando o
+        índice) ou as comidas ativas (filtrando pela área).
+        
+        Args:
+            bounds: Células visíveis (x0, y0, x1, y1) ou None para todas
+        """
+        if bounds is None:
+            yield from self._foods.values()
+            return
+        
+        x0, y0, x1, y1 = bounds
+        if (x1 - x0) * (y1 - y0) < len(self._foods):
+            foods = self._foods
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    food = foods.get((x, y))
+                    if food is not None:
+                        yield food
+            return
+        
+        for food in self._foods.values():
+            x, y = food.position
+            if x0 <= x < x1 and y0 <= y < y1:
+                yield food
+    
+    def draw(self, surface, offset: Tuple[int, int] = (0, 0),
+             bounds: Optional[Tuple[int, int, int, int]] = None) -> List[pygame.Rect]:
+        """
+        Desenha as comidas visíveis e todos os efeitos visuais
         
         Args:
             surface: Superfície onde desenhar
+            offset: Deslocamento da câmera em pixels
+            bounds: Células visíveis (x0, y0, x1, y1) ou None para todas
+        
+        Returns:
+            Áreas da tela alteradas (modo dirty rect)
         """
+        dirty_rects = []
+        
         # Desenha efeitos de partículas primeiro (camada de fundo)
         for particle in self._effect_particles:
-            particle.draw(surface)
+            rect = particle.draw(surface, offset)
+            if rect is not None:
+                dirty_rects.append(rect)
+        
+        # Desenha as comidas por cima dos efeitos (animadas sob demanda)
+        for food in self._visible_foods(bounds):
+            food.advance_animation(self._clock)
+            food.draw(surface, offset)
+            dirty_rects.extend(food.get_dirty_rects(offset))
         
-        # Desenha comida atual por cima dos efeitos
-        if self._current_food and self._current_food.active:
-            self._current_food.draw(surface)
+        return dirty_rects
     
     def get_bounds(self) -> Optional:
         """
-        Retorna os limites da comida atual para detecção de colisão
+        Retorna os limites da comida atual em pixels (renderização e depuração)
         
         Returns:
             Retângulo da comida ou None se não há comida ativa
         """
-        if self._current_food and self._current_food.active:
-            return self._current_food.get_bounds()
-        return None
+        food = self.current_food
+        return food.get_bounds() if food is not None else None
     
     def get_position(self) -> Optional:
         """
@@ -297,25 +497,39 @@ class FoodManager:
         Returns:
             Posição (x, y) da comida ou None se não há comida ativa
         """
-        if self._current_food and self._current_food.active:
-            return self._current_food.position
-        return None
+        food = self.current_food
+        return food.position if food is not None else None
     
-    def check_collision(self, other_bounds) -> bool:
+    def nearest_food(self, cell: Position) -> Optional[AnyFood]:
         """
-        Verifica colisão da comida atual com outro objeto
+        Retorna a comida ativa mais próxima da célula (distância de Manhattan)
+        
+        Empates ficam com a comida mais antiga.
         
         Args:
-            other_bounds: Limites do outro objeto (geralmente a cobra)
-            
+            cell: Célula de referência (geralmente a cabeça da cobra)
+        
         Returns:
-            True se houver colisão, False caso contrário
+            Comida mais próxima ou None se não há comida ativa
         """
-        if not self._current_food or not self._current_food.active:
-            return False
+        if len(self._foods) <= 1:
+            return self.current_food
         
-        food_bounds = self._current_food.get_bounds()
-        return food_bounds.colliderect(other_bounds) if food_bounds else False
+        x, y = cell
+        position = min(self._foods, key=lambda food: abs(food[0] - x) + abs(food[1] - y))
+        return self._foods[position]
+    
+    def check_collision(self, cell: Position) -> bool:
+        """
+        Verifica se alguma comida ocupa a célula
+        
+        Args:
+            cell: Célula do outro objeto (geralmente a cabeça da cobra)
+        
+        Returns:
+            True se houver colisão, False caso contrário
+        """
+        return cell in self._foods
     
     def is_food_active(self) -> bool:
         """
@@ -324,7 +538,7 @@ class FoodManager:
         Returns:
             True se há comida ativa e disponível para consumo
         """
-        return self._current_food is not None and self._current_food.active
+        return bool(self._foods)
     
     def get_food_type(self) -> Optional[EntityType]:
         """
@@ -333,9 +547,8 @@ class FoodManager:
         Returns:
             Tipo da comida atual ou None se não há comida
         """
-        if self._current_food:
-            return self._current_food.entity_type
-        return None
+        food = self.current_food
+        return food.entity_type if food is not None else None
     
     def print_statistics(self) -> None:
         """Imprime estatísticas completas de consumo de comidas"""
@@ -346,14 +559,15 @@ class FoodManager:
             self._stats['mirror_consumed']
         ])
         
-        print("\n📊 === ESTATÍSTICAS DE COMIDAS v2.0 ===")
-        print(f"🍎 Normais consumidas: {self._stats['normal_consumed']}")
-        print(f"⭐ Especiais consumidas: {self._stats['special_consumed']}")
-        print(f"🏃‍♀️ Fugitivas capturadas: {self._stats['fugitive_consumed']}")
-        print(f"🪞 Espelhos consumidos: {self._stats['mirror_consumed']}")
-        print(f"💨 Fugas bem-sucedidas: {self._stats['fugitive_escapes']}")
-        print(f"🔄 Fugitivas → Normais: {self._stats['fugitive_transformations']}")
-        print(f"🎯 Total de comidas: {total_consumed}")
+        log = self._logger.info
+        log("\n📊 === ESTATÍSTICAS DE COMIDAS v2.0 ===")
+        log("🍎 Normais consumidas: %d", self._stats['normal_consumed'])
+        log("⭐ Especiais consumidas: %d", self._stats['special_consumed'])
+        log("🏃‍♀️ Fugitivas capturadas: %d", self._stats['fugitive_consumed'])
+        log("🪞 Espelhos consumidos: %d", self._stats['mirror_consumed'])
+        log("💨 Fugas bem-sucedidas: %d", self._stats['fugitive_escapes'])
+        log("🔄 Fugitivas → Normais: %d", self._stats['fugitive_transformations'])
+        log("🎯 Total de comidas: %d", total_consumed)
         
         if total_consumed > 0:
             # Calcula taxas percentuais
@@ -361,28 +575,96 @@ class FoodManager:
             fugitive_rate = (self._stats['fugitive_consumed'] / total_consumed) * 100
             mirror_rate = (self._stats['mirror_consumed'] / total_consumed) * 100
             
-            print(f"\n📈 === TAXAS DE CONSUMO ===")
-            print(f"⭐ Taxa de especiais: {special_rate:.1f}%")
-            print(f"🏃‍♀️ Taxa de fugitivas: {fugitive_rate:.1f}%")
-            print(f"🪞 Taxa de espelhos: {mirror_rate:.1f}%")
+            log("\n📈 === TAXAS DE CONSUMO ===")
+            log("⭐ Taxa de especiais: %.1f%%", special_rate)
+            log("🏃‍♀️ Taxa de fugitivas: %.1f%%", fugitive_rate)
+            log("🪞 Taxa de espelhos: %.1f%%", mirror_rate)
             
             # Estatísticas avançadas
             if self._stats['fugitive_escapes'] > 0:
                 transformation_rate = (self._stats['fugitive_transformations'] / self._stats['fugitive_escapes']) * 100
-                print(f"🔄 Taxa transformação fugitivas: {transformation_rate:.1f}%")
+                log("🔄 Taxa transformação fugitivas: %.1f%%", transformation_rate)
+        
+        log("=" * 40)
+    
+    def snapshot(self) -> bytes:
+        """
+        Empacota o estado de jogo das comidas (sem partículas cosméticas)
+        
+        Returns:
+            Bytes com as estatísticas e tipo, posição e cooldown de cada comida
+        """
+        parts = [_STATS.pack(*(self._stats[key] for key in STATS_KEYS))]
+        for food in self._foods.values():
+            cooldown = food.escape_cooldown if isinstance(food, FugitiveFood) else 0.0
+            parts.append(_FOOD.pack(FOOD_TYPES.index(food.entity_type), *food.position, cooldown))
+        return b''.join(parts)
+    
+    def restore(self, state: bytes) -> None:
+        """
+        Restaura um estado gerado por snapshot()
+        
+        Não toca na grade nem conta com o gerador: o engine restaura os
+        dois depois, sobrescrevendo efeitos colaterais da criação das
+        comidas. Objetos do mesmo tipo na mesma ordem são reaproveitados.
+        
+        Args:
+            state: Bytes gerados por snapshot()
+        """
+        self._stats = dict(zip(STATS_KEYS, _STATS.unpack_from(state)))
+        self._effect_particles.clear()
         
-        print("=" * 40)
+        previous = list(self._foods.values())
+        self._foods = {}
+        self._revision += 1
+        self._alert_fugitives = {}
+        self._fugitive_count = 0
+        
+        records = _FOOD.iter_unpack(memoryview(state)[_STATS.size:])
+        for i, (type_index, x, y, cooldown) in enumerate(records):
+            food_type = FOOD_TYPES[type_index]
+            if i < len(previous) and previous[i].entity_type == food_type:
+                food = previous[i]
+            else:
+                food = self._create_food(food_type)
+            
+            if isinstance(food, FugitiveFood):
+                food.restore((x, y), True, cooldown)
+                self._alert_fugitives[food] = None
+                self._fugitive_count += 1
+            else:
+                food.restore((x, y), True)
+            food.sync_animation(self._clock)
+            self._foods[(x, y)] = food
+    
+    def _create_food(self, food_type: EntityType) -> AnyFood:
+        """
+        Cria uma comida do tipo pedido com a grade e o gerador do gerenciador
+        
+        Args:
+            food_type: Tipo da comida
+        
+        Returns:
+            Nova comida
+        """
+        if food_type == EntityType.FOOD_SPECIAL:
+            return SpecialFood(self._grid, self._rng)
+        if food_type == EntityType.FOOD_FUGITIVE:
+            return FugitiveFood(self._grid, self._distance_field, self._rng, self._logger)
+        if food_type == EntityType.FOOD_MIRROR:
+            return MirrorFood(self._grid, self._rng)
+        return Food(EntityType.FOOD_NORMAL, self._grid, self._rng)
     
     def reset(self) -> None:
         """Reseta o gerenciador para estado inicial"""
-        print("🔄 Resetando FoodManager...")
+        self._logger.info("🔄 Resetando FoodManager...")
         
-        # Reseta comida atual
-        if self._current_food:
-            self._current_food.deactivate()
+        # Retira todas as comidas
+        for food in list(self._foods.values()):
+            self._remove_food(food)
         
-        # Spawna nova comida normal
-        self._spawn_normal_food()
+        # Spawna as comidas iniciais
+        self._spawn_initial_foods()
         
         # Limpa todas as estatísticas
         self._stats = {
@@ -397,32 +679,38 @@ class FoodManager:
         # Limpa todos os efeitos visuais
         self._effect_particles.clear()
         
-        print("✅ FoodManager resetado com sucesso!")
+        self._logger.info("✅ FoodManager resetado com sucesso!")
     
-    def force_spawn_type(self, food_type: EntityType, snake_body: SnakeBody) -> None:
+    def force_spawn_type(self, food_type: EntityType, snake_body: BodyView) -> None:
         """
-        Força o spawn de um tipo específico de comida (para testes e debugging)
+        Força o spawn de um tipo específico de comida no lugar da atual
+        (para testes e debugging)
         
         Args:
             food_type: Tipo de comida a spawnar
             snake_body: Corpo da cobra para evitar spawnar em cima
         """
-        print(f"🧪 === TESTE: FORÇANDO SPAWN DE {food_type.name} ===")
+        self._logger.info("🧪 === TESTE: FORÇANDO SPAWN DE %s ===", food_type.name)
         
-        if food_type == EntityType.FOOD_SPECIAL:
-            self._spawn_special_food()
-        elif food_type == EntityType.FOOD_FUGITIVE:
-            self._spawn_fugitive_food()
-        elif food_type == EntityType.FOOD_MIRROR:
-            self._spawn_mirror_food()
-        else:
-            self._spawn_normal_food()
+        if self.current_food is not None:
+            self._remove_food(self.current_food)
+        self._spawn_food(food_type, snake_body)
         
-        # Reposiciona evitando a cobra
-        if self._current_food:
-            self._current_food.respawn(snake_body)
+        self._logger.info("✅ %s spawnada com sucesso!", food_type.name)
+    
+    def place_food(self, food_type: EntityType, position: Position) -> bool:
+        """
+        Coloca mais uma comida do tipo pedido numa célula exata
+        (para testes e benchmarks)
         
-        print(f"✅ {food_type.name} spawnada com sucesso!")
+        Args:
+            food_type: Tipo de comida
+            position: Célula sem cobra (não é verificada)
+        
+        Returns:
+            True se a comida entrou na arena, False se a célula já tem comida
+        """
+        return self._add_food(self._create_food(food_type), position=position)
     
     def get_effect_particles_count(self) -> int:
         """
@@ -436,7 +724,7 @@ class FoodManager:
     def clear_all_effects(self) -> None:
         """Limpa todos os efeitos visuais ativos"""
         self._effect_particles.clear()
-        print("🧹 Todos os efeitos visuais foram limpos")
+        self._logger.debug("🧹 Todos os efeitos visuais foram limpos")
     
     def get_detailed_stats(self) -> dict:
         """
@@ -457,5 +745,6 @@ class FoodManager:
             'total_consumed': total_consumed,
             'active_particles': self.get_effect_particles_count(),
             'current_food_type': self.get_food_type().name if self.get_food_type() else None,
-            'food_active': self.is_food_active()
+            'food_active': self.is_food_active(),
+            'active_foods': len(self._foods)
         }
@@ -16,6 +16,9 @@ class GameObject(ABC):
     - Abstração: Define interface comum
     - Encapsulamento: Propriedades protegidas
     - Polimorfismo: Métodos abstratos implementados pelas subclasses
+    
+    Colisões comparam células inteiras do grid (`cell`); os retângulos
+    de get_bounds() ficam para renderização e depuração.
     """
     
     def __init__(self, position: Position, entity_type: EntityType):
@@ -40,6 +43,11 @@ class GameObject(ABC):
         """Define nova posição do objeto"""
         self._position = new_position
     
+    @property
+    def cell(self) -> Position:
+        """Retorna a célula do grid ocupada pelo objeto (usada nas colisões)"""
+        return self._position
+    
     @property
     def entity_type(self) -> EntityType:
         """Retorna o tipo da entidade"""
@@ -71,7 +79,7 @@ class GameObject(ABC):
     @abstractmethod
     def get_bounds(self) -> pygame.Rect:
         """
-        Retorna os limites do objeto para detecção de colisão
+        Retorna os limites do objeto em pixels (renderização e depuração)
         
         Returns:
             Retângulo representando os limites
@@ -80,7 +88,7 @@ class GameObject(ABC):
     
     def collides_with(self, other: 'GameObject') -> bool:
         """
-        Verifica colisão com outro objeto
+        Verifica colisão com outro objeto (mesma célula do grid)
         
         Args:
             other: Outro objeto para verificar colisão
@@ -91,7 +99,7 @@ class GameObject(ABC):
         if not self.active or not other.active:
             return False
         
-        return self.get_bounds().colliderect(other.get_bounds())
+        return self.cell == other.cell
     
     def __repr__(self) -> str:
         """Representação em string do objeto"""
@@ -4,11 +4,81 @@ Princípios POO: Herança, encapsulamento, responsabilidade única
 """
 
 import pygame
-from typing import List
+import struct
+from collections import deque
+from itertools import chain, islice
+from typing import Deque, Iterator, List, Optional, Tuple
 from entities.game_object import GameObject
 from utils.types import Position, Surface, SnakeBody
 from utils.enums import Direction, EntityType
-from config.settings import GRID_SIZE, Colors, GRID_WIDTH, GRID_HEIGHT
+from utils.occupancy_grid import OccupancyGrid, CELL_SNAKE, CELL_WALL
+from graphics.sprites import SnakeSpriteAtlas, get_snake_atlas
+from config.settings import GRID_SIZE, Colors, DIRECTION_QUEUE_SIZE
+
+# Estado escalar empacotado: direção, flags e célula anterior da cauda,
+# seguidos de um byte por curva na fila de direções (o corpo segue à
+# parte, como tupla de posições)
+_DIRECTIONS = tuple(Direction)
+_DIRECTION_INDEX = {direction: index for index, direction in enumerate(_DIRECTIONS)}
+_STATE = struct.Struct('<BBhh')
+_FLAG_GROW = 1
+_FLAG_ACTIVE = 2
+_FLAG_SELF_COLLISION = 4
+_FLAG_WALL_COLLISION = 8
+
+# Segmentos desenhados com interpolação quando a câmera rola; o resto
+# do corpo visível é lido da grade de ocupação
+_DETAILED_SEGMENTS = 16
+
+class SnakeBodyView:
+    """
+    Visão somente leitura do corpo da cobra, sem cópia
+    
+    Reflete o estado atual da cobra a cada acesso. O contador
+    `generation` muda sempre que o corpo muda, permitindo que
+    consumidores pulem trabalho quando nada mudou.
+    """
+    
+    __slots__ = ('_snake',)
+    
+    def __init__(self, snake: 'Snake'):
+        """
+        Inicializa a visão
+        
+        Args:
+            snake: Cobra observada
+        """
+        self._snake = snake
+    
+    @property
+    def generation(self) -> int:
+        """Retorna o contador de mudanças do corpo"""
+        return self._snake._generation
+    
+    @property
+    def head(self) -> Position:
+        """Retorna a posição da cabeça"""
+        return self._snake._body[0]
+    
+    def __contains__(self, position: object) -> bool:
+        """Verifica em O(1) se a posição é ocupada pela cobra"""
+        return self._snake._grid.is_snake(position)
+    
+    def __iter__(self) -> Iterator[Position]:
+        """Itera da cabeça para a cauda"""
+        return iter(self._snake._body)
+    
+    def __len__(self) -> int:
+        """Retorna o número de segmentos"""
+        return len(self._snake._body)
+    
+    def __getitem__(self, index: int) -> Position:
+        """Retorna o segmento no índice (0 = cabeça, -1 = cauda)"""
+        return self._snake._body[index]
+    
+    def __repr__(self) -> str:
+        """Representação em string da visão"""
+        return f"SnakeBodyView(length={len(self)}, generation={self.generation})"
 
 class Snake(GameObject):
     """
@@ -21,23 +91,57 @@ class Snake(GameObject):
     - Renderização
     """
     
-    def __init__(self, initial_position: Position):
+    def __init__(self, initial_position: Position, grid: Optional[OccupancyGrid] = None):
         """
         Inicializa a cobra
         
         Args:
             initial_position: Posição inicial da cabeça
+            grid: Grade de ocupação compartilhada da arena (cria uma se None)
         """
         super().__init__(initial_position, EntityType.SNAKE_HEAD)
-        self._body: SnakeBody = [initial_position]
+        
+        # Corpo em deque (cabeça à esquerda) + flags na grade de ocupação:
+        # mover, crescer e checar colisões são O(1)
+        self._grid = grid if grid is not None else OccupancyGrid()
+        self._body: Deque[Position] = deque([initial_position])
+        self._grid.set_flag(initial_position, CELL_SNAKE)
+        # Célula de onde o último segmento veio no tick anterior
+        # (interpolação entre ticks no desenho)
+        self._previous_tail = initial_position
+        self._self_collision = False
+        self._wall_collision = False
+        self._generation = 0
+        self._body_view = SnakeBodyView(self)
         self._direction = Direction.RIGHT
-        self._next_direction = Direction.RIGHT
+        # Curvas pedidas para os próximos ticks (uma aplicada por movimento)
+        self._direction_queue: Deque[Direction] = deque()
         self._should_grow = False
     
     @property
     def body(self) -> SnakeBody:
-        """Retorna o corpo da cobra"""
-        return self._body.copy()
+        """Retorna uma cópia do corpo da cobra"""
+        return list(self._body)
+    
+    @property
+    def body_view(self) -> SnakeBodyView:
+        """Retorna a visão somente leitura do corpo (sem cópia)"""
+        return self._body_view
+    
+    @property
+    def generation(self) -> int:
+        """Retorna o contador de mudanças do corpo"""
+        return self._generation
+    
+    @property
+    def grid(self) -> OccupancyGrid:
+        """Retorna a grade de ocupação usada pela cobra"""
+        return self._grid
+    
+    @property
+    def previous_tail(self) -> Position:
+        """Retorna a célula de onde o último segmento veio no último movimento"""
+        return self._previous_tail
     
     @property
     def head_position(self) -> Position:
@@ -49,47 +153,93 @@ class Snake(GameObject):
         """Retorna o comprimento da cobra"""
         return len(self._body)
     
+    @property
+    def growing(self) -> bool:
+        """Retorna se a cobra cresce no próximo movimento (a cauda fica)"""
+        return self._should_grow
+    
     @property
     def direction(self) -> Direction:
         """Retorna a direção atual"""
         return self._direction
     
-    def change_direction(self, new_direction: Direction) -> None:
+    @property
+    def queued_directions(self) -> Tuple[Direction, ...]:
+        """Retorna as curvas ainda não aplicadas, da próxima para a última"""
+        return tuple(self._direction_queue)
+    
+    def change_direction(self, new_direction: Direction) -> bool:
         """
-        Muda a direção da cobra (evita direção oposta)
+        Enfileira uma curva para um dos próximos movimentos
+        
+        Cada movimento aplica uma curva da fila, então duas teclas
+        apertadas dentro do mesmo tick viram duas curvas em ticks
+        seguidos. A curva é validada contra a última direção da fila
+        (ou a atual): repetir a direção ou inverter o sentido é ignorado,
+        assim como pedidos além de DIRECTION_QUEUE_SIZE.
         
         Args:
             new_direction: Nova direção desejada
+        
+        Returns:
+            True se a curva entrou na fila
         """
-        if new_direction != self._direction.opposite:
-            self._next_direction = new_direction
+        queue = self._direction_queue
+        last = queue[-1] if queue else self._direction
+        if (new_direction is last or new_direction is last.opposite or
+                len(queue) >= DIRECTION_QUEUE_SIZE):
+            return False
+        queue.append(new_direction)
+        return True
+    
+    def clear_direction_queue(self) -> None:
+        """Descarta as curvas ainda não aplicadas"""
+        self._direction_queue.clear()
     
     def grow(self) -> None:
         """Marca a cobra para crescer na próxima movimentação"""
         self._should_grow = True
     
     def move(self) -> None:
-        """Move a cobra na direção atual"""
-        if not self.active:
+        """
+        Move a cobra na direção atual
+        
+        As colisões são resolvidas aqui com uma leitura da grade de
+        ocupação. A borda da grade é parede, então a cabeça nunca sai
+        mais de uma célula da arena: depois de bater, a cobra para.
+        """
+        if not self.active or self._wall_collision:
             return
         
-        # Atualiza direção se necessário
-        self._direction = self._next_direction
+        # Aplica a próxima curva da fila
+        if self._direction_queue:
+            self._direction = self._direction_queue.popleft()
         
         # Calcula nova posição da cabeça
-        head_x, head_y = self.head_position
-        dx, dy = self._direction.delta
+        head_x, head_y = self._body[0]
+        dx, dy = self._direction.value
         new_head = (head_x + dx, head_y + dy)
         
-        # Adiciona nova cabeça
-        self._body.insert(0, new_head)
-        self._position = new_head
+        grid = self._grid
+        stride = grid.stride
         
-        # Remove cauda se não deve crescer
+        # Remove cauda antes de ocupar a nova cabeça (a cabeça pode
+        # entrar na célula que a cauda acabou de liberar)
         if not self._should_grow:
-            self._body.pop()
+            tail_x, tail_y = self._previous_tail = self._body.pop()
+            grid.unmark_index((tail_y + 1) * stride + tail_x + 1, CELL_SNAKE)
         else:
+            self._previous_tail = self._body[-1]
             self._should_grow = False
+        
+        # Adiciona nova cabeça (colisão = célula já ocupada por cobra ou parede)
+        flags = grid.mark_index((new_head[1] + 1) * stride + new_head[0] + 1, CELL_SNAKE)
+        self._self_collision = bool(flags & CELL_SNAKE)
+        self._wall_collision = bool(flags & CELL_WALL)
+        
+        self._body.appendleft(new_head)
+        self._position = new_head
+        self._generation += 1
     
     def check_self_collision(self) -> bool:
         """
@@ -98,7 +248,7 @@ class Snake(GameObject):
         Returns:
             True se houve colisão consigo mesma
         """
-        return self.head_position in self._body[1:]
+        return self._self_collision
     
     def check_wall_collision(self) -> bool:
         """
@@ -107,9 +257,7 @@ class Snake(GameObject):
         Returns:
             True se houve colisão com parede
         """
-        head_x, head_y = self.head_position
-        return (head_x < 0 or head_x >= GRID_WIDTH or 
-                head_y < 0 or head_y >= GRID_HEIGHT)
+        return self._wall_collision
     
     def reset(self, initial_position: Position) -> None:
         """
@@ -118,118 +266,171 @@ class Snake(GameObject):
         Args:
             initial_position: Nova posição inicial
         """
+        for segment in self._body:
+            self._grid.clear_flag(segment, CELL_SNAKE)
+        
         self._position = initial_position
-        self._body = [initial_position]
+        self._body = deque([initial_position])
+        self._grid.set_flag(initial_position, CELL_SNAKE)
+        self._previous_tail = initial_position
+        self._self_collision = False
+        self._wall_collision = False
+        self._generation += 1
         self._direction = Direction.RIGHT
-        self._next_direction = Direction.RIGHT
+        self._direction_queue.clear()
         self._should_grow = False
         self.activate()
     
-    def draw(self, surface: Surface) -> None:
+    def snapshot(self) -> Tuple[bytes, Tuple[Position, ...]]:
+        """
+        Captura o estado da cobra
+        
+        Os escalares e a fila de curvas vão empacotados; o corpo vira uma
+        tupla que apenas referencia as posições (imutáveis) já existentes,
+        uma cópia rasa feita em C. Não inclui a grade de ocupação (a arena
+        salva a sua).
+        
+        Returns:
+            Tupla (escalares empacotados, corpo da cabeça para a cauda)
+        """
+        flags = ((_FLAG_GROW if self._should_grow else 0) |
+                 (_FLAG_ACTIVE if self._active else 0) |
+                 (_FLAG_SELF_COLLISION if self._self_collision else 0) |
+                 (_FLAG_WALL_COLLISION if self._wall_collision else 0))
+        header = (_STATE.pack(_DIRECTION_INDEX[self._direction], flags, *self._previous_tail) +
+                  bytes(_DIRECTION_INDEX[direction] for direction in self._direction_queue))
+        return header, tuple(self._body)
+    
+    def restore(self, state: Tuple[bytes, Tuple[Position, ...]]) -> None:
+        """
+        Restaura um estado gerado por snapshot()
+        
+        Não toca na grade de ocupação. A geração avança (não volta), então
+        caches baseados nela nunca confundem o corpo restaurado com outro.
+        
+        Args:
+            state: Tupla gerada por snapshot()
+        """
+        header, body = state
+        direction, flags, tail_x, tail_y = _STATE.unpack_from(header)
+        
+        self._body = deque(body)
+        self._position = body[0]
+        self._direction = _DIRECTIONS[direction]
+        self._direction_queue = deque(_DIRECTIONS[index] for index in header[_STATE.size:])
+        self._should_grow = bool(flags & _FLAG_GROW)
+        self._active = bool(flags & _FLAG_ACTIVE)
+        self._self_collision = bool(flags & _FLAG_SELF_COLLISION)
+        self._wall_collision = bool(flags & _FLAG_WALL_COLLISION)
+        self._previous_tail = (tail_x, tail_y)
+        self._generation += 1
+    
+    def draw(self, surface: Surface, alpha: float = 1.0,
+             camera: Optional['Camera'] = None) -> List[pygame.Rect]:
         """
         Desenha a cobra com visual Gruvbox moderno
         
+        Cada segmento é desenhado entre a célula do tick anterior e a
+        atual: a célula anterior do segmento i é a atual do segmento
+        i + 1 (e a do último é a cauda removida no tick). Os sprites vêm
+        prontos do atlas e a cobra inteira sai num único Surface.blits().
+        
         Args:
             surface: Superfície onde desenhar
+            alpha: Fração do tick decorrida (0.0 = tick anterior, 1.0 = atual)
+            camera: Câmera da arena (se rolando, desenha só a área visível)
+        
+        Returns:
+            Áreas da tela alteradas (modo dirty rect)
         """
         if not self.active:
-            return
+            return []
+        
+        atlas = get_snake_atlas()
+        if camera is not None and camera.enabled:
+            blits = self._visible_blits(atlas, alpha, camera)
+        else:
+            previous_cells = chain(islice(self._body, 1, None), (self._previous_tail,))
+            blits = [self._segment_blit(atlas, i, segment, previous, alpha)
+                     for i, (segment, previous) in enumerate(zip(self._body, previous_cells))]
+        
+        return surface.blits(blits)
+    
+    def _visible_blits(self, atlas: SnakeSpriteAtlas, alpha: float,
+                       camera: 'Camera') -> List[Tuple[Surface, Tuple[int, int]]]:
+        """
+        Lista os blits da parte visível da cobra, com custo independente do tamanho
+        
+        Os primeiros _DETAILED_SEGMENTS segmentos (com sombra e gradiente)
+        e a cauda são interpolados; o resto do corpo, que só muda nas
+        pontas, é lido da grade de ocupação nas células visíveis.
+        
+        Args:
+            atlas: Atlas de sprites da cobra
+            alpha: Fração do tick decorrida
+            camera: Câmera da arena
+        
+        Returns:
+            Lista de (sprite, posição) na ordem de desenho
+        """
+        offset = camera.offset
+        front = list(islice(self._body, _DETAILED_SEGMENTS + 1))
+        front.append(self._previous_tail)
+        drawn = set()
+        blits = []
+        
+        for i in range(min(_DETAILED_SEGMENTS, len(self._body))):
+            drawn.add(front[i])
+            if camera.contains(front[i]):
+                blits.append(self._segment_blit(atlas, i, front[i], front[i + 1], alpha, offset))
+        
+        cells = self._grid.cells
+        stride = self._grid.stride
+        x0, y0, x1, y1 = camera.bounds
+        for y in range(y0, y1):
+            row = (y + 1) * stride + 1
+            for x in range(x0, x1):
+                if cells[row + x] & CELL_SNAKE and (x, y) not in drawn:
+                    blits.append(self._segment_blit(atlas, _DETAILED_SEGMENTS, (x, y), (x, y), 1.0, offset))
+        
+        # A cauda desliza da célula liberada no tick até a atual
+        tail = self._body[-1]
+        if len(self._body) > _DETAILED_SEGMENTS and camera.contains(tail):
+            blits.append(self._segment_blit(atlas, _DETAILED_SEGMENTS, tail, self._previous_tail,
+                                            alpha, offset))
+        return blits
+    
+    def _segment_blit(self, atlas: SnakeSpriteAtlas, i: int, segment: Position, previous: Position,
+                      alpha: float, offset: Tuple[int, int] = (0, 0)) -> Tuple[Surface, Tuple[int, int]]:
+        """
+        Calcula o blit de um segmento interpolado entre a célula anterior e a atual
+        
+        Args:
+            atlas: Atlas de sprites da cobra
+            i: Índice do segmento (0 = cabeça)
+            segment: Célula atual
+            previous: Célula no tick anterior
+            alpha: Fração do tick decorrida
+            offset: Deslocamento da câmera em pixels
+        
+        Returns:
+            Tupla (sprite, canto superior esquerdo na tela)
+        """
+        x, y = segment
+        if alpha < 1.0:
+            prev_x, prev_y = previous
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
         
-        for i, segment in enumerate(self._body):
-            x, y = segment
-            center_x = x * GRID_SIZE + GRID_SIZE // 2
-            center_y = y * GRID_SIZE + GRID_SIZE // 2
-            
-            if i == 0:  # Cabeça
-                # Sombra da cabeça
-                shadow_offset = 2
-                shadow_surface = pygame.Surface((GRID_SIZE + 4, GRID_SIZE + 4))
-                shadow_surface.set_alpha(100)
-                shadow_surface.set_colorkey(Colors.BLACK)
-                pygame.draw.circle(shadow_surface, Colors.SHADOW_COLOR, 
-                                 ((GRID_SIZE + 4) // 2, (GRID_SIZE + 4) // 2), 
-                                 GRID_SIZE // 2)
-                surface.blit(shadow_surface, 
-                           (center_x - GRID_SIZE // 2 + shadow_offset - 2, 
-                            center_y - GRID_SIZE // 2 + shadow_offset - 2))
-                
-                # Gradiente da cabeça (verde brilhante Gruvbox)
-                head_radius = GRID_SIZE // 2 - 1
-                
-                # Brilho externo
-                for glow_radius in range(head_radius + 6, head_radius, -1):
-                    alpha = max(0, 30 - (glow_radius - head_radius) * 5)
-                    if alpha > 0:
-                        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2))
-                        glow_surface.set_alpha(alpha)
-                        glow_surface.set_colorkey(Colors.BLACK)
-                        pygame.draw.circle(glow_surface, Colors.SNAKE_HEAD, 
-                                         (glow_radius, glow_radius), glow_radius)
-                        surface.blit(glow_surface, 
-                                   (center_x - glow_radius, center_y - glow_radius))
-                
-                # Cabeça principal com gradiente
-                pygame.draw.circle(surface, Colors.SNAKE_HEAD, (center_x, center_y), head_radius)
-                
-                # Círculo interno mais claro
-                inner_radius = head_radius - 2
-                if inner_radius > 0:
-                    pygame.draw.circle(surface, Colors.BRIGHT_GREEN, 
-                                     (center_x, center_y), inner_radius)
-                
-                # Olhos com tema Gruvbox
-                eye_size = max(2, GRID_SIZE // 8)
-                eye_offset_x = GRID_SIZE // 4
-                eye_offset_y = GRID_SIZE // 6
-                
-                # Olho esquerdo
-                left_eye_x = center_x - eye_offset_x
-                left_eye_y = center_y - eye_offset_y
-                pygame.draw.circle(surface, Colors.FG_LIGHT, (left_eye_x, left_eye_y), eye_size)
-                pygame.draw.circle(surface, Colors.BG_DARK, (left_eye_x, left_eye_y), eye_size - 1)
-                
-                # Olho direito
-                right_eye_x = center_x + eye_offset_x
-                right_eye_y = center_y - eye_offset_y
-                pygame.draw.circle(surface, Colors.FG_LIGHT, (right_eye_x, right_eye_y), eye_size)
-                pygame.draw.circle(surface, Colors.BG_DARK, (right_eye_x, right_eye_y), eye_size - 1)
-                
-                # Borda da cabeça
-                pygame.draw.circle(surface, Colors.BG_DARK, (center_x, center_y), head_radius, 2)
-                
-            else:  # Corpo
-                # Sombra do corpo
-                shadow_surface = pygame.Surface((GRID_SIZE + 2, GRID_SIZE + 2))
-                shadow_surface.set_alpha(80 - i * 5)  # Sombra diminui com distância
-                shadow_surface.set_colorkey(Colors.BLACK)
-                pygame.draw.circle(shadow_surface, Colors.SHADOW_COLOR, 
-                                 ((GRID_SIZE + 2) // 2, (GRID_SIZE + 2) // 2), 
-                                 GRID_SIZE // 2 - 1)
-                surface.blit(shadow_surface, 
-                           (center_x - GRID_SIZE // 2 + 1 - 1, 
-                            center_y - GRID_SIZE // 2 + 1 - 1))
-                
-                # Cor do corpo com gradiente baseado na posição
-                segment_intensity = max(0.6, 1.0 - (i * 0.05))  # Gradiente mais sutil
-                body_color = tuple(int(c * segment_intensity) for c in Colors.SNAKE_BODY)
-                
-                body_radius = GRID_SIZE // 2 - 2
-                
-                # Corpo principal
-                pygame.draw.circle(surface, body_color, (center_x, center_y), body_radius)
-                
-                # Highlight interno
-                inner_color = tuple(min(255, int(c * 1.2)) for c in body_color)
-                inner_radius = body_radius - 2
-                if inner_radius > 0:
-                    pygame.draw.circle(surface, inner_color, (center_x, center_y), inner_radius)
-                
-                # Borda sutil
-                pygame.draw.circle(surface, Colors.BG_DARK, (center_x, center_y), body_radius, 1)
+        # Canto do sprite: centro da célula menos o âncora do atlas
+        corner = GRID_SIZE // 2 - atlas.anchor
+        sprite = atlas.head(self._direction) if i == 0 else atlas.body(i)
+        return sprite, (int(x * GRID_SIZE) + corner + offset[0],
+                        int(y * GRID_SIZE) + corner + offset[1])
     
     def get_bounds(self) -> pygame.Rect:
         """
-        Retorna os limites da cabeça para detecção de colisão
+        Retorna os limites da cabeça em pixels (renderização e depuração)
         
         Returns:
             Retângulo da cabeça
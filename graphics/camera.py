@@ -0,0 +1,118 @@
+"""
+Câmera da arena
+Mostra uma janela de GRID_WIDTH x GRID_HEIGHT células de uma arena
+maior, rolando em células inteiras para seguir a cabeça da cobra
+"""
+
+from typing import Tuple
+from utils.types import Position
+from config.settings import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, CAMERA_MARGIN
+
+class Camera:
+    """
+    Janela visível sobre a arena
+    
+    A câmera só rola quando a cabeça chega a CAMERA_MARGIN células da
+    borda da tela e nunca mostra além dos limites da arena. Com a arena
+    do tamanho da tela ela fica parada na origem e o desenho é idêntico
+    ao de antes da câmera.
+    """
+    
+    def __init__(self, arena_width: int, arena_height: int,
+                 view_width: int = GRID_WIDTH, view_height: int = GRID_HEIGHT,
+                 margin: int = CAMERA_MARGIN):
+        """
+        Inicializa a câmera
+        
+        Args:
+            arena_width: Largura da arena em células
+            arena_height: Altura da arena em células
+            view_width: Largura visível em células
+            view_height: Altura visível em células
+            margin: Células entre a cabeça e a borda antes de rolar
+        """
+        self._arena_width = arena_width
+        self._arena_height = arena_height
+        self._view_width = view_width
+        self._view_height = view_height
+        self._margin = margin
+        self._x = 0
+        self._y = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Retorna se a arena é maior que a área visível (a câmera rola)"""
+        return self._arena_width > self._view_width or self._arena_height > self._view_height
+    
+    @property
+    def origin(self) -> Position:
+        """Retorna a célula da arena no canto superior esquerdo da tela"""
+        return self._x, self._y
+    
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Retorna o deslocamento em pixels de coordenadas da arena para a tela"""
+        return -self._x * GRID_SIZE, -self._y * GRID_SIZE
+    
+    @property
+    def bounds(self) -> Tuple[int, int, int, int]:
+        """Retorna as células visíveis como (x0, y0, x1, y1), x1 e y1 exclusivos"""
+        return (self._x, self._y,
+                min(self._x + self._view_width, self._arena_width),
+                min(self._y + self._view_height, self._arena_height))
+    
+    def _clamp(self, origin: int, view: int, arena: int) -> int:
+        """
+        Limita a origem para a janela não sair da arena
+        
+        Args:
+            origin: Origem desejada em células
+            view: Tamanho visível
+            arena: Tamanho da arena
+        """
+        return max(0, min(origin, arena - view))
+    
+    def center_on(self, position: Position) -> None:
+        """
+        Centraliza a câmera na posição (reinício da partida)
+        
+        Args:
+            position: Célula da arena
+        """
+        x, y = position
+        self._x = self._clamp(x - self._view_width // 2, self._view_width, self._arena_width)
+        self._y = self._clamp(y - self._view_height // 2, self._view_height, self._arena_height)
+    
+    def follow(self, position: Position) -> None:
+        """
+        Rola a câmera o mínimo necessário para manter a posição fora da margem
+        
+        Args:
+            position: Célula seguida (cabeça da cobra)
+        """
+        x, y = position
+        margin = self._margin
+        
+        if x < self._x + margin:
+            self._x = x - margin
+        elif x >= self._x + self._view_width - margin:
+            self._x = x - self._view_width + margin + 1
+        
+        if y < self._y + margin:
+            self._y = y - margin
+        elif y >= self._y + self._view_height - margin:
+            self._y = y - self._view_height + margin + 1
+        
+        self._x = self._clamp(self._x, self._view_width, self._arena_width)
+        self._y = self._clamp(self._y, self._view_height, self._arena_height)
+    
+    def contains(self, position: Position) -> bool:
+        """
+        Verifica se a célula está na área visível
+        
+        Args:
+            position: Célula da arena
+        """
+        x, y = position
+        return (self._x <= x < self._x + self._view_width and
+                self._y <= y < self._y + self._view_height)
@@ -7,13 +7,17 @@ Versão 3.0 com foco em qualidade visual e performance
 import pygame
 import math
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from utils.types import Surface, Color
+from utils.logger import get_logger
+from graphics.sprites import get_snake_atlas
 from config.settings import (
     WINDOW_WIDTH, WINDOW_HEIGHT, PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT, GRID_SIZE, 
-    Colors, WINDOW_TITLE, Effects
+    Colors, WINDOW_TITLE, Effects, DIRTY_RECT_RENDERING
 )
 
+_logger = get_logger('renderer')
+
 class GradientHelper:
     """Utilitário para criar gradientes suaves otimizados"""
     
@@ -37,8 +41,9 @@ class GradientHelper:
         # Otimização: desenha círculos concêntricos ao invés de pixel por pixel
         steps = min(max_radius, 50)  # Limita passos para performance
         
+        # Do maior círculo (cor da borda) para o menor (cor do centro)
         for i in range(steps, 0, -1):
-            progress = 1.0 - (i / steps)
+            progress = i / steps
             current_radius = int(max_radius * (i / steps))
             
             # Interpola cores
@@ -94,18 +99,23 @@ class GradientHelper:
 class AmbientParticle:
     """Partícula ambiental otimizada para atmosfera Gruvbox"""
     
-    def __init__(self):
-        """Inicializa partícula com propriedades aleatórias"""
-        self.x = random.uniform(-50, WINDOW_WIDTH + 50)
-        self.y = random.uniform(-50, WINDOW_HEIGHT + 50)
-        self.size = random.uniform(0.5, 2.5)
-        self.speed = random.uniform(8, 25)
-        self.direction = random.uniform(0, 2 * math.pi)
-        self.base_alpha = random.randint(20, 60)
-        self.alpha_variation = random.uniform(0.5, 1.5)
+    def __init__(self, rng=random):
+        """
+        Inicializa partícula com propriedades aleatórias
+        
+        Args:
+            rng: Gerador cosmético (módulo random por padrão)
+        """
+        self.x = rng.uniform(-50, WINDOW_WIDTH + 50)
+        self.y = rng.uniform(-50, WINDOW_HEIGHT + 50)
+        self.size = rng.uniform(0.5, 2.5)
+        self.speed = rng.uniform(8, 25)
+        self.direction = rng.uniform(0, 2 * math.pi)
+        self.base_alpha = rng.randint(20, 60)
+        self.alpha_variation = rng.uniform(0.5, 1.5)
         
         # Cores Gruvbox para partículas
-        self.color = random.choice([
+        self.color = rng.choice([
             Colors.FG_DARK,
             Colors.BG_LIGHT, 
             Colors.YELLOW,
@@ -113,10 +123,10 @@ class AmbientParticle:
             Colors.AQUA
         ])
         
-        self.lifetime = random.uniform(8, 20)
+        self.lifetime = rng.uniform(8, 20)
         self.age = 0
-        self.drift_speed = random.uniform(0.5, 2.0)
-        self.drift_offset = random.uniform(0, 2 * math.pi)
+        self.drift_speed = rng.uniform(0.5, 2.0)
+        self.drift_offset = rng.uniform(0, 2 * math.pi)
     
     def update(self, delta_time: float) -> None:
         """Atualiza posição e propriedades da partícula"""
@@ -144,15 +154,20 @@ class AmbientParticle:
         elif self.y > WINDOW_HEIGHT + margin:
             self.y = -margin
     
-    def draw(self, surface: Surface) -> None:
-        """Desenha partícula com brilho suave otimizado"""
+    def draw(self, surface: Surface) -> Optional[pygame.Rect]:
+        """
+        Desenha partícula com brilho suave otimizado
+        
+        Returns:
+            Área da tela alterada ou None se a partícula está invisível
+        """
         # Calcula alpha dinâmico
         life_factor = min(self.age / 2, (self.lifetime - self.age) / 3, 1)
         breath_factor = 1 + 0.3 * math.sin(self.age * self.alpha_variation)
         current_alpha = int(self.base_alpha * life_factor * breath_factor)
         
         if current_alpha <= 5:
-            return
+            return None
         
         # Tamanho dinâmico
         current_size = max(0.5, self.size * life_factor)
@@ -160,8 +175,8 @@ class AmbientParticle:
         # Otimização: apenas uma camada de brilho para partículas pequenas
         if current_size < 1.5:
             # Partícula simples
-            pygame.draw.circle(surface, self.color, 
-                             (int(self.x), int(self.y)), int(current_size))
+            return pygame.draw.circle(surface, self.color, 
+                                      (int(self.x), int(self.y)), int(current_size))
         else:
             # Partícula com brilho sutil
             glow_surface = pygame.Surface((int(current_size * 4), int(current_size * 4)), pygame.SRCALPHA)
@@ -175,8 +190,8 @@ class AmbientParticle:
             pygame.draw.circle(glow_surface, (*self.color, current_alpha), 
                              glow_center, int(current_size))
             
-            surface.blit(glow_surface, 
-                        (int(self.x - current_size * 2), int(self.y - current_size * 2)))
+            return surface.blit(glow_surface, 
+                                (int(self.x - current_size * 2), int(self.y - current_size * 2)))
     
     def is_alive(self) -> bool:
         """Verifica se a partícula ainda está viva"""
@@ -195,15 +210,37 @@ class Renderer:
     - Sistema de cache para performance
     """
     
-    def __init__(self):
-        """Inicializa o renderer avançado"""
+    def __init__(self, rng=random):
+        """
+        Inicializa o renderer avançado
+        
+        Args:
+            rng: Gerador cosmético das partículas ambientais (módulo random por padrão)
+        """
+        self._rng = rng
         pygame.display.init()
         self._screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption(WINDOW_TITLE)
         
-        # Superfícies cachadas para performance
-        self._background_cache = self._create_dynamic_background()
-        self._grid_cache = self._create_grid_cache()
+        # Modo dirty rect: áreas desenhadas no frame atual e no anterior
+        # (None força a tela inteira no próximo frame)
+        self._full_redraw = True
+        self._unreported_changes = True
+        self._dirty_rects: List[pygame.Rect] = []
+        self._previous_rects: Optional[List[pygame.Rect]] = None
+        
+        # Fundo parado (gradiente, borda e grid) composto numa só superfície
+        self._static_background: Optional[Surface] = None
+        self._static_background_key: Optional[tuple] = None
+        self._refresh_static_background()
+        
+        # Grid do level up em 8 bits: a cor das linhas é a entrada 1 da paleta
+        # (criado no primeiro level up)
+        self._rainbow_grid: Optional[Surface] = None
+        self._rainbow_grid_key: Optional[tuple] = None
+        
+        # Sprites da cobra no formato do display recém-criado
+        get_snake_atlas()
         
         # Superfícies de trabalho
         self._shadow_layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
@@ -218,6 +255,11 @@ class Renderer:
         self._screen_flash_active = False
         self._flash_color = Colors.BRIGHT_YELLOW
         
+        # Gradientes do flash por cor (já multiplicados pelo próprio alpha) e
+        # a camada onde o fade é aplicado, reaproveitada entre frames
+        self._flash_gradients: Dict[tuple, Surface] = {}
+        self._flash_layer: Optional[Surface] = None
+        
         # Sistema de partículas ambientais
         self._ambient_particles: List[AmbientParticle] = []
         self._particle_spawn_timer = 0.0
@@ -227,40 +269,114 @@ class Renderer:
         self._animation_timer = 0.0
         self._background_shift = 0.0
         
-        print("🎨 Renderer v3.0 Gruvbox inicializado!")
-        print("✨ Gradientes, partículas e sombras ativados!")
+        _logger.info("🎨 Renderer v3.0 Gruvbox inicializado!")
+        _logger.info("✨ Gradientes, partículas e sombras ativados!")
     
-    def _create_dynamic_background(self) -> Surface:
-        """Cria fundo dinâmico com gradiente Gruvbox"""
+    def _create_dynamic_background(self, size: Tuple[int, int]) -> Surface:
+        """
+        Cria fundo dinâmico com gradiente Gruvbox
+        
+        Args:
+            size: Tamanho da janela
+        """
         return GradientHelper.create_radial_gradient_fast(
-            (WINDOW_WIDTH, WINDOW_HEIGHT),
+            size,
             Colors.BG_MEDIUM,    # Centro mais claro
             Colors.BG_DARK,      # Bordas mais escuras
             0.9
         )
     
-    def _create_grid_cache(self) -> Surface:
-        """Cria cache do grid para melhor performance"""
-        grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+    def _create_grid_cache(self, size: Tuple[int, int]) -> Surface:
+        """
+        Cria cache do grid para melhor performance
+        
+        Args:
+            size: Tamanho da janela
+        """
+        width, height = size
+        grid_surface = pygame.Surface(size, pygame.SRCALPHA)
         
         # Grid sutil com tema Gruvbox
         grid_color = (*Colors.GRID_COLOR, Effects.GRID_TRANSPARENCY)
         
         # Linhas verticais
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(grid_surface, grid_color, (x, 0), (x, WINDOW_HEIGHT), 1)
+        for x in range(0, width, GRID_SIZE):
+            pygame.draw.line(grid_surface, grid_color, (x, 0), (x, height), 1)
         
         # Linhas horizontais
-        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(grid_surface, grid_color, (0, y), (WINDOW_WIDTH, y), 1)
+        for y in range(0, height, GRID_SIZE):
+            pygame.draw.line(grid_surface, grid_color, (0, y), (width, y), 1)
+        
+        return grid_surface
+    
+    def _create_static_background(self, size: Tuple[int, int]) -> Surface:
+        """
+        Compõe gradiente, borda da área jogável e grid numa superfície opaca
+        
+        Convertida para o formato do display, é restaurada com um único
+        blit sem alpha: tela inteira em clear_screen() e só as áreas do
+        frame anterior no modo dirty rect.
+        
+        Args:
+            size: Tamanho da janela
+        """
+        background = pygame.Surface(size).convert()
+        background.fill(Colors.BG_DARK)
+        background.blit(self._create_dynamic_background(size), (0, 0))
+        
+        play_area_rect = pygame.Rect(0, 0, PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT)
+        pygame.draw.rect(background, Colors.UI_ACCENT, play_area_rect, width=4)
+        
+        background.blit(self._create_grid_cache(size), (0, 0))
+        return background
+    
+    def _refresh_static_background(self) -> None:
+        """Recompõe o fundo parado se a janela ou as cores/grid mudaram"""
+        size = self._screen.get_size()
+        key = (size, GRID_SIZE, Colors.BG_DARK, Colors.BG_MEDIUM, Colors.UI_ACCENT,
+               Colors.GRID_COLOR, Effects.GRID_TRANSPARENCY)
+        if key != self._static_background_key:
+            self._static_background = self._create_static_background(size)
+            self._static_background_key = key
+            self._previous_rects = None
+    
+    def _create_rainbow_grid(self, size: Tuple[int, int]) -> Surface:
+        """
+        Cria o grid do level up como superfície paletizada
+        
+        Índice 0 (fundo) é o colorkey e índice 1 são as linhas: trocar a
+        cor e a intensidade é só set_palette_at(), sem redesenhar nada.
+        
+        Args:
+            size: Tamanho da janela
+        """
+        width, height = size
+        grid_surface = pygame.Surface(size, 0, 8)
+        grid_surface.set_palette([Colors.BLACK] * 256)
+        grid_surface.fill(0)
+        
+        for x in range(0, width, GRID_SIZE):
+            pygame.draw.line(grid_surface, 1, (x, 0), (x, height), 2)
         
+        for y in range(0, height, GRID_SIZE):
+            pygame.draw.line(grid_surface, 1, (0, y), (width, y), 2)
+        
+        grid_surface.set_colorkey(0)
         return grid_surface
     
+    def _refresh_rainbow_grid(self) -> None:
+        """Recria o grid do level up se a janela ou o tamanho da célula mudaram"""
+        size = self._screen.get_size()
+        key = (size, GRID_SIZE)
+        if key != self._rainbow_grid_key:
+            self._rainbow_grid = self._create_rainbow_grid(size)
+            self._rainbow_grid_key = key
+    
     def _initialize_particles(self) -> None:
         """Inicializa sistema de partículas ambientais"""
         particle_count = Effects.AMBIENT_PARTICLE_COUNT
         for _ in range(particle_count):
-            self._ambient_particles.append(AmbientParticle())
+            self._ambient_particles.append(AmbientParticle(self._rng))
     
     @property
     def screen(self) -> Surface:
@@ -269,26 +385,20 @@ class Renderer:
     
     def clear_screen(self, animated: bool = True) -> None:
         """
-        Limpa a tela com fundo dinâmico Gruvbox
+        Limpa a tela com fundo dinâmico Gruvbox (gradiente, borda e grid)
         
         Args:
             animated: Se deve usar animação de fundo
         """
         if animated:
-            self._screen.fill(Colors.BG_DARK)
-
-            # retângulo da área jogável
-            play_area_rect = pygame.Rect(0, 0, PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT)
-
-            # preencher fundo do campo
-            pygame.draw.rect(self._screen, Colors.BG_DARK, play_area_rect)
-
-            # desenhar bordas
-            pygame.draw.rect(self._screen, Colors.UI_ACCENT, play_area_rect, width=4)
+            self._refresh_static_background()
+            self._screen.blit(self._static_background, (0, 0))
     
     def draw_grid(self, animated: bool = True) -> None:
         """
-        Desenha grid moderno com efeitos Gruvbox
+        Desenha o grid colorido do level up
+        
+        O grid normal já faz parte do fundo restaurado em clear_screen().
         
         Args:
             animated: Se deve aplicar efeitos de level up
@@ -298,28 +408,13 @@ class Renderer:
             color_index = int((self._level_up_timer * 6) % len(Colors.RAINBOW_COLORS))
             rainbow_color = Colors.RAINBOW_COLORS[color_index]
             
-            # Intensidade pulsante
+            # Intensidade pulsante, somada ao fundo escuro como no antigo
+            # blit aditivo, vira a cor das linhas na paleta
             intensity = 0.8 + 0.2 * abs(math.sin(self._level_up_timer * 8))
-            animated_color = tuple(int(c * intensity) for c in rainbow_color)
-            
-            # Cria grid temporário animado
-            temp_grid = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            
-            alpha = int(120 * intensity)
-            
-            # Linhas com efeito de brilho
-            for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-                pygame.draw.line(temp_grid, (*animated_color, alpha), 
-                               (x, 0), (x, WINDOW_HEIGHT), 2)
-            
-            for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-                pygame.draw.line(temp_grid, (*animated_color, alpha),
-                               (0, y), (WINDOW_WIDTH, y), 2)
-            
-            self._screen.blit(temp_grid, (0, 0), special_flags=pygame.BLEND_ADD)
-        else:
-            # Grid normal cached
-            self._screen.blit(self._grid_cache, (0, 0))
+            self._rainbow_grid.set_palette_at(1, tuple(
+                min(255, base + int(c * intensity)) for base, c in zip(Colors.BG_DARK, rainbow_color)
+            ))
+            self._screen.blit(self._rainbow_grid, (0, 0))
     
     def update_ambient_particles(self, delta_time: float) -> None:
         """Atualiza sistema de partículas ambientais"""
@@ -336,12 +431,15 @@ class Renderer:
         if self._particle_spawn_timer >= spawn_interval:
             self._particle_spawn_timer = 0.0
             if len(self._ambient_particles) < Effects.AMBIENT_PARTICLE_COUNT:
-                self._ambient_particles.append(AmbientParticle())
+                self._ambient_particles.append(AmbientParticle(self._rng))
     
     def draw_ambient_particles(self) -> None:
         """Desenha partículas ambientais otimizado"""
+        dirty_rects = self._dirty_rects
         for particle in self._ambient_particles:
-            particle.draw(self._screen)
+            rect = particle.draw(self._screen)
+            if rect is not None:
+                dirty_rects.append(rect)
     
     def draw_shadow(self, center: Tuple[int, int], radius: int, 
                    intensity: int = Effects.SHADOW_ALPHA) -> None:
@@ -426,7 +524,7 @@ class Renderer:
             if self._level_up_timer >= Effects.LEVEL_UP_FLASH_DURATION:
                 self._level_up_active = False
                 self._level_up_timer = 0.0
-                print("🌈 Efeito de level up finalizado")
+                _logger.debug("🌈 Efeito de level up finalizado")
         
         # Efeito espelho
         if self._mirror_effect_active:
@@ -434,7 +532,7 @@ class Renderer:
             if self._mirror_effect_timer >= Effects.MIRROR_EFFECT_DURATION:
                 self._mirror_effect_active = False
                 self._mirror_effect_timer = 0.0
-                print("🪞 Efeito de espelho finalizado")
+                _logger.debug("🪞 Efeito de espelho finalizado")
         
         # Flash da tela
         if self._screen_flash_active:
@@ -442,22 +540,23 @@ class Renderer:
             if self._screen_flash_timer >= Effects.SPECIAL_CONSUME_EFFECT_DURATION:
                 self._screen_flash_active = False
                 self._screen_flash_timer = 0.0
-                print("⚡ Flash da tela finalizado")
+                _logger.debug("⚡ Flash da tela finalizado")
         
         # Partículas ambientais
         self.update_ambient_particles(delta_time)
     
     def start_level_up_effect(self) -> None:
         """Inicia efeito visual de level up"""
+        self._refresh_rainbow_grid()
         self._level_up_active = True
         self._level_up_timer = 0.0
-        print("🌈 Efeito de level up Gruvbox ativado!")
+        _logger.debug("🌈 Efeito de level up Gruvbox ativado!")
     
     def start_mirror_effect(self) -> None:
         """Inicia efeito visual de espelho"""
         self._mirror_effect_active = True
         self._mirror_effect_timer = 0.0
-        print("🪞 Efeito de espelho Gruvbox ativado!")
+        _logger.debug("🪞 Efeito de espelho Gruvbox ativado!")
     
     def start_screen_flash(self, color: Color = Colors.BRIGHT_YELLOW) -> None:
         """
@@ -469,7 +568,43 @@ class Renderer:
         self._screen_flash_active = True
         self._screen_flash_timer = 0.0
         self._flash_color = color
-        print(f"⚡ Flash Gruvbox ativado: {color}!")
+        self._flash_gradient(color)
+        _logger.debug("⚡ Flash Gruvbox ativado: %s!", color)
+    
+    def _flash_gradient(self, color: Color) -> Surface:
+        """
+        Retorna o gradiente do flash na cor, criando-o no primeiro uso
+        
+        O gradiente radial (raio de 70% da meia-altura da janela) é composto
+        sobre preto numa superfície opaca do tamanho do círculo: cada pixel
+        já leva a cor multiplicada pelo alpha do gradiente, pronta para o
+        blit aditivo.
+        
+        Args:
+            color: Cor do centro do flash
+        
+        Returns:
+            Superfície quadrada centrada na janela
+        """
+        size = self._screen.get_size()
+        key = (tuple(color), size)
+        gradient = self._flash_gradients.get(key)
+        if gradient is None:
+            radius = int(min(size) // 2 * 0.7)
+            # Lado arredondado para múltiplo de 16 pixels: linhas alinhadas
+            # mantêm fill() e blits da camada nos caminhos vetorizados do SDL
+            side = (radius * 2 + 15) // 16 * 16
+            gradient = pygame.Surface((side, side)).convert()
+            gradient.fill((0, 0, 0))
+            # Borda preta: somada à tela, o círculo some sem contorno
+            gradient.blit(GradientHelper.create_radial_gradient_fast(
+                (radius * 2, radius * 2), color, (0, 0, 0)
+            ), (side // 2 - radius, side // 2 - radius))
+            self._flash_gradients[key] = gradient
+            
+            if self._flash_layer is None or self._flash_layer.get_size() != gradient.get_size():
+                self._flash_layer = pygame.Surface(gradient.get_size()).convert()
+        return gradient
     
     def apply_mirror_transform(self, surface: Surface) -> None:
         """
@@ -506,15 +641,56 @@ class Renderer:
         intensity = Effects.SCREEN_FLASH_INTENSITY * (1.0 - progress)
         
         if intensity > 5:
-            # Flash com gradiente radial
-            flash_surface = GradientHelper.create_radial_gradient_fast(
-                (WINDOW_WIDTH, WINDOW_HEIGHT),
-                self._flash_color,
-                Colors.BG_DARK,
-                0.7
-            )
-            flash_surface.set_alpha(int(intensity))
-            surface.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+            # Flash com gradiente radial em cache: a camada de trabalho,
+            # preenchida com a intensidade (alpha 0-255), é multiplicada
+            # pelo gradiente e o resultado é somado à tela
+            gradient = self._flash_gradient(self._flash_color)
+            layer = self._flash_layer
+            alpha = int(intensity)
+            layer.fill((alpha, alpha, alpha))
+            layer.blit(gradient, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+            surface.blit(layer, layer.get_rect(center=surface.get_rect().center),
+                         special_flags=pygame.BLEND_ADD)
+    
+    @property
+    def full_screen_effect_active(self) -> bool:
+        """Retorna se algum efeito cobre a tela inteira (flash, espelho, grid de level up)"""
+        return self._screen_flash_active or self._mirror_effect_active or self._level_up_active
+    
+    def begin_frame(self, full_redraw: bool = False) -> None:
+        """
+        Prepara a tela para um novo frame
+        
+        No modo dirty rect só as áreas desenhadas no frame anterior voltam
+        ao fundo parado; a tela inteira é limpa no primeiro frame, com o
+        modo desligado, durante efeitos de tela cheia ou quando o chamador
+        pede (overlays, câmera rolando) e no frame seguinte a esses.
+        
+        Args:
+            full_redraw: Se o frame muda a tela fora das áreas registradas
+                         com mark_dirty (overlays, câmera rolando)
+        """
+        self._refresh_static_background()
+        self._unreported_changes = full_redraw or self.full_screen_effect_active
+        self._full_redraw = (self._unreported_changes or not DIRTY_RECT_RENDERING or
+                             self._previous_rects is None)
+        self._dirty_rects = []
+        
+        if self._full_redraw:
+            self.clear_screen()
+            self.draw_grid()
+        else:
+            background = self._static_background
+            self._screen.blits([(background, rect, rect) for rect in self._previous_rects], False)
+    
+    def mark_dirty(self, rects: Iterable[pygame.Rect]) -> None:
+        """
+        Registra áreas da tela alteradas neste frame
+        
+        Args:
+            rects: Retângulos desenhados (entidades, HUD, overlays)
+        """
+        self._dirty_rects.extend(rects)
     
     def present(self) -> None:
         """Apresenta o frame final com todos os efeitos"""
@@ -528,14 +704,20 @@ class Renderer:
         if self._screen_flash_active:
             self.apply_screen_flash(self._screen)
         
-        # Atualiza display
-        pygame.display.flip()
+        # Atualiza display: tela inteira ou só as áreas do frame anterior e do atual
+        if self._full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._previous_rects + self._dirty_rects)
+        
+        # Mudanças fora das áreas registradas só somem com outra tela inteira
+        self._previous_rects = None if self._unreported_changes else self._dirty_rects
     
     def cleanup(self) -> None:
         """Limpa recursos do renderer"""
         self._ambient_particles.clear()
         pygame.display.quit()
-        print("🎨 Renderer v3.0 finalizado!")
+        _logger.info("🎨 Renderer v3.0 finalizado!")
     
     # Properties para compatibilidade com código existente
     def is_level_up_active(self) -> bool:
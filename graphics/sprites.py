@@ -0,0 +1,195 @@
+"""
+Atlas de sprites da cobra
+Pré-renderiza cabeça (uma por direção) e segmentos do corpo (um por tom
+do gradiente) com sombra e brilho já compostos, para que desenhar a
+cobra seja só um lote de blits
+"""
+
+import pygame
+from typing import Dict, List, Optional
+from utils.types import Surface
+from utils.enums import Direction
+from config.settings import GRID_SIZE, Colors
+
+# A sombra do corpo some no segmento 16 (alpha 80 - i * 5) e o tom para
+# de escurecer no 8: deste índice em diante todos os segmentos são iguais
+BODY_SPRITES: int = 16
+
+# Margem em volta da célula: brilho da cabeça (até o raio + 5) e sombras
+_PADDING: int = 6
+
+class SnakeSpriteAtlas:
+    """
+    Sprites prontos da cobra, no formato do display
+    
+    Cada sprite tem (GRID_SIZE + 2 * _PADDING) pixels de lado e é
+    desenhado com o centro da célula em `anchor`. Sombras e brilhos,
+    antes superfícies temporárias criadas a cada frame, são compostos
+    uma única vez no canal alpha do sprite.
+    """
+    
+    def __init__(self, grid_size: int = GRID_SIZE):
+        """
+        Renderiza todos os sprites
+        
+        Args:
+            grid_size: Tamanho da célula em pixels
+        """
+        self._grid_size = grid_size
+        self._size = grid_size + 2 * _PADDING
+        self._anchor = self._size // 2
+        
+        self._heads: Dict[Direction, Surface] = {
+            direction: self._finish(self._render_head(direction)) for direction in Direction
+        }
+        # Índice 0 sem uso (a cabeça); 1..BODY_SPRITES por distância da cabeça
+        self._bodies: List[Optional[Surface]] = [None] + [
+            self._finish(self._render_body(index)) for index in range(1, BODY_SPRITES + 1)
+        ]
+    
+    @property
+    def anchor(self) -> int:
+        """Retorna a coordenada do centro da célula dentro de cada sprite"""
+        return self._anchor
+    
+    def head(self, direction: Direction) -> Surface:
+        """
+        Retorna o sprite da cabeça virada para a direção
+        
+        Args:
+            direction: Direção de movimento
+        """
+        return self._heads[direction]
+    
+    def body(self, index: int) -> Surface:
+        """
+        Retorna o sprite do segmento pelo índice (1 = logo atrás da cabeça)
+        
+        Args:
+            index: Índice do segmento no corpo
+        """
+        return self._bodies[min(index, BODY_SPRITES)]
+    
+    def _new_sprite(self) -> Surface:
+        """Cria um sprite transparente"""
+        return pygame.Surface((self._size, self._size), pygame.SRCALPHA)
+    
+    def _finish(self, sprite: Surface) -> Surface:
+        """
+        Converte o sprite para o formato do display (blits mais rápidos)
+        
+        Args:
+            sprite: Sprite renderizado
+        """
+        if pygame.display.get_surface() is not None:
+            return sprite.convert_alpha()
+        return sprite
+    
+    def _blit_shadow(self, sprite: Surface, size: int, radius: int, alpha: int) -> None:
+        """
+        Compõe a sombra circular deslocada para baixo e para a direita
+        
+        Args:
+            sprite: Sprite de destino
+            size: Lado da superfície da sombra
+            radius: Raio da sombra
+            alpha: Opacidade da sombra
+        """
+        shadow = pygame.Surface((size, size))
+        shadow.set_alpha(alpha)
+        shadow.set_colorkey(Colors.BLACK)
+        pygame.draw.circle(shadow, Colors.SHADOW_COLOR, (size // 2, size // 2), radius)
+        corner = self._anchor - self._grid_size // 2
+        sprite.blit(shadow, (corner, corner))
+    
+    def _render_head(self, direction: Direction) -> Surface:
+        """
+        Renderiza a cabeça com sombra, brilho externo e olhos
+        
+        Args:
+            direction: Direção para onde os olhos olham
+        """
+        grid_size = self._grid_size
+        center = (self._anchor, self._anchor)
+        sprite = self._new_sprite()
+        
+        self._blit_shadow(sprite, grid_size + 4, grid_size // 2, 100)
+        
+        # Brilho externo
+        head_radius = grid_size // 2 - 1
+        for glow_radius in range(head_radius + 6, head_radius, -1):
+            glow_alpha = 30 - (glow_radius - head_radius) * 5
+            if glow_alpha > 0:
+                glow = pygame.Surface((glow_radius * 2, glow_radius * 2))
+                glow.set_alpha(glow_alpha)
+                glow.set_colorkey(Colors.BLACK)
+                pygame.draw.circle(glow, Colors.SNAKE_HEAD, (glow_radius, glow_radius), glow_radius)
+                sprite.blit(glow, (self._anchor - glow_radius, self._anchor - glow_radius))
+        
+        # Cabeça principal e círculo interno
+        pygame.draw.circle(sprite, Colors.SNAKE_HEAD, center, head_radius)
+        if head_radius > 2:
+            pygame.draw.circle(sprite, Colors.BRIGHT_GREEN, center, head_radius - 2)
+        
+        # Olhos à frente, um de cada lado do sentido do movimento
+        eye_size = max(2, grid_size // 8)
+        forward = grid_size // 6
+        side = grid_size // 4
+        dx, dy = direction.value
+        for sign in (-1, 1):
+            eye = (self._anchor + dx * forward - dy * side * sign,
+                   self._anchor + dy * forward + dx * side * sign)
+            pygame.draw.circle(sprite, Colors.FG_LIGHT, eye, eye_size)
+            pygame.draw.circle(sprite, Colors.BG_DARK, eye, eye_size - 1)
+        
+        # Borda da cabeça
+        pygame.draw.circle(sprite, Colors.BG_DARK, center, head_radius, 2)
+        return sprite
+    
+    def _render_body(self, index: int) -> Surface:
+        """
+        Renderiza um segmento do corpo no tom do seu índice
+        
+        Args:
+            index: Distância até a cabeça (sombra e cor esmaecem com ela)
+        """
+        grid_size = self._grid_size
+        center = (self._anchor, self._anchor)
+        sprite = self._new_sprite()
+        
+        # Sombra diminui com a distância
+        shadow_alpha = 80 - index * 5
+        if shadow_alpha > 0:
+            self._blit_shadow(sprite, grid_size + 2, grid_size // 2 - 1, shadow_alpha)
+        
+        # Cor do corpo com gradiente baseado na posição
+        segment_intensity = max(0.6, 1.0 - (index * 0.05))
+        body_color = tuple(int(c * segment_intensity) for c in Colors.SNAKE_BODY)
+        body_radius = grid_size // 2 - 2
+        pygame.draw.circle(sprite, body_color, center, body_radius)
+        
+        # Highlight interno
+        inner_color = tuple(min(255, int(c * 1.2)) for c in body_color)
+        if body_radius > 2:
+            pygame.draw.circle(sprite, inner_color, center, body_radius - 2)
+        
+        # Borda sutil
+        pygame.draw.circle(sprite, Colors.BG_DARK, center, body_radius, 1)
+        return sprite
+
+_atlas: Optional[SnakeSpriteAtlas] = None
+
+def get_snake_atlas() -> SnakeSpriteAtlas:
+    """
+    Retorna o atlas compartilhado, criando-o no primeiro uso
+    
+    O Renderer o cria logo depois de abrir a janela, então os sprites já
+    nascem no formato do display.
+    
+    Returns:
+        Atlas de sprites da cobra
+    """
+    global _atlas
+    if _atlas is None:
+        _atlas = SnakeSpriteAtlas()
+    return _atlas
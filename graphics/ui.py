@@ -7,11 +7,14 @@ import pygame
 import math
 from typing import Optional, Tuple, List
 from utils.types import Surface, Color, Font
+from utils.logger import get_logger
 from config.settings import (
     WINDOW_WIDTH, WINDOW_HEIGHT, HUD_HEIGHT, PLAY_AREA_HEIGHT, PLAY_AREA_WIDTH, Colors, 
-    FontSizes, Messages, Effects
+    FontSizes, Messages, Effects, Debug
 )
 
+_logger = get_logger('ui')
+
 class UIManager:
     """
     Gerenciador de interface moderna com tema Gruvbox
@@ -42,7 +45,11 @@ class UIManager:
         # Cache de superfícies renderizadas
         self._text_cache = {}
         
-        print("🎨 ModernUIManager inicializado com tema Gruvbox!")
+        # Último texto do overlay de latência (re-renderizado só ao mudar)
+        self._latency_text: Optional[str] = None
+        self._latency_surface: Optional[Surface] = None
+        
+        _logger.info("🎨 ModernUIManager inicializado com tema Gruvbox!")
     
     def update_animations(self, delta_time: float) -> None:
         """Atualiza animações da UI"""
@@ -181,7 +188,7 @@ class UIManager:
     
     def draw_animated_hud(self, surface: Surface, score: int, length: int, 
                          level: int = 1, speed_multiplier: float = 1.0, 
-                         food_stats: dict = None) -> None:
+                         food_stats: dict = None) -> List[pygame.Rect]:
         """
         Desenha HUD moderno e animado
         
@@ -192,6 +199,9 @@ class UIManager:
             level: Nível atual
             speed_multiplier: Multiplicador de velocidade
             food_stats: Estatísticas de comidas
+        
+        Returns:
+            Áreas da tela alteradas (faixa do HUD e painel de comidas)
         """
         # Painel principal do HUD (canto superior esquerdo)
         hud_width = 220
@@ -201,6 +211,7 @@ class UIManager:
                             HUD_HEIGHT - 2 * Effects.UI_PADDING)
         
         self.draw_panel(surface, hud_rect, Colors.UI_BACKGROUND, Colors.FG_DARK)
+        dirty_rects = [pygame.Rect(0, PLAY_AREA_HEIGHT, surface.get_width(), HUD_HEIGHT)]
         
         # Conteúdo do painel
         y_offset = hud_rect.y + Effects.UI_PADDING + 5
@@ -208,7 +219,7 @@ class UIManager:
         
         # Score com animação
         score_pulse = 1.0 + 0.1 * math.sin(self._animation_timer * 4)
-        score_color = tuple(int(c * score_pulse) for c in Colors.UI_ACCENT)
+        score_color = tuple(min(255, int(c * score_pulse)) for c in Colors.UI_ACCENT)
         self.draw_text_with_glow(
             surface, f"Score: {score:,}", 
             (hud_rect.x + hud_width // 2, y_offset), 
@@ -251,6 +262,8 @@ class UIManager:
                                    Effects.UI_PADDING, stats_width, stats_height)
             
             self.draw_panel(surface, stats_rect, Colors.UI_BACKGROUND, Colors.FG_DARK)
+            # Folga para a respiração e a sombra do painel
+            dirty_rects.append(stats_rect.inflate(16, 16))
             
             stats_y = stats_rect.y + Effects.UI_PADDING
             stats_line_height = 20
@@ -286,10 +299,12 @@ class UIManager:
                     (stats_rect.centerx, stats_y), 
                     'small', Colors.FOOD_MIRROR
                 )
-
+        
+        return dirty_rects
+    
     def draw_hud(self, surface: Surface, score: int, length: int,
                  level: int = 1, speed_multiplier: float = 1.0,
-                 food_stats: dict = None) -> None:
+                 food_stats: dict = None) -> List[pygame.Rect]:
         """
         Compatibilidade retroativa: wrapper para draw_animated_hud.
         GameEngine e outros módulos chamam draw_hud(...), então
@@ -305,7 +320,7 @@ class UIManager:
             speed_multiplier=speed_multiplier,
             food_stats=food_stats
         )
-
+    
     def draw_level_up_notification(self, surface: Surface, level: int) -> None:
         """Desenha notificação animada de level up"""
         center_x = WINDOW_WIDTH // 2
@@ -436,7 +451,7 @@ class UIManager:
         
         # Texto de pausa com animação
         pause_pulse = 1.0 + 0.2 * math.sin(self._animation_timer * 3)
-        pause_color = tuple(int(c * pause_pulse) for c in Colors.UI_ACCENT)
+        pause_color = tuple(min(255, int(c * pause_pulse)) for c in Colors.UI_ACCENT)
         
         self.draw_text_with_glow(
             surface, Messages.PAUSED,
@@ -445,8 +460,32 @@ class UIManager:
             glow_intensity=0.6
         )
     
+    def draw_latency_overlay(self, surface: Surface, summary: dict) -> pygame.Rect:
+        """
+        Desenha os percentis de latência tecla → tela (debug)
+        
+        Args:
+            surface: Superfície onde desenhar
+            summary: Resumo de LatencyTracker.summary()
+        
+        Returns:
+            Área da tela alterada
+        """
+        if 'p50' in summary:
+            text = (f"Latência p50 {summary['p50']:.1f} ms  p95 {summary['p95']:.1f}  "
+                    f"p99 {summary['p99']:.1f}  (n={summary['samples']})")
+        else:
+            text = "Latência: sem amostras"
+        
+        if text != self._latency_text:
+            self._latency_text = text
+            self._latency_surface = self.get_font('small').render(text, True, Debug.DEBUG_TEXT_COLOR)
+        
+        rect = self._latency_surface.get_rect(bottomleft=(8, WINDOW_HEIGHT - 8))
+        return surface.blit(self._latency_surface, rect)
+    
     def cleanup(self) -> None:
         """Limpa recursos da UI"""
         self._text_cache.clear()
         pygame.font.quit()
-        print("🎨 ModernUIManager finalizado!")
+        _logger.info("🎨 ModernUIManager finalizado!")
@@ -18,7 +18,7 @@ Python: 3.13+
 import sys
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 # Adiciona o diretório raiz ao path para imports
 project_root = Path(__file__).parent
@@ -194,6 +194,66 @@ def print_game_controls() -> None:
     print("│ ❌ Sair:     Q ou fechar janela     │")
     print("└─────────────────────────────────────┘")
 
+def parse_arena() -> Optional[Tuple[int, int]]:
+    """
+    Lê o tamanho da arena da opção --arena LARGURAxALTURA
+    
+    Returns:
+        Tupla (largura, altura) ou None para a arena padrão
+    
+    Raises:
+        ValueError: Se o tamanho é inválido
+    """
+    if '--arena' not in sys.argv:
+        return None
+    
+    index = sys.argv.index('--arena') + 1
+    if index >= len(sys.argv):
+        raise ValueError("--arena requer um tamanho LARGURAxALTURA (ex: 1000x1000)")
+    
+    width, _, height = sys.argv[index].lower().partition('x')
+    if not (width.isdigit() and height.isdigit()) or int(width) < 5 or int(height) < 5:
+        raise ValueError(f"Tamanho de arena inválido '{sys.argv[index]}' (mínimo 5x5)")
+    return int(width), int(height)
+
+def parse_food_count() -> int:
+    """
+    Lê o número de comidas simultâneas da opção --foods N
+    
+    Returns:
+        Número de comidas (FOOD_COUNT sem a opção)
+    
+    Raises:
+        ValueError: Se o número é inválido
+    """
+    from config.settings import FOOD_COUNT
+    
+    if '--foods' not in sys.argv:
+        return FOOD_COUNT
+    
+    index = sys.argv.index('--foods') + 1
+    if index >= len(sys.argv) or not sys.argv[index].isdigit() or int(sys.argv[index]) < 1:
+        raise ValueError("--foods requer um número de comidas maior que zero")
+    return int(sys.argv[index])
+
+def parse_latency_dump() -> Optional[str]:
+    """
+    Lê o arquivo de saída da opção --latency ARQUIVO
+    
+    Returns:
+        Caminho do JSON de latências ou None sem a opção
+    
+    Raises:
+        ValueError: Se o caminho está faltando
+    """
+    if '--latency' not in sys.argv:
+        return None
+    
+    index = sys.argv.index('--latency') + 1
+    if index >= len(sys.argv) or sys.argv[index].startswith('-'):
+        raise ValueError("--latency requer um arquivo de saída (ex: latency.json)")
+    return sys.argv[index]
+
 def main() -> int:
     """
     Função principal do jogo
@@ -223,6 +283,15 @@ def main() -> int:
     if GameEngine is None:
         return 1
     
+    # 5. Tamanho da arena, número de comidas e saída de latência
+    try:
+        arena = parse_arena()
+        food_count = parse_food_count()
+        latency_dump = parse_latency_dump()
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    
     # Informações do projeto
     print_project_info()
     print_game_controls()
@@ -233,9 +302,14 @@ def main() -> int:
     
     try:
         # Inicializa e executa o jogo
-        engine = GameEngine()
+        engine = GameEngine(arena=arena, food_count=food_count)
         engine.run()
         
+        if latency_dump is not None:
+            engine.latency.dump(latency_dump)
+            summary = engine.latency.summary()
+            print(f"⏱️  Latência tecla → tela: {summary['samples']} amostras em {latency_dump}")
+        
         print("\n✅ Jogo finalizado com sucesso!")
         return 0
         
@@ -273,11 +347,17 @@ OPÇÕES:
     -d, --debug    Ativa modo debug (mostra traceback completo)
     -v, --version  Mostra versão do jogo
     --check        Apenas verifica dependências (não executa)
+    --arena LxA    Arena de L x A células (maior que a tela: câmera segue a cobra)
+    --foods N      N comidas simultâneas na arena
+    --latency ARQ  Grava percentis da latência tecla → tela em JSON ao sair
 
 EXEMPLOS:
     python main.py              # Executa o jogo normalmente
     python main.py --debug      # Executa com debug ativado
     python main.py --check      # Verifica se tudo está ok
+    python main.py --arena 1000x1000  # Arena gigante com câmera
+    python main.py --arena 300x300 --foods 2000  # Arena cheia de comidas
+    python main.py --latency latency.json  # Mede a latência de entrada
 
 REQUISITOS:
     • Python 3.9+
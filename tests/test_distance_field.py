@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Testes do campo de distâncias da comida fugitiva
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.distance_field import DistanceField
+from utils.occupancy_grid import OccupancyGrid, CELL_SNAKE, CELL_FOOD
+
+class DistanceFieldTest(unittest.TestCase):
+    """Escolha do destino de fuga sobre a grade"""
+    
+    def corridor(self, snake: list, foods: list) -> DistanceField:
+        """Corredor 5x1 com a cobra e as comidas dadas, já calculado"""
+        grid = OccupancyGrid(5, 1)
+        for position in snake:
+            grid.set_flag(position, CELL_SNAKE)
+        for position in foods:
+            grid.set_flag(position, CELL_FOOD)
+        field = DistanceField(grid)
+        field.refresh(snake)
+        return field
+    
+    def test_farthest_layer_free(self):
+        field = self.corridor([(0, 0)], [])
+        self.assertEqual(field.max_distance, 4)
+        self.assertEqual(field.farthest_free_cell(random.Random(0)), ((4, 0), 4))
+    
+    def test_falls_back_when_farthest_layer_is_food(self):
+        field = self.corridor([(0, 0)], [(4, 0), (3, 0)])
+        self.assertEqual(field.farthest_free_cell(random.Random(0)), ((2, 0), 2))
+    
+    def test_none_when_only_food_is_reachable(self):
+        field = self.corridor([(0, 0), (1, 0)], [(2, 0), (3, 0), (4, 0)])
+        self.assertIsNone(field.farthest_free_cell(random.Random(0)))
+
+if __name__ == '__main__':
+    unittest.main()
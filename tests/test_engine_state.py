@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Testes do estado de jogo headless
+Reset com semente, snapshot/restore/fork e índice de livres da grade
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.game_engine import GameEngine
+from core.policies import greedy
+from core.snapshot import GameSnapshot
+
+def play(engine: GameEngine, seed: int, ticks: int) -> list:
+    """
+    Joga com a política gulosa e registra cada tick
+    
+    Args:
+        engine: Engine da partida
+        seed: Semente da política
+        ticks: Máximo de ticks
+    
+    Returns:
+        Lista de (pontos, fim, cabeça, células de comida) por tick
+    """
+    rng = random.Random(seed)
+    trace = []
+    for _ in range(ticks):
+        reward, done = engine.step(greedy(engine, rng))
+        trace.append((reward, done, engine.snake.head_position,
+                      sorted(engine.food_manager.foods)))
+        if done:
+            break
+    return trace
+
+class EngineStateTest(unittest.TestCase):
+    """Reprodutibilidade e consistência do estado do engine"""
+    
+    def assertFreeIndexConsistent(self, engine: GameEngine) -> None:
+        """Uma célula é livre (iteração e contagem) sse suas flags são 0"""
+        grid = engine.grid
+        empty = [grid.position_of(index) for index, flags in enumerate(grid.cells) if not flags]
+        self.assertEqual(list(grid.free_positions()), empty)
+        self.assertEqual(grid.free_count, len(empty))
+    
+    def test_snapshot_restore_replays_same_game(self):
+        for seed in range(4):
+            engine = GameEngine(headless=True, seed=seed, food_count=1 + seed)
+            play(engine, seed, 200)
+            snapshot = engine.snapshot()
+            cells = bytes(engine.grid.cells)
+            
+            expected = play(engine, 99, 300)
+            
+            engine.restore(snapshot)
+            self.assertEqual(bytes(engine.grid.cells), cells)
+            self.assertEqual(play(engine, 99, 300), expected)
+            
+            other = GameEngine(headless=True, food_count=1 + seed)
+            other.restore(GameSnapshot.from_bytes(snapshot.to_bytes()))
+            self.assertEqual(play(other, 99, 300), expected)
+    
+    def test_snapshot_keeps_death_cause(self):
+        engine = GameEngine(headless=True, seed=0)
+        alive = engine.snapshot()
+        while not engine.step()[1]:
+            pass
+        self.assertEqual(engine.death_cause, 'wall')
+        
+        dead = GameSnapshot.from_bytes(engine.snapshot().to_bytes())
+        engine.restore(alive)
+        self.assertIsNone(engine.death_cause)
+        engine.restore(dead)
+        self.assertEqual(engine.death_cause, 'wall')
+        self.assertEqual(engine.fork().death_cause, 'wall')
+    
+    def test_fork_replays_same_game_independently(self):
+        engine = GameEngine(headless=True, seed=5, food_count=3)
+        play(engine, 5, 150)
+        clone = engine.fork()
+        cells = bytes(engine.grid.cells)
+        
+        expected = play(clone, 7, 300)
+        self.assertEqual(bytes(engine.grid.cells), cells)
+        self.assertEqual(play(engine, 7, 300), expected)
+    
+    def test_reset_seed_matches_fresh_engine(self):
+        reused = GameEngine(headless=True, seed=1)
+        play(reused, 1, 300)
+        for seed in range(3):
+            reused.reset(seed)
+            fresh = GameEngine(headless=True, seed=seed)
+            self.assertEqual(play(reused, seed, 500), play(fresh, seed, 500))
+    
+    def test_engines_do_not_share_rngs(self):
+        alone = play(GameEngine(headless=True, seed=4), 4, 300)
+        
+        first = GameEngine(headless=True, seed=4)
+        second = GameEngine(headless=True, seed=8)
+        rng, other_rng = random.Random(4), random.Random(8)
+        trace = []
+        for _ in range(len(alone)):
+            second.step(greedy(second, other_rng))
+            reward, done = first.step(greedy(first, rng))
+            trace.append((reward, done, first.snake.head_position,
+                          sorted(first.food_manager.foods)))
+        self.assertEqual(trace, alone)
+    
+    def test_free_index_matches_cells(self):
+        engine = GameEngine(headless=True, seed=3, food_count=4)
+        rng = random.Random(3)
+        for _ in range(400):
+            _, done = engine.step(greedy(engine, rng))
+            self.assertFreeIndexConsistent(engine)
+            if done:
+                break
+        
+        snapshot = engine.snapshot()
+        engine.reset(11)
+        self.assertFreeIndexConsistent(engine)
+        engine.restore(snapshot)
+        self.assertFreeIndexConsistent(engine)
+        self.assertFreeIndexConsistent(engine.fork())
+        
+        grid = engine.grid
+        for _ in range(200):
+            self.assertTrue(grid.is_free(grid.sample_free(rng)))
+
+if __name__ == '__main__':
+    unittest.main()
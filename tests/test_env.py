@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Testes do ambiente estilo Gym
+Observação incremental, canal de comidas e decodificação de ações do SnakeEnv
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.env import SnakeEnv, ACTION_NONE, ACTION_DIRECTIONS, CHANNEL_FOOD, FOOD_CODES, np
+from core.policies import greedy
+
+class SnakeEnvTest(unittest.TestCase):
+    """Observação e ações do SnakeEnv"""
+    
+    def test_incremental_observation_matches_rasterize(self):
+        env = SnakeEnv(seed=2)
+        rng = random.Random(2)
+        for _ in range(600):
+            _, _, done, _ = env.step(greedy(env.engine, rng))
+            incremental = bytes(env._buffer)
+            env._rasterize()
+            self.assertEqual(bytes(env._buffer), incremental)
+            if done:
+                env.reset()
+    
+    def test_food_channel_shows_every_food(self):
+        env = SnakeEnv(seed=6, food_count=5)
+        rng = random.Random(6)
+        width, height = env.engine.arena_size
+        for _ in range(300):
+            _, _, done, _ = env.step(greedy(env.engine, rng))
+            plane = env._buffer[CHANNEL_FOOD * width * height:(CHANNEL_FOOD + 1) * width * height]
+            drawn = {(index % width, index // width): code
+                     for index, code in enumerate(plane) if code}
+            expected = {position: FOOD_CODES[food.entity_type] + 1
+                        for position, food in env.engine.food_manager.foods.items()}
+            self.assertEqual(len(expected), 5)
+            self.assertEqual(drawn, expected)
+            if done:
+                env.reset()
+    
+    def test_integer_actions(self):
+        env = SnakeEnv(seed=0)
+        env.step(ACTION_DIRECTIONS.index(env.engine.snake.direction))
+        env.step(ACTION_NONE)
+        for code in (-2, len(ACTION_DIRECTIONS)):
+            with self.assertRaises(ValueError):
+                env.step(code)
+        with self.assertRaises(TypeError):
+            env.step(1.0)
+    
+    @unittest.skipIf(np is None, "requer numpy")
+    def test_numpy_integer_actions(self):
+        env = SnakeEnv(seed=0)
+        code = ACTION_DIRECTIONS.index(env.engine.snake.direction)
+        for dtype in (np.int8, np.int32, np.int64, np.uint8):
+            env.step(dtype(code))
+        env.step(np.int64(ACTION_NONE))
+
+if __name__ == '__main__':
+    unittest.main()
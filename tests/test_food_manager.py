@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Testes das comidas sobre a grade de ocupação
+Posicionamento, arena cheia e alvo das políticas com várias comidas
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.game_engine import GameEngine
+from core.policies import greedy
+from entities.food import Food
+from entities.food_manager import FoodManager
+from utils.enums import Direction, EntityType
+from utils.occupancy_grid import OccupancyGrid, CELL_SNAKE, CELL_FOOD
+
+class FoodManagerTest(unittest.TestCase):
+    """Comidas na grade e escolha da comida alvo"""
+    
+    def test_food_is_not_marked_before_placement(self):
+        grid = OccupancyGrid(6, 4)
+        food = Food(EntityType.FOOD_NORMAL, grid, random.Random(0))
+        self.assertFalse(food.active)
+        self.assertEqual(grid.free_count, 24)
+        
+        self.assertTrue(food.respawn(()))
+        food.activate()
+        self.assertTrue(grid.is_food(food.position))
+        self.assertEqual(grid.free_count, 23)
+    
+    def test_full_arena_spawns_nothing(self):
+        grid = OccupancyGrid(3, 1)
+        for x in range(3):
+            grid.set_flag((x, 0), CELL_SNAKE)
+        manager = FoodManager(verbose=False, grid=grid, rng=random.Random(0), food_count=2)
+        self.assertEqual(manager.foods, {})
+        self.assertFalse(any(flags & CELL_FOOD for flags in grid.cells))
+    
+    def test_policies_target_nearest_food(self):
+        engine = GameEngine(headless=True, seed=0, food_count=6)
+        head_x, head_y = engine.snake.head_position
+        manager = engine.food_manager
+        self.assertTrue(manager.place_food(EntityType.FOOD_NORMAL, (head_x, head_y - 1)))
+        
+        nearest = manager.nearest_food((head_x, head_y))
+        self.assertEqual(nearest.position, (head_x, head_y - 1))
+        self.assertEqual(greedy(engine, random.Random(0)), Direction.UP)
+
+if __name__ == '__main__':
+    unittest.main()
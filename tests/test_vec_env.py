@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Testes do ambiente vetorizado
+
+Uso:
+    python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.vec_env import SnakeVecEnv, ACTION_NONE, ACTION_DIRECTIONS, np
+
+@unittest.skipIf(np is None, "requer numpy")
+class SnakeVecEnvTest(unittest.TestCase):
+    """Validação das ações do SnakeVecEnv"""
+    
+    def test_valid_actions(self):
+        env = SnakeVecEnv(5, seed=0)
+        rewards, dones = env.step(np.array([ACTION_NONE, 0, 1, 2, 3]))
+        self.assertEqual(rewards.shape, (5,))
+        self.assertEqual(dones.shape, (5,))
+    
+    def test_out_of_range_actions(self):
+        env = SnakeVecEnv(3, seed=0)
+        for code in (ACTION_NONE - 1, len(ACTION_DIRECTIONS)):
+            heads = env.heads
+            with self.assertRaises(ValueError):
+                env.step(np.array([ACTION_NONE, code, ACTION_NONE]))
+            for before, after in zip(heads, env.heads):
+                self.assertTrue(np.array_equal(before, after))
+
+if __name__ == '__main__':
+    unittest.main()
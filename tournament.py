@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Torneio de partidas headless em vários processos
+Roda M partidas por política em um ProcessPoolExecutor, grava um
+registro JSON por partida (permitindo retomar execuções interrompidas)
+e imprime tabelas-resumo por política
+
+Uso:
+    python tournament.py --policy greedy --policy random --games 1000
+    python tournament.py --policy meu_pacote.bots:minha_politica --output runs.jsonl
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+# Adiciona o diretório raiz ao path para imports
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+STATS_COLUMNS = (
+    'normal_consumed', 'special_consumed', 'fugitive_consumed',
+    'mirror_consumed', 'fugitive_escapes', 'fugitive_transformations'
+)
+
+def _silence_worker() -> None:
+    """Descarta a saída dos workers (os resultados voltam como registros)"""
+    sys.stdout = open(os.devnull, 'w')
+
+def play_games(policy_spec: str, seeds: List[int], max_ticks: int) -> List[dict]:
+    """
+    Joga uma leva de partidas headless com a mesma política (roda no worker)
+    
+    Args:
+        policy_spec: Política embutida ou 'modulo:funcao'
+        seeds: Sementes das partidas (engine e política)
+        max_ticks: Limite de ticks por partida ('timeout' ao estourar)
+    
+    Returns:
+        Lista de registros compactos, um por partida
+    """
+    from core.game_engine import GameEngine
+    from core.policies import load_policy
+    
+    policy = load_policy(policy_spec)
+    engine = GameEngine(headless=True)
+    records = []
+    
+    for seed in seeds:
+        engine.reset(seed)
+        policy_rng = random.Random(seed)
+        ticks = 0
+        done = False
+        
+        while not done and ticks < max_ticks:
+            _, done = engine.step(policy(engine, policy_rng))
+            ticks += 1
+        
+        stats = engine.food_manager.get_detailed_stats()
+        records.append({
+            'policy': policy_spec,
+            'seed': seed,
+            'score': engine.score,
+            'level': engine.level,
+            'length': engine.snake_length,
+            'ticks': ticks,
+            'death': engine.death_cause if done else 'timeout',
+            **{column: stats[column] for column in STATS_COLUMNS}
+        })
+    
+    return records
+
+def load_finished(output: Path) -> Dict[Tuple[str, int], dict]:
+    """
+    Lê os registros já gravados para retomar uma execução
+    
+    Uma última linha sem '\\n' (execução interrompida no meio da escrita)
+    é cortada do arquivo, para que os próximos registros comecem numa
+    linha nova; outras linhas inválidas são ignoradas e registros
+    repetidos da mesma partida contam uma vez só.
+    
+    Args:
+        output: Arquivo JSONL de resultados
+    
+    Returns:
+        Registros por chave (política, semente)
+    """
+    records: Dict[Tuple[str, int], dict] = {}
+    if not output.exists():
+        return records
+    
+    data = output.read_bytes()
+    end = data.rfind(b'\n') + 1
+    if end < len(data):
+        with output.open('r+b') as file:
+            file.truncate(end)
+    
+    for line in data[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        records.setdefault((record['policy'], record['seed']), record)
+    return records
+
+def chunked(seeds: List[int], size: int) -> Iterable[List[int]]:
+    """
+    Divide as sementes em levas de tamanho fixo
+    
+    Args:
+        seeds: Sementes pendentes
+        size: Tamanho da leva
+    """
+    for start in range(0, len(seeds), size):
+        yield seeds[start:start + size]
+
+def run_tournament(policies: List[str], games: int, base_seed: int, workers: int,
+                   chunk_size: int, max_ticks: int, output: Path) -> List[dict]:
+    """
+    Distribui as partidas pendentes entre os workers e grava os resultados
+    
+    Args:
+        policies: Políticas participantes
+        games: Partidas por política (mesmas sementes para todas)
+        base_seed: Semente da primeira partida
+        workers: Número de processos
+        chunk_size: Partidas por tarefa enviada a um worker
+        max_ticks: Limite de ticks por partida
+        output: Arquivo JSONL de resultados (anexado)
+    
+    Returns:
+        Todos os registros (anteriores e novos)
+    """
+    finished = load_finished(output)
+    seeds = range(base_seed, base_seed + games)
+    
+    tasks = []
+    for policy in policies:
+        pending = [seed for seed in seeds if (policy, seed) not in finished]
+        tasks.extend((policy, chunk) for chunk in chunked(pending, chunk_size))
+    
+    total = sum(len(chunk) for _, chunk in tasks)
+    if finished:
+        print(f"♻️  Retomando: {len(finished)} partidas já concluídas em {output}")
+    print(f"🎮 {total} partidas pendentes em {len(tasks)} tarefas, {workers} workers")
+    
+    done_games = 0
+    with output.open('a') as file, \
+         ProcessPoolExecutor(max_workers=workers, initializer=_silence_worker) as executor:
+        futures = [executor.submit(play_games, policy, chunk, max_ticks) for policy, chunk in tasks]
+        
+        for future in as_completed(futures):
+            chunk_records = future.result()
+            for record in chunk_records:
+                file.write(json.dumps(record, separators=(',', ':')) + '\n')
+                finished[(record['policy'], record['seed'])] = record
+            file.flush()
+            
+            done_games += len(chunk_records)
+            print(f"\r⏳ {done_games}/{total} partidas", end='', flush=True)
+    
+    if total:
+        print()
+    return list(finished.values())
+
+def print_summary(records: List[dict], policies: List[str]) -> None:
+    """
+    Imprime tabelas-resumo por política
+    
+    Args:
+        records: Registros das partidas
+        policies: Políticas a resumir (na ordem dada)
+    """
+    by_policy: Dict[str, List[dict]] = {policy: [] for policy in policies}
+    for record in records:
+        if record['policy'] in by_policy:
+            by_policy[record['policy']].append(record)
+    
+    print("\n📊 === RESULTADOS ===")
+    print(f"{'política':<24} {'jogos':>6} {'score':>8} {'mediana':>8} {'máx':>6} "
+          f"{'nível':>6} {'tamanho':>8} {'ticks':>8}")
+    for policy, games in by_policy.items():
+        if not games:
+            continue
+        scores = [game['score'] for game in games]
+        print(f"{policy:<24} {len(games):>6} {statistics.mean(scores):>8.2f} "
+              f"{statistics.median(scores):>8.1f} {max(scores):>6} "
+              f"{statistics.mean(game['level'] for game in games):>6.2f} "
+              f"{statistics.mean(game['length'] for game in games):>8.2f} "
+              f"{statistics.mean(game['ticks'] for game in games):>8.0f}")
+    
+    print("\n💀 === CAUSAS DE MORTE ===")
+    print(f"{'política':<24} {'parede':>8} {'corpo':>8} {'tempo':>8}")
+    for policy, games in by_policy.items():
+        if not games:
+            continue
+        deaths = [game['death'] for game in games]
+        print(f"{policy:<24} {deaths.count('wall'):>8} {deaths.count('self'):>8} "
+              f"{deaths.count('timeout'):>8}")
+    
+    print("\n🍎 === COMIDAS POR PARTIDA (MÉDIA) ===")
+    print(f"{'política':<24} {'normal':>8} {'especial':>9} {'fugitiva':>9} "
+          f"{'espelho':>8} {'fugas':>7} {'viradas':>8}")
+    for policy, games in by_policy.items():
+        if not games:
+            continue
+        means = [statistics.mean(game[column] for game in games) for column in STATS_COLUMNS]
+        print(f"{policy:<24} {means[0]:>8.2f} {means[1]:>9.2f} {means[2]:>9.2f} "
+              f"{means[3]:>8.2f} {means[4]:>7.2f} {means[5]:>8.2f}")
+
+def main() -> int:
+    """
+    Ponto de entrada do torneio
+    
+    Returns:
+        Código de saída (0 = sucesso, 1 = erro)
+    """
+    parser = argparse.ArgumentParser(description="Torneio de partidas headless do Snake Game")
+    parser.add_argument('--policy', action='append', dest='policies',
+                        help="política embutida (random, greedy, autopilot) ou 'modulo:funcao'; repetível")
+    parser.add_argument('--games', type=int, default=100, help="partidas por política")
+    parser.add_argument('--seed', type=int, default=0, help="semente da primeira partida")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="processos")
+    parser.add_argument('--chunk-size', type=int, default=25, help="partidas por tarefa")
+    parser.add_argument('--max-ticks', type=int, default=20_000, help="limite de ticks por partida")
+    parser.add_argument('--output', type=Path, default=Path('tournament_results.jsonl'),
+                        help="arquivo JSONL de resultados (retomado se existir)")
+    args = parser.parse_args()
+    
+    policies = args.policies or ['greedy', 'random']
+    
+    from core.policies import load_policy
+    try:
+        for policy in policies:
+            load_policy(policy)
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    
+    try:
+        records = run_tournament(policies, args.games, args.seed, args.workers,
+                                 args.chunk_size, args.max_ticks, args.output)
+    except KeyboardInterrupt:
+        print(f"\n⏹️ Interrompido: rode de novo com --output {args.output} para retomar")
+        return 1
+    
+    print_summary(records, policies)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
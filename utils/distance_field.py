@@ -0,0 +1,162 @@
+"""
+Campo de distâncias até a cobra sobre a grade de ocupação
+BFS multi-fonte a partir de todos os segmentos da cobra
+Usado pela comida fugitiva para escolher o destino de fuga exato
+"""
+
+import random
+from array import array
+from typing import List, Optional, Tuple
+from utils.types import Position, BodyView
+from utils.occupancy_grid import OccupancyGrid, CELL_SNAKE, CELL_WALL
+from config.settings import EXACT_ESCAPE_MAX_CELLS
+
+UNREACHABLE: int = -1
+
+class DistanceField:
+    """
+    Distância (em passos pelo grid) de cada célula ao segmento mais próximo
+    
+    As fontes são os segmentos da cobra e a expansão só atravessa células
+    sem cobra e sem parede, então células isoladas pelo corpo ficam
+    UNREACHABLE. A BFS visita as células em ordem crescente de distância,
+    e cada camada é guardada para que a consulta comece pelas células mais
+    distantes e recue às camadas seguintes quando só houver comida nelas.
+    
+    O campo é recalculado sob demanda e reaproveitado enquanto a geração
+    do corpo não mudar. A remoção da cauda aumenta distâncias (o que
+    exigiria uma BFS dinâmica completa), e a consulta é rara (uma por
+    tentativa de fuga), então o recálculo preguiçoso é O(células) apenas
+    quando necessário.
+    """
+    
+    def __init__(self, grid: OccupancyGrid):
+        """
+        Inicializa o campo
+        
+        Args:
+            grid: Grade de ocupação da arena
+        """
+        self._grid = grid
+        self._blank = array('i', [UNREACHABLE]) * len(grid.cells)
+        self._distance = array('i', self._blank)
+        self._layers: List[List[int]] = []  # Camada d-1 = células a d passos
+        self._max_distance = UNREACHABLE
+        self._generation: Optional[int] = None
+    
+    @property
+    def max_distance(self) -> int:
+        """Retorna a maior distância alcançável no último cálculo"""
+        return self._max_distance
+    
+    def refresh(self, snake_body: BodyView) -> None:
+        """
+        Atualiza o campo se o corpo mudou desde o último cálculo
+        
+        Args:
+            snake_body: Visão do corpo da cobra (usa `generation` se houver)
+        """
+        generation = getattr(snake_body, 'generation', None)
+        if generation is not None and generation == self._generation:
+            return
+        
+        self._compute(snake_body)
+        self._generation = generation
+    
+    def invalidate(self) -> None:
+        """Força o recálculo na próxima consulta"""
+        self._generation = None
+    
+    def _compute(self, snake_body: BodyView) -> None:
+        """
+        Executa a BFS multi-fonte a partir dos segmentos da cobra
+        
+        Args:
+            snake_body: Segmentos usados como fontes
+        """
+        cells = self._grid.cells
+        stride = self._grid.stride
+        distance = self._distance
+        distance[:] = self._blank
+        
+        frontier = []
+        for x, y in snake_body:
+            index = (y + 1) * stride + x + 1
+            if distance[index] == UNREACHABLE and not cells[index] & CELL_WALL:
+                distance[index] = 0
+                frontier.append(index)
+        
+        blocked = CELL_SNAKE | CELL_WALL
+        offsets = (1, -1, stride, -stride)
+        layers = []
+        current = 0
+        
+        while frontier:
+            next_frontier = []
+            step = current + 1
+            for index in frontier:
+                for offset in offsets:
+                    neighbor = index + offset
+                    if distance[neighbor] == UNREACHABLE and not cells[neighbor] & blocked:
+                        distance[neighbor] = step
+                        next_frontier.append(neighbor)
+            
+            if not next_frontier:
+                break
+            
+            layers.append(next_frontier)
+            current = step
+            frontier = next_frontier
+        
+        self._layers = layers
+        self._max_distance = current if frontier else UNREACHABLE
+    
+    def distance_at(self, position: Position) -> int:
+        """
+        Retorna a distância da célula até a cobra
+        
+        Args:
+            position: Posição (x, y) dentro da área jogável
+        
+        Returns:
+            Distância em passos ou UNREACHABLE
+        """
+        x, y = position
+        return self._distance[(y + 1) * self._grid.stride + x + 1]
+    
+    def farthest_free_cell(self, rng=random) -> Optional[Tuple[Position, int]]:
+        """
+        Retorna uma célula livre entre as mais distantes da cobra
+        
+        Percorre as camadas da mais distante para a mais próxima e sorteia
+        na primeira que tiver alguma célula livre (as comidas ocupam células
+        alcançáveis, mas não servem de destino).
+        
+        Args:
+            rng: Gerador para desempatar (módulo random por padrão)
+        
+        Returns:
+            Tupla (posição, distância) ou None se não há célula livre alcançável
+        """
+        cells = self._grid.cells
+        for distance in range(len(self._layers), 0, -1):
+            candidates = [index for index in self._layers[distance - 1] if not cells[index]]
+            if candidates:
+                return self._grid.position_of(rng.choice(candidates)), distance
+        
+        return None
+
+def exact_distance_field(grid: Optional[OccupancyGrid]) -> Optional[DistanceField]:
+    """
+    Cria o campo de distâncias se a arena é pequena o bastante para a BFS
+    
+    Args:
+        grid: Grade de ocupação da arena (ou None)
+    
+    Returns:
+        Campo novo, ou None sem grade ou com arena acima de
+        EXACT_ESCAPE_MAX_CELLS (a fuga passa a usar amostragem O(1))
+    """
+    if grid is None or grid.width * grid.height > EXACT_ESCAPE_MAX_CELLS:
+        return None
+    return DistanceField(grid)
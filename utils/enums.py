@@ -3,7 +3,7 @@ Enumerações utilizadas no Snake Game
 Princípio KISS: Definições simples e claras
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Tuple
 
 class Direction(Enum):
@@ -47,3 +47,15 @@ class EntityType(Enum):
     FOOD_MIRROR = "food_mirror"
     TRAIL_PARTICLE = "trail_particle"
     EFFECT_PARTICLE = "effect_particle"
+
+class InputAction(IntEnum):
+    """Ações de entrada do jogador (códigos inteiros, sem comparar strings)"""
+    QUIT = 0
+    PAUSE = 1
+    TURBO = 2
+    AUTOPILOT = 3
+    RESTART = 4
+    MOVE_UP = 5
+    MOVE_DOWN = 6
+    MOVE_LEFT = 7
+    MOVE_RIGHT = 8
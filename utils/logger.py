@@ -0,0 +1,154 @@
+"""
+Logger com níveis e saída bufferizada
+Substitui os print() espalhados pelo loop: as mensagens passam pelo
+logging padrão, respeitam Debug.LOG_LEVEL e, no modo gráfico, são
+escritas por uma thread separada, então um terminal lento nunca trava o jogo
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from config.settings import Debug
+
+LOGGER_NAME: str = "snake"
+QUIET_LOGGER_NAME: str = f"{LOGGER_NAME}.quiet"
+
+# Acima de CRITICAL: nenhum nível passa, isEnabledFor() é sempre falso
+_SILENT_LEVEL: int = logging.CRITICAL + 1
+
+_configured: bool = False
+_background: Optional['_BackgroundHandler'] = None
+
+class _BackgroundHandler(QueueHandler):
+    """
+    Enfileira as mensagens para uma thread que as escreve no handler final
+    
+    A thread só é iniciada na primeira mensagem emitida, e de novo num
+    processo filho criado por fork (que herda a fila mas não a thread):
+    importar módulos ou criar loggers nunca inicia threads.
+    """
+    
+    def __init__(self, target: logging.Handler):
+        """
+        Inicializa o handler sem iniciar a thread
+        
+        Args:
+            target: Handler que faz a escrita de fato
+        """
+        super().__init__(queue.SimpleQueue())
+        self._target = target
+        self._listener: Optional[QueueListener] = None
+        self._pid: Optional[int] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enfileira a mensagem, iniciando a thread de saída se preciso
+        
+        Args:
+            record: Registro a escrever
+        """
+        if self._pid != os.getpid():
+            self._start()
+        super().emit(record)
+    
+    def _start(self) -> None:
+        """Inicia a thread de saída neste processo, com uma fila nova"""
+        self.queue = queue.SimpleQueue()
+        self._listener = QueueListener(self.queue, self._target)
+        self._listener.start()
+        self._pid = os.getpid()
+    
+    def flush(self) -> None:
+        """Bloqueia até todas as mensagens enfileiradas serem escritas"""
+        if self._pid == os.getpid():
+            self._listener.stop()
+            self._listener.start()
+    
+    def close(self) -> None:
+        """Escreve as mensagens pendentes e encerra a thread de saída"""
+        if self._pid == os.getpid():
+            self._listener.stop()
+        self._pid = None
+        super().close()
+
+def _stdout_handler() -> logging.Handler:
+    """Handler de saída padrão com o texto das mensagens sem prefixos"""
+    # O texto já vem pronto com emojis: sem prefixo de nível ou horário
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+def configure_logging(level: str = Debug.LOG_LEVEL) -> None:
+    """
+    Liga o logger raiz do jogo à saída padrão
+    
+    Chamado automaticamente pelo primeiro get_logger(); chamadas seguintes
+    só atualizam o nível. A escrita é direta (sem threads) até o modo
+    gráfico chamar enable_background_logging().
+    
+    Args:
+        level: Nome do nível mínimo (DEBUG, INFO, WARNING, ERROR)
+    """
+    global _configured
+    root = logging.getLogger(LOGGER_NAME)
+    root.setLevel(level.upper())
+    
+    if _configured:
+        return
+    
+    root.handlers[:] = [_stdout_handler()]
+    root.propagate = False
+    logging.getLogger(QUIET_LOGGER_NAME).setLevel(_SILENT_LEVEL)
+    _configured = True
+
+def enable_background_logging() -> None:
+    """
+    Passa a escrever as mensagens numa thread separada (modo gráfico)
+    
+    Um terminal lento deixa de travar o loop do jogo. A thread só é
+    iniciada na primeira mensagem; o modo headless nunca a usa.
+    """
+    global _background
+    if _background is not None:
+        return
+    
+    configure_logging()
+    _background = _BackgroundHandler(_stdout_handler())
+    logging.getLogger(LOGGER_NAME).handlers[:] = [_background]
+    atexit.register(shutdown_logging)
+
+def get_logger(component: str, verbose: bool = True) -> logging.Logger:
+    """
+    Retorna o logger de um componente do jogo
+    
+    Use formatação preguiçosa (logger.info("... %s", valor)): com o nível
+    desligado a mensagem nem chega a ser montada.
+    
+    Args:
+        component: Nome curto do componente ('engine', 'food', ...)
+        verbose: False devolve um logger mudo (modo headless)
+    
+    Returns:
+        Logger sob a hierarquia 'snake'
+    """
+    if not _configured:
+        configure_logging()
+    parent = LOGGER_NAME if verbose else QUIET_LOGGER_NAME
+    return logging.getLogger(f"{parent}.{component}")
+
+def flush_logging() -> None:
+    """Bloqueia até todas as mensagens enfileiradas serem escritas"""
+    if _background is not None:
+        _background.flush()
+
+def shutdown_logging() -> None:
+    """Escreve as mensagens pendentes e volta à escrita direta"""
+    global _background
+    if _background is not None:
+        _background.close()
+        _background = None
+        logging.getLogger(LOGGER_NAME).handlers[:] = [_stdout_handler()]
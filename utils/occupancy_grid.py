@@ -0,0 +1,369 @@
+"""
+Grade de ocupação compacta compartilhada pela arena
+Um byte por célula com flags de cobra, comida e parede
+Princípio DRY: Uma única fonte de verdade para ocupação de células
+"""
+
+import random
+from array import array
+from itertools import chain
+from typing import Iterable, Iterator, Optional
+from utils.types import Position
+from config.settings import GRID_WIDTH, GRID_HEIGHT
+
+# Flags de célula (combináveis com |)
+CELL_EMPTY: int = 0
+CELL_SNAKE: int = 1
+CELL_FOOD: int = 2
+CELL_WALL: int = 4
+
+# Tentativas de sorteio direto antes de recorrer ao índice de livres
+SAMPLE_ATTEMPTS: int = 8
+
+# Índice de livres em dois níveis: contagem por bloco de 64 células e
+# por trecho de 4096 células (64 blocos)
+_BLOCK_SHIFT = 6
+_CHUNK_SHIFT = 12
+_BLOCKS_PER_CHUNK = 1 << (_CHUNK_SHIFT - _BLOCK_SHIFT)
+
+class OccupancyGrid:
+    """
+    Grade de ocupação da arena em um bytearray
+    
+    A grade tem uma borda de uma célula marcada como parede ao redor
+    da área jogável, então a cabeça da cobra que sai do campo cai em
+    uma célula CELL_WALL e a colisão com parede vira uma leitura O(1).
+    A memória é fixa: (largura + 2) x (altura + 2) bytes.
+    
+    Também mantém um índice das células livres em dois níveis (quantas
+    células livres há em cada bloco de 64 células e em cada trecho de 64
+    blocos), atualizado em O(1) por marcação. O sorteio de célula livre
+    depende apenas das células (não do histórico de marcações), então o
+    estado da grade pode ser refeito a partir da cobra e das comidas.
+    """
+    
+    def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+        """
+        Inicializa a grade
+        
+        Args:
+            width: Largura da área jogável em células
+            height: Altura da área jogável em células
+        """
+        self._width = width
+        self._height = height
+        self._stride = width + 2
+        self._cells = bytearray(self._stride * (height + 2))
+        self._block_free = array('i', [0]) * -(-len(self._cells) >> _BLOCK_SHIFT)
+        self._chunk_free = array('i', [0]) * -(-len(self._cells) >> _CHUNK_SHIFT)
+        self._free_count = 0
+        self._build_walls()
+        self._rebuild_free_index()
+        
+        # Estado vazio canônico, copiado por clear() sem laço Python
+        self._blank_cells = bytes(self._cells)
+        self._blank_block_free = array('i', self._block_free)
+        self._blank_chunk_free = array('i', self._chunk_free)
+        self._blank_free_count = self._free_count
+    
+    def _build_walls(self) -> None:
+        """Marca a borda externa da grade como parede"""
+        stride = self._stride
+        last_row = (self._height + 1) * stride
+        
+        for x in range(stride):
+            self._cells[x] = CELL_WALL
+            self._cells[last_row + x] = CELL_WALL
+        
+        for y in range(1, self._height + 1):
+            self._cells[y * stride] = CELL_WALL
+            self._cells[y * stride + stride - 1] = CELL_WALL
+    
+    def _rebuild_free_index(self) -> None:
+        """Reconstrói as contagens de livres a partir do buffer (uma contagem em C por bloco)"""
+        cells = self._cells
+        block_size = 1 << _BLOCK_SHIFT
+        block_free = self._block_free
+        for block in range(len(block_free)):
+            start = block << _BLOCK_SHIFT
+            block_free[block] = cells.count(0, start, start + block_size)
+        
+        chunk_free = self._chunk_free
+        for chunk in range(len(chunk_free)):
+            start = chunk * _BLOCKS_PER_CHUNK
+            chunk_free[chunk] = sum(block_free[start:start + _BLOCKS_PER_CHUNK])
+        
+        self._free_count = sum(chunk_free)
+    
+    @property
+    def width(self) -> int:
+        """Retorna a largura da área jogável"""
+        return self._width
+    
+    @property
+    def height(self) -> int:
+        """Retorna a altura da área jogável"""
+        return self._height
+    
+    @property
+    def stride(self) -> int:
+        """Retorna o número de bytes por linha (largura + borda)"""
+        return self._stride
+    
+    @property
+    def cells(self) -> bytearray:
+        """Retorna o buffer bruto de células (somente leitura; escreva via mark/unmark)"""
+        return self._cells
+    
+    @property
+    def free_count(self) -> int:
+        """Retorna o número de células livres"""
+        return self._free_count
+    
+    def index(self, position: Position) -> int:
+        """
+        Converte posição do grid em índice no buffer
+        
+        Args:
+            position: Posição (x, y) dentro da área jogável ou na borda
+        
+        Returns:
+            Índice linear no buffer
+        """
+        x, y = position
+        return (y + 1) * self._stride + x + 1
+    
+    def position_of(self, index: int) -> Position:
+        """
+        Converte índice do buffer em posição do grid
+        
+        Args:
+            index: Índice linear no buffer
+        
+        Returns:
+            Posição (x, y) correspondente
+        """
+        y, x = divmod(index, self._stride)
+        return (x - 1, y - 1)
+    
+    def get(self, position: Position) -> int:
+        """
+        Retorna as flags da célula
+        
+        Args:
+            position: Posição (x, y)
+        
+        Returns:
+            Flags da célula; posições além da borda contam como parede
+        """
+        x, y = position
+        if -1 <= x <= self._width and -1 <= y <= self._height:
+            return self._cells[(y + 1) * self._stride + x + 1]
+        return CELL_WALL
+    
+    def is_wall(self, position: Position) -> bool:
+        """Verifica se a posição é parede (ou está fora da arena)"""
+        return bool(self.get(position) & CELL_WALL)
+    
+    def is_snake(self, position: Position) -> bool:
+        """Verifica se a posição é ocupada pela cobra"""
+        return bool(self.get(position) & CELL_SNAKE)
+    
+    def is_food(self, position: Position) -> bool:
+        """Verifica se a posição é ocupada por comida"""
+        return bool(self.get(position) & CELL_FOOD)
+    
+    def is_free(self, position: Position) -> bool:
+        """Verifica se a posição está livre (sem cobra, comida ou parede)"""
+        return self.get(position) == CELL_EMPTY
+    
+    def mark_index(self, index: int, flag: int) -> int:
+        """
+        Liga uma flag na célula pelo índice, atualizando o índice de livres
+        
+        Args:
+            index: Índice linear no buffer
+            flag: Flag a ligar
+            
+        Returns:
+            Flags da célula antes da marcação
+        """
+        flags = self._cells[index]
+        if not flags:
+            self._block_free[index >> _BLOCK_SHIFT] -= 1
+            self._chunk_free[index >> _CHUNK_SHIFT] -= 1
+            self._free_count -= 1
+        self._cells[index] = flags | flag
+        return flags
+    
+    def unmark_index(self, index: int, flag: int) -> None:
+        """
+        Desliga uma flag na célula pelo índice, atualizando o índice de livres
+        
+        Args:
+            index: Índice linear no buffer
+            flag: Flag a desligar
+        """
+        previous = self._cells[index]
+        flags = previous & ~flag & 0xFF
+        self._cells[index] = flags
+        if previous and not flags:
+            self._block_free[index >> _BLOCK_SHIFT] += 1
+            self._chunk_free[index >> _CHUNK_SHIFT] += 1
+            self._free_count += 1
+    
+    def set_flag(self, position: Position, flag: int) -> None:
+        """
+        Liga uma flag na célula
+        
+        Args:
+            position: Posição (x, y) dentro da grade
+            flag: Flag a ligar
+        """
+        self.mark_index(self.index(position), flag)
+    
+    def clear_flag(self, position: Position, flag: int) -> None:
+        """
+        Desliga uma flag na célula
+        
+        Args:
+            position: Posição (x, y) dentro da grade
+            flag: Flag a desligar
+        """
+        self.unmark_index(self.index(position), flag)
+    
+    def sample_free(self, rng=random) -> Optional[Position]:
+        """
+        Sorteia uma célula livre com distribuição uniforme
+        
+        Com ao menos metade da arena livre tenta células aleatórias
+        (rejeição, menos de duas tentativas em média); com a arena mais
+        cheia, ou se as tentativas falharem, escolhe a k-ésima livre na
+        ordem do buffer pelas contagens de trechos e blocos. As duas
+        etapas são uniformes e dependem só das células e do gerador.
+        
+        Args:
+            rng: Gerador com randrange (módulo random por padrão)
+            
+        Returns:
+            Posição (x, y) livre ou None se a arena estiver cheia
+        """
+        free_count = self._free_count
+        if not free_count:
+            return None
+        
+        cells = self._cells
+        width = self._width
+        area = width * self._height
+        if 2 * free_count >= area:
+            stride = self._stride
+            for _ in range(SAMPLE_ATTEMPTS):
+                y, x = divmod(rng.randrange(area), width)
+                if not cells[(y + 1) * stride + x + 1]:
+                    return (x, y)
+        
+        k = rng.randrange(free_count)
+        
+        block = 0
+        for chunk, count in enumerate(self._chunk_free):
+            if k < count:
+                block = chunk * _BLOCKS_PER_CHUNK
+                break
+            k -= count
+        
+        block_free = self._block_free
+        while k >= block_free[block]:
+            k -= block_free[block]
+            block += 1
+        
+        # Os k+1 primeiros pedaços entre células livres do bloco somam a
+        # distância até a k-ésima livre
+        start = block << _BLOCK_SHIFT
+        pieces = cells[start:start + (1 << _BLOCK_SHIFT)].split(b'\x00', k + 1)
+        return self.position_of(start + sum(map(len, pieces[:k + 1])) + k)
+    
+    def free_positions(self) -> Iterator[Position]:
+        """
+        Itera sobre todas as células livres da área jogável
+        
+        Returns:
+            Iterador de posições (x, y) livres, na ordem do buffer
+        """
+        cells = self._cells
+        position_of = self.position_of
+        index = cells.find(0)
+        while index >= 0:
+            yield position_of(index)
+            index = cells.find(0, index + 1)
+    
+    def rebuild(self, snake_cells: Iterable[Position], food_cells: Iterable[Position]) -> None:
+        """
+        Refaz a grade a partir da cobra e das comidas
+        
+        Parte da grade vazia (cópias de memória, sem laço Python), marca
+        as células e reconta em C só os blocos tocados: o laço Python é
+        O(cobra + comidas), qualquer que seja a área.
+        
+        Args:
+            snake_cells: Segmentos da cobra (podem repetir ou estar na parede)
+            food_cells: Posições das comidas
+        """
+        self.clear()
+        cells = self._cells
+        stride = self._stride
+        snake_indices = [(y + 1) * stride + x + 1 for x, y in snake_cells]
+        food_indices = [(y + 1) * stride + x + 1 for x, y in food_cells]
+        for index in snake_indices:
+            cells[index] |= CELL_SNAKE
+        for index in food_indices:
+            cells[index] |= CELL_FOOD
+        
+        block_free = self._block_free
+        chunk_free = self._chunk_free
+        block_size = 1 << _BLOCK_SHIFT
+        for block in {index >> _BLOCK_SHIFT for index in chain(snake_indices, food_indices)}:
+            start = block << _BLOCK_SHIFT
+            delta = cells.count(0, start, start + block_size) - block_free[block]
+            block_free[block] += delta
+            chunk_free[start >> _CHUNK_SHIFT] += delta
+            self._free_count += delta
+    
+    def copy(self) -> 'OccupancyGrid':
+        """
+        Cria uma grade independente com as mesmas células e índice de livres
+        
+        Copia os buffers diretamente (sem refazer paredes nem recontar
+        livres); o estado vazio, imutável, é compartilhado.
+        
+        Returns:
+            Nova grade do mesmo tamanho
+        """
+        clone = OccupancyGrid.__new__(OccupancyGrid)
+        clone.__dict__.update(self.__dict__)
+        clone._cells = bytearray(self._cells)
+        clone._block_free = array('i', self._block_free)
+        clone._chunk_free = array('i', self._chunk_free)
+        return clone
+    
+    def copy_from(self, other: 'OccupancyGrid') -> None:
+        """
+        Copia células e índice de livres de outra grade do mesmo tamanho
+        
+        Args:
+            other: Grade de origem
+        """
+        self._cells[:] = other._cells
+        self._block_free[:] = other._block_free
+        self._chunk_free[:] = other._chunk_free
+        self._free_count = other._free_count
+    
+    def clear(self) -> None:
+        """Limpa cobra e comida, mantendo apenas as paredes"""
+        self._cells[:] = self._blank_cells
+        self._block_free[:] = self._blank_block_free
+        self._chunk_free[:] = self._blank_chunk_free
+        self._free_count = self._blank_free_count
+    
+    def __repr__(self) -> str:
+        """Representação em string da grade"""
+        return f"OccupancyGrid(width={self._width}, height={self._height})"
@@ -3,7 +3,7 @@ Type hints personalizados para o Snake Game
 Melhora a legibilidade e type safety
 """
 
-from typing import Tuple, List, Callable, Optional, Protocol
+from typing import Tuple, List, Callable, Optional, Protocol, Iterator
 import pygame
 
 # =============================================================================
@@ -56,6 +56,20 @@ class Movable(Protocol):
         """Posição atual do objeto"""
         ...
 
+class BodyView(Protocol):
+    """Protocol para visões somente leitura do corpo da cobra"""
+    def __contains__(self, position: object) -> bool:
+        """Verifica se a posição pertence ao corpo"""
+        ...
+    
+    def __iter__(self) -> Iterator[Position]:
+        """Itera sobre os segmentos, da cabeça para a cauda"""
+        ...
+    
+    def __len__(self) -> int:
+        """Número de segmentos"""
+        ...
+
 # =============================================================================
 # TIPOS COMPOSTOS
 # =============================================================================